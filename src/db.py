@@ -1,29 +1,285 @@
 import sqlite3
 from datetime import datetime, timedelta
 import pandas as pd
+import functools
+import itertools
 import json
+import math
 import os
+import queue
+import re
+import threading
+import time
+from contextlib import contextmanager
+from urllib.request import pathname2url
 import report
 
 
+_SIZE_NAMES = ("B", "KB", "MB", "GB")
+
+# Compact encoder for the full_metadata column: no padding after separators
+# and no per-call circular-reference bookkeeping.
+_JSON_ENCODE = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False, check_circular=False).encode
+
+# format_timestamp fast path: the "YYYY-MM-DD[T ]HH:MM" prefix of stored
+# timestamps, with names as ``%b``/``%I``/``%p`` render them in the C locale.
+# Days past 28 are left to datetime, which knows the month lengths.
+_ISO_PREFIX = re.compile(r"(\d{4})-(0[1-9]|1[0-2])-(0[1-9]|1\d|2[0-8])[T ]([01]\d|2[0-3]):([0-5]\d)", re.ASCII)
+_MONTH_ABBR = {f"{m:02d}": name for m, name in enumerate(
+    ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"), start=1)}
+_HOUR_12 = {f"{h:02d}": (f"{h % 12 or 12:02d}", "AM" if h < 12 else "PM") for h in range(24)}
+
+# Every order ends on id, so tied rows keep the same order across LIMIT/OFFSET
+# pages. The id runs the same direction as the sort key, which lets SQLite walk
+# the column's index (it carries the rowid) instead of sorting.
+_SORT_CLAUSES = {
+    "Date (Newest)": " ORDER BY extracted_at DESC, id DESC",
+    "Date (Oldest)": " ORDER BY extracted_at ASC, id ASC",
+    "Name (A-Z)": " ORDER BY file_name ASC, id ASC",
+    "Name (Z-A)": " ORDER BY file_name DESC, id DESC",
+    "Size (Largest)": " ORDER BY file_size_bytes DESC, id DESC",
+    "Size (Smallest)": " ORDER BY file_size_bytes ASC, id ASC",
+}
+_DEFAULT_SORT_CLAUSE = " ORDER BY id DESC"
+
+# Lower bound on extracted_at for each History date filter. "All Time" and
+# unknown values have no entry and apply no bound.
+_DATE_BUCKETS = {
+    "Today": lambda now: now.replace(hour=0, minute=0, second=0, microsecond=0),
+    "This Week": lambda now: (now - timedelta(days=now.weekday())).replace(hour=0, minute=0, second=0, microsecond=0),
+    "This Month": lambda now: now.replace(day=1, hour=0, minute=0, second=0, microsecond=0),
+    "Last 30 Days": lambda now: now - timedelta(days=30),
+}
+
+
+def _iso(ts):
+    """Format an epoch timestamp as a local ISO-8601 string with microseconds.
+    
+    Equivalent to ``datetime.fromtimestamp(ts).isoformat(timespec="microseconds")``
+    without allocating a datetime object.
+    
+    Args:
+        ts (float): Seconds since the epoch.
+        
+    Returns:
+        str: Timestamp such as '2024-01-01T10:00:00.000000'.
+    """
+    frac, seconds = math.modf(ts)
+    micros = round(frac * 1e6)
+    if micros >= 1_000_000:
+        seconds, micros = seconds + 1, micros - 1_000_000
+    elif micros < 0:
+        seconds, micros = seconds - 1, micros + 1_000_000
+    tm = time.localtime(seconds)
+    return "%04d-%02d-%02dT%02d:%02d:%02d.%06d" % (tm.tm_year, tm.tm_mon, tm.tm_mday, tm.tm_hour, tm.tm_min, tm.tm_sec, micros)
+
+EXPORT_COLUMNS = [
+    "ID",
+    "File Path",
+    "File Name",
+    "File Size",
+    "File Type",
+    "Extracted At",
+    "Modified On",
+    "Full Metadata",
+]
+
+
 class MetadataDatabase:
     """Object-oriented wrapper around SQLite metadata storage."""
 
-    def __init__(self, db_path: str = "file_metadata.db", reporter=report) -> None:
+    # Per-connection tuning applied on every open. journal_mode=WAL is
+    # persistent and is set once in _ensure_tables.
+    CONNECTION_PRAGMAS = (
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-64000",
+        "PRAGMA mmap_size=268435456",
+        "PRAGMA busy_timeout=5000",
+    )
+
+    # Columns returned for a full record. Listed explicitly so rows keep their
+    # historical 8-column shape regardless of columns added by migrations.
+    ROW_COLUMNS = "id, file_path, file_name, file_size_formatted, file_type, extracted_at, modified_on, full_metadata"
+    # Same record without the full_metadata JSON, which is the widest column.
+    LITE_COLUMNS = "id, file_path, file_name, file_size_formatted, file_type, extracted_at, modified_on"
+    # Lite record with both timestamps already formatted by format_timestamp.
+    DISPLAY_COLUMNS = "id, file_path, file_name, file_size_formatted, file_type, extracted_at_display, modified_on_display"
+
+    INSERT_SQL = """
+        INSERT INTO metadata (file_path, file_name, file_size_formatted, file_type, extracted_at, modified_on, full_metadata,
+                              file_size_bytes, extracted_at_display, modified_on_display)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    UPDATE_METADATA_SQL = "UPDATE metadata SET full_metadata = ? WHERE id = ?"
+    # Per-connection prepared-statement cache; the filter query templates alone
+    # can occupy up to 64 entries (see _build_filter_query).
+    CACHED_STATEMENTS = 256
+    INSERT_BATCH_SIZE = 10000
+    # Stay under SQLite's default host-parameter limit for IN (...) lists.
+    MAX_IN_PARAMS = 900
+
+    # Cover the lookups used by fetch_latest_by_path and the filter/sort
+    # options of filter_and_search_data. idx_meta_path_cover carries the
+    # summary columns so fetch_latest_summary_by_path never touches the table;
+    # it supersedes the narrower idx_meta_path from earlier versions.
+    INDEXES = (
+        "DROP INDEX IF EXISTS idx_meta_path",
+        "CREATE INDEX IF NOT EXISTS idx_meta_path_cover ON metadata(file_path, id DESC, file_size_formatted, file_type, extracted_at, modified_on)",
+        "CREATE INDEX IF NOT EXISTS idx_meta_type_date ON metadata(file_type, extracted_at DESC)",
+        "CREATE INDEX IF NOT EXISTS idx_meta_extracted ON metadata(extracted_at DESC)",
+        "CREATE INDEX IF NOT EXISTS idx_meta_name ON metadata(file_name)",
+        "CREATE INDEX IF NOT EXISTS idx_meta_size ON metadata(file_size_bytes)",
+    )
+
+    def __init__(self, db_path: str = "file_metadata.db", reporter=report, read_pool_size: int | None = None) -> None:
         self.db_path = db_path
         self.reporter = reporter
+        self._writer = None
+        self._closed_changes = 0
+        self._commits = 0  # Write transactions committed through the writer
+        self._lock = threading.RLock()
+        self._tx_depth = 0  # Nesting level of transaction() blocks, guarded by _lock
+        self._readers = queue.LifoQueue()
+        self._reader_count = 0
+        self._read_pool_size = max(1, read_pool_size or os.cpu_count() or 1)
+        self._pool_lock = threading.Lock()
         self._ensure_tables()
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
-    def _connect(self):
+    def _connect(self, read_only: bool = False):
         """Open a connection to the SQLite database.
         
+        Args:
+            read_only (bool): Open the file with ``mode=ro`` (default: False).
+            
         Returns:
             sqlite3.Connection: Database connection object.
         """
-        return sqlite3.connect(self.db_path)
+        if read_only:
+            uri = f"file:{pathname2url(os.path.abspath(self.db_path))}?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False, cached_statements=self.CACHED_STATEMENTS)
+        else:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=self.CACHED_STATEMENTS)
+        for pragma in self.CONNECTION_PRAGMAS:
+            try:
+                conn.execute(pragma)
+            except sqlite3.DatabaseError:
+                pass
+        return conn
+
+    def _get_writer(self):
+        """Return the shared read-write connection, opening it on first use.
+
+        All mutations go through this single connection so the page cache
+        stays warm between writes. Callers must hold ``self._lock`` while
+        using it.
+
+        Returns:
+            sqlite3.Connection: Shared read-write connection object.
+        """
+        if self._writer is None:
+            self._writer = self._connect()
+        return self._writer
+
+    @property
+    def write_version(self) -> int:
+        """Running count of rows changed and commits made through this manager's writer.
+
+        Reading it costs no query, so callers that cache query results can
+        compare it against the value seen at fetch time to detect writes.
+        It also moves when a write commits, so a result read while a write
+        was still uncommitted is never stamped with the final value.
+
+        Returns:
+            int: Monotonically increasing change counter.
+        """
+        writer = self._writer
+        return self._closed_changes + self._commits + (writer.total_changes if writer is not None else 0)
+
+    @contextmanager
+    def _read_conn(self):
+        """Borrow a read-only connection from the pool.
+
+        WAL mode allows these to run in parallel with each other and with the
+        writer. Readers are opened lazily up to ``read_pool_size``; callers
+        beyond that wait for one to be returned. In-memory databases cannot be
+        shared between connections, so they fall back to the writer.
+
+        Yields:
+            sqlite3.Connection: Read-only database connection.
+        """
+        if self.db_path == ":memory:":
+            with self._lock:
+                yield self._get_writer()
+            return
+
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            with self._pool_lock:
+                can_open = self._reader_count < self._read_pool_size
+                if can_open:
+                    self._reader_count += 1
+            if can_open:
+                try:
+                    conn = self._connect(read_only=True)
+                except Exception:
+                    with self._pool_lock:
+                        self._reader_count -= 1
+                    raise
+            else:
+                conn = self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+
+    def close(self) -> None:
+        """Close the writer and every pooled reader connection."""
+        with self._lock:
+            if self._writer is not None:
+                self._closed_changes += self._writer.total_changes
+                self._writer.close()
+                self._writer = None
+        with self._pool_lock:
+            while True:
+                try:
+                    self._readers.get_nowait().close()
+                except queue.Empty:
+                    break
+                self._reader_count -= 1
+
+    @contextmanager
+    def _write_conn(self, conn=None):
+        """Yield a writer connection, joining the caller's transaction if given.
+        
+        Args:
+            conn (sqlite3.Connection | None): Connection from ``transaction()``.
+                When provided, committing is left to that transaction.
+            
+        Yields:
+            sqlite3.Connection: Writer connection.
+        """
+        if conn is not None:
+            with self._lock:
+                yield conn
+        else:
+            with self.transaction() as conn:
+                yield conn
+
+    def _check_no_transaction(self, operation: str) -> None:
+        """Refuse ``operation``, which commits on its own, inside ``transaction()``.
+        
+        Callers must hold ``self._lock``.
+        
+        Args:
+            operation (str): Name used in the error message.
+        """
+        if self._tx_depth:
+            raise RuntimeError(f"{operation} cannot run inside an open transaction()")
 
     def _ensure_tables(self) -> None:
         """Create the metadata table if it doesn't already exist.
@@ -37,28 +293,169 @@ class MetadataDatabase:
             - extracted_at: Timestamp of extraction
             - modified_on: Last modification time of the source file
             - full_metadata: JSON string of complete metadata
+            - file_size_bytes: Raw file size used for numeric sorting
+            - extracted_at_display / modified_on_display: Timestamps as shown in History
+        
+        Databases created before ``file_size_bytes`` or the display columns
+        existed are migrated in place. Also creates the ``INDEXES`` used by the lookup and filter queries
+        and the trigger-maintained ``metadata_type_counts`` table.
         """
-        with self._connect() as conn:
+        with self._lock, self._get_writer() as conn:
             cursor = conn.cursor()
+            try:
+                # WAL lets readers proceed while a write is in progress and
+                # avoids a full fsync per commit. Not available for :memory:.
+                # Must run before any statement opens a transaction.
+                cursor.execute("PRAGMA journal_mode=WAL")
+            except sqlite3.DatabaseError:
+                pass
+            self._create_schema(cursor)
+            conn.commit()
+
+    def _create_schema(self, cursor) -> None:
+        """Create or migrate the metadata table, its indexes and counters.
+        
+        Runs on the caller's cursor so it can take part in an open transaction.
+        
+        Args:
+            cursor (sqlite3.Cursor): Cursor on the writer connection.
+        """
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS metadata (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                file_path TEXT NOT NULL,
+                file_name TEXT NOT NULL,
+                file_size_formatted TEXT,
+                file_type TEXT,
+                extracted_at TEXT NOT NULL,
+                modified_on TEXT,
+                full_metadata TEXT NOT NULL,
+                file_size_bytes INTEGER,
+                extracted_at_display TEXT,
+                modified_on_display TEXT
+            )
+            """
+        )
+        columns = {row[1] for row in cursor.execute("PRAGMA table_info(metadata)")}
+        if "file_size_bytes" not in columns:
+            cursor.execute("ALTER TABLE metadata ADD COLUMN file_size_bytes INTEGER")
+            existing = cursor.execute("SELECT id, file_size_formatted FROM metadata").fetchall()
+            cursor.executemany(
+                "UPDATE metadata SET file_size_bytes = ? WHERE id = ?",
+                [(self.parse_file_size(formatted), record_id) for record_id, formatted in existing],
+            )
+        if "extracted_at_display" not in columns:
+            cursor.execute("ALTER TABLE metadata ADD COLUMN extracted_at_display TEXT")
+            cursor.execute("ALTER TABLE metadata ADD COLUMN modified_on_display TEXT")
+            existing = cursor.execute("SELECT id, extracted_at, modified_on FROM metadata").fetchall()
+            cursor.executemany(
+                "UPDATE metadata SET extracted_at_display = ?, modified_on_display = ? WHERE id = ?",
+                [(self.format_timestamp(extracted), self.format_timestamp(modified), record_id)
+                 for record_id, extracted, modified in existing],
+            )
+        for index_sql in self.INDEXES:
+            cursor.execute(index_sql)
+        self._ensure_type_counts(cursor)
+
+    @staticmethod
+    def _ensure_type_counts(cursor) -> None:
+        """Create the per-file-type counter table and the triggers that maintain it.
+        
+        ``metadata_type_counts`` holds one row per file type so
+        ``get_database_stats`` reads a handful of rows instead of grouping the
+        whole metadata table. It is backfilled the first time it is created.
+        
+        Args:
+            cursor (sqlite3.Cursor): Cursor on the writer connection.
+        """
+        exists = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='metadata_type_counts'"
+        ).fetchone()
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS metadata_type_counts (
+                file_type TEXT PRIMARY KEY,
+                cnt INTEGER NOT NULL
+            )
+            """
+        )
+        cursor.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_meta_count_insert AFTER INSERT ON metadata
+            BEGIN
+                INSERT INTO metadata_type_counts (file_type, cnt) VALUES (IFNULL(NEW.file_type, ''), 1)
+                ON CONFLICT(file_type) DO UPDATE SET cnt = cnt + 1;
+            END
+            """
+        )
+        cursor.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_meta_count_delete AFTER DELETE ON metadata
+            BEGIN
+                UPDATE metadata_type_counts SET cnt = cnt - 1 WHERE file_type = IFNULL(OLD.file_type, '');
+                DELETE FROM metadata_type_counts WHERE cnt <= 0;
+            END
+            """
+        )
+        cursor.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_meta_count_update AFTER UPDATE OF file_type ON metadata
+            WHEN IFNULL(OLD.file_type, '') <> IFNULL(NEW.file_type, '')
+            BEGIN
+                UPDATE metadata_type_counts SET cnt = cnt - 1 WHERE file_type = IFNULL(OLD.file_type, '');
+                DELETE FROM metadata_type_counts WHERE cnt <= 0;
+                INSERT INTO metadata_type_counts (file_type, cnt) VALUES (IFNULL(NEW.file_type, ''), 1)
+                ON CONFLICT(file_type) DO UPDATE SET cnt = cnt + 1;
+            END
+            """
+        )
+        if not exists:
             cursor.execute(
                 """
-                CREATE TABLE IF NOT EXISTS metadata (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    file_path TEXT NOT NULL,
-                    file_name TEXT NOT NULL,
-                    file_size_formatted TEXT,
-                    file_type TEXT,
-                    extracted_at TEXT NOT NULL,
-                    modified_on TEXT,
-                    full_metadata TEXT NOT NULL
-                )
+                INSERT INTO metadata_type_counts (file_type, cnt)
+                SELECT IFNULL(file_type, ''), COUNT(*) FROM metadata GROUP BY IFNULL(file_type, '')
                 """
             )
-            conn.commit()
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
+    @contextmanager
+    def transaction(self):
+        """Group several writes into one transaction and a single commit.
+        
+        Pass the yielded connection as ``conn`` to ``insert_metadata``,
+        ``insert_metadata_many``, ``delete_record`` or ``save_edited_metadata``.
+        Everything is committed when the block exits and rolled back if it
+        raises. Other writers wait until the block finishes. Writes made in
+        the block without ``conn``, and nested ``transaction()`` blocks, join
+        the open transaction instead of committing it early.
+        
+        Yields:
+            sqlite3.Connection: Writer connection holding the open transaction.
+        """
+        with self._lock:
+            conn = self._get_writer()
+            if self._tx_depth:
+                self._tx_depth += 1
+                try:
+                    yield conn
+                finally:
+                    self._tx_depth -= 1
+                return
+
+            self._tx_depth = 1
+            try:
+                yield conn
+                conn.commit()
+                self._commits += 1
+            except BaseException:
+                conn.rollback()
+                raise
+            finally:
+                self._tx_depth = 0
+
     @staticmethod
     def format_file_size(size_bytes):
         """Convert file size in bytes to human-readable format.
@@ -71,54 +468,127 @@ class MetadataDatabase:
         """
         if size_bytes == 0:
             return "0 B"
-        size_names = ["B", "KB", "MB", "GB"]
-        i = 0
-        while size_bytes >= 1024 and i < len(size_names) - 1:
-            size_bytes /= 1024.0
-            i += 1
-        return f"{size_bytes:.2f} {size_names[i]}"
-
-    def insert_metadata(self, file_path, metadata):
-        """Insert metadata record for a file into the database.
+        # Each unit is 2**10 of the previous one, so the unit index is the
+        # bit length divided by ten.
+        i = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_NAMES) - 1) if size_bytes >= 1 else 0
+        return f"{size_bytes / (1 << (10 * i)):.2f} {_SIZE_NAMES[i]}"
+
+    @staticmethod
+    def parse_file_size(size_text):
+        """Convert a ``format_file_size`` string back to an approximate byte count.
         
         Args:
-            file_path (str): Path to the file to extract metadata from.
+            size_text (str): Human-readable size such as '1.50 MB'.
+            
+        Returns:
+            int | None: Size in bytes, or None if the text cannot be parsed.
+        """
+        try:
+            number, unit = str(size_text).split()
+            return int(float(number) * (1 << (10 * _SIZE_NAMES.index(unit.upper()))))
+        except (AttributeError, ValueError):
+            return None
+
+    @staticmethod
+    def format_timestamp(dt_str):
+        """Format a stored ISO timestamp for display, e.g. ``Jan 05, 2024 03:07 PM``.
+        
+        Args:
+            dt_str (str): ISO-8601 timestamp as stored in ``extracted_at``/``modified_on``.
+            
+        Returns:
+            str: Display string; '' for empty values and the input unchanged
+            if it cannot be parsed.
+        """
+        if not dt_str:
+            return ""
+        # Stored timestamps share a fixed layout, so most skip datetime entirely
+        match = _ISO_PREFIX.match(dt_str) if isinstance(dt_str, str) else None
+        if match:
+            year, month, day, hour, minute = match.groups()
+            hour_12, am_pm = _HOUR_12[hour]
+            return f"{_MONTH_ABBR[month]} {day}, {year} {hour_12}:{minute} {am_pm}"
+        try:
+            return datetime.fromisoformat(dt_str).strftime("%b %d, %Y %I:%M %p")
+        except Exception:
+            return dt_str
+
+    def _build_insert_row(self, file_path, metadata):
+        """Compute the column values stored for a newly extracted file.
+        
+        Args:
+            file_path (str): Path to the file the metadata was extracted from.
             metadata (dict): Dictionary containing the extracted metadata.
             
         Returns:
-            tuple: Database row for the newly inserted record.
+            tuple: Values in ``INSERT_SQL`` column order; the first seven form
+            the stored record, the rest (``file_size_bytes`` and the display
+            timestamps) are not part of it.
         """
         file_name = os.path.basename(file_path)
-        file_size = os.path.getsize(file_path) if os.path.exists(file_path) else None
+        try:
+            st = os.stat(file_path)
+            file_size, mtime = st.st_size, st.st_mtime
+        except (OSError, ValueError):
+            file_size = mtime = None
         file_size_formatted = self.format_file_size(file_size) if file_size else "Unknown"
         file_type = os.path.splitext(file_name)[1][1:].lower() if "." in file_name else ""
+        mod_time = _iso(mtime) if mtime is not None else None
+        extracted_at = _iso(time.time())
+
+        return (
+            file_path,
+            file_name,
+            file_size_formatted,
+            file_type,
+            extracted_at,
+            mod_time,
+            _JSON_ENCODE(metadata),
+            file_size,
+            self.format_timestamp(extracted_at),
+            self.format_timestamp(mod_time),
+        )
 
-        try:
-            mod_time = datetime.fromtimestamp(os.path.getmtime(file_path)).isoformat() if os.path.exists(file_path) else None
-        except Exception:
-            mod_time = None
+    def insert_metadata(self, file_path, metadata, conn=None):
+        """Insert metadata record for a file into the database.
+        
+        Args:
+            file_path (str): Path to the file to extract metadata from.
+            metadata (dict): Dictionary containing the extracted metadata.
+            conn (sqlite3.Connection, optional): Connection from ``transaction()``.
+            
+        Returns:
+            tuple: Database row for the newly inserted record.
+        """
+        rows = self.insert_metadata_many([(file_path, metadata)], conn=conn)
+        return rows[0] if rows else None
 
-        with self._connect() as conn:
+    def insert_metadata_many(self, items, conn=None):
+        """Insert metadata records for many files in a single transaction.
+        
+        Rows are written with ``executemany`` in groups of ``INSERT_BATCH_SIZE``
+        and committed once, so N files cost one commit instead of N.
+        
+        Args:
+            items (Iterable[tuple[str, dict]]): ``(file_path, metadata)`` pairs.
+            conn (sqlite3.Connection, optional): Connection from ``transaction()``.
+            
+        Returns:
+            list: Database rows for the newly inserted records, in input order.
+        """
+        rows = [self._build_insert_row(file_path, metadata) for file_path, metadata in items]
+        if not rows:
+            return []
+
+        with self._write_conn(conn) as conn:
             cursor = conn.cursor()
-            cursor.execute(
-                """
-                INSERT INTO metadata (file_path, file_name, file_size_formatted, file_type, extracted_at, modified_on, full_metadata)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    file_path,
-                    file_name,
-                    file_size_formatted,
-                    file_type,
-                    datetime.now().isoformat(),
-                    mod_time,
-                    json.dumps(metadata),
-                ),
-            )
-            conn.commit()
-            record_id = cursor.lastrowid
-            cursor.execute("SELECT * FROM metadata WHERE id=?", (record_id,))
-            return cursor.fetchone()
+            for start in range(0, len(rows), self.INSERT_BATCH_SIZE):
+                cursor.executemany(self.INSERT_SQL, rows[start:start + self.INSERT_BATCH_SIZE])
+            # A single writer inside one transaction gets consecutive ids, so
+            # the stored rows can be rebuilt locally without a SELECT.
+            last_id = cursor.execute("SELECT last_insert_rowid()").fetchone()[0]
+        first_id = last_id - len(rows) + 1
+        return [(first_id + offset, *row[:7]) for offset, row in enumerate(rows)]
 
     def fetch_metadata_by_id(self, record_id):
         """Retrieve a metadata record by its database ID.
@@ -129,9 +599,9 @@ class MetadataDatabase:
         Returns:
             tuple: Database row with all metadata fields, or None if not found.
         """
-        with self._connect() as conn:
+        with self._read_conn() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM metadata WHERE id=?", (record_id,))
+            cursor.execute(f"SELECT {self.ROW_COLUMNS} FROM metadata WHERE id=?", (record_id,))
             return cursor.fetchone()
 
     def fetch_all_metadata(self):
@@ -140,11 +610,35 @@ class MetadataDatabase:
         Returns:
             list: List of tuples, each containing a complete metadata record.
         """
-        with self._connect() as conn:
+        with self._read_conn() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM metadata")
+            cursor.execute(f"SELECT {self.ROW_COLUMNS} FROM metadata")
             return cursor.fetchall()
 
+    def iter_all_metadata(self, chunk: int = 1000, include_json: bool = True):
+        """Stream all metadata records without materializing the full table.
+        
+        Rows are pulled from the cursor ``chunk`` at a time, so memory use
+        stays constant regardless of database size. A pooled reader is held
+        until the iterator is exhausted or closed.
+        
+        Args:
+            chunk (int): Number of rows fetched per round-trip (default: 1000).
+            include_json (bool): Include the full_metadata column (default: True).
+            
+        Yields:
+            tuple: A metadata record; 7 columns when ``include_json`` is False.
+        """
+        columns = self.ROW_COLUMNS if include_json else self.LITE_COLUMNS
+        with self._read_conn() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"SELECT {columns} FROM metadata")
+            while True:
+                rows = cursor.fetchmany(chunk)
+                if not rows:
+                    break
+                yield from rows
+
     def fetch_latest_by_path(self, path: str):
         """Retrieve the most recent metadata record for a given file path.
         
@@ -154,18 +648,94 @@ class MetadataDatabase:
         Returns:
             tuple: Most recent metadata record for the file, or None if not found.
         """
-        with self._connect() as conn:
+        with self._read_conn() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM metadata WHERE file_path = ? ORDER BY id DESC LIMIT 1", (path,))
+            cursor.execute(f"SELECT {self.ROW_COLUMNS} FROM metadata WHERE file_path = ? ORDER BY id DESC LIMIT 1", (path,))
+            return cursor.fetchone()
+
+    def fetch_latest_summary_by_path(self, path: str):
+        """Retrieve display fields of the most recent record for a file path.
+        
+        Served entirely from the ``idx_meta_path_cover`` index, so the
+        full_metadata payload is never read.
+        
+        Args:
+            path (str): File path to search for.
+            
+        Returns:
+            tuple: (id, file_size_formatted, file_type, extracted_at, modified_on),
+                   or None if not found.
+        """
+        with self._read_conn() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT id, file_size_formatted, file_type, extracted_at, modified_on FROM metadata "
+                "WHERE file_path = ? ORDER BY id DESC LIMIT 1",
+                (path,),
+            )
             return cursor.fetchone()
 
+    def fetch_latest_ids_by_paths(self, paths):
+        """Map file paths to the ID of their most recent record in one query.
+        
+        Args:
+            paths (Iterable[str]): File paths to look up.
+            
+        Returns:
+            dict: ``{file_path: record_id}`` for paths that have a record.
+        """
+        paths = list(dict.fromkeys(paths))
+        latest_ids = {}
+        with self._read_conn() as conn:
+            cursor = conn.cursor()
+            for start in range(0, len(paths), self.MAX_IN_PARAMS):
+                chunk = paths[start:start + self.MAX_IN_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                cursor.execute(
+                    f"SELECT file_path, MAX(id) FROM metadata WHERE file_path IN ({placeholders}) GROUP BY file_path",
+                    chunk,
+                )
+                latest_ids.update(cursor.fetchall())
+        return latest_ids
+
+    def explain_query_plan(self, query: str, params=()):
+        """Return SQLite's query plan for a statement (development helper).
+        
+        Args:
+            query (str): SQL statement to explain.
+            params (Sequence): Parameters bound to the statement.
+            
+        Returns:
+            list: Plan detail strings, e.g. 'SEARCH metadata USING COVERING INDEX ...'.
+        """
+        with self._read_conn() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"EXPLAIN QUERY PLAN {query}", params)
+            return [row[-1] for row in cursor.fetchall()]
+
+    def fetch_all_metadata_lite(self, include_json: bool = False):
+        """Retrieve all metadata records, skipping the full_metadata JSON by default.
+        
+        Args:
+            include_json (bool): Include the full_metadata column (default: False).
+            
+        Returns:
+            list: Record tuples; the first 7 columns of ``fetch_all_metadata``
+                  rows unless ``include_json`` is True.
+        """
+        columns = self.ROW_COLUMNS if include_json else self.LITE_COLUMNS
+        with self._read_conn() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"SELECT {columns} FROM metadata")
+            return cursor.fetchall()
+
     def fetch_all_metadata_formatted(self):
         """Retrieve formatted metadata (without full_metadata JSON) for all records.
         
         Returns:
             list: List of tuples with select columns for display/export.
         """
-        with self._connect() as conn:
+        with self._read_conn() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT id, file_path, file_name, file_size_formatted, file_type, extracted_at FROM metadata")
             return cursor.fetchall()
@@ -179,10 +749,10 @@ class MetadataDatabase:
         Returns:
             list: List of metadata records sorted by extraction time (newest first).
         """
-        with self._connect() as conn:
+        with self._read_conn() as conn:
             cursor = conn.cursor()
             cursor.execute(
-                "SELECT * FROM metadata ORDER BY extracted_at DESC, id DESC LIMIT ?",
+                f"SELECT {self.ROW_COLUMNS} FROM metadata ORDER BY extracted_at DESC, id DESC LIMIT ?",
                 (limit,),
             )
             return cursor.fetchall()
@@ -190,53 +760,68 @@ class MetadataDatabase:
     def get_database_stats(self):
         """Calculate statistics about metadata records in the database.
         
+        Reads the trigger-maintained ``metadata_type_counts`` table, so the cost
+        does not grow with the number of records.
+        
         Returns:
             dict: Dictionary with 'total_records' count and 'file_types' breakdown.
         """
-        with self._connect() as conn:
+        with self._read_conn() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM metadata")
-            total_records = cursor.fetchone()[0]
-            cursor.execute("SELECT file_type, COUNT(*) FROM metadata GROUP BY file_type")
-            type_counts = cursor.fetchall()
-        return {"total_records": total_records, "file_types": dict(type_counts)}
+            cursor.execute("SELECT file_type, cnt FROM metadata_type_counts")
+            type_counts = dict(cursor.fetchall())
+        return {"total_records": sum(type_counts.values()), "file_types": type_counts}
 
     def clear_metadata(self):
         """Delete all metadata records from the database.
         
+        The table is dropped and recreated in one transaction rather than
+        deleted row by row (the counter triggers would otherwise fire per row),
+        and the id sequence is reset. The WAL file is truncated afterwards.
+        
         Returns:
             bool: True if deletion succeeded, False if an error occurred.
         """
         try:
-            with self._connect() as conn:
-                cursor = conn.cursor()
-                cursor.execute("DELETE FROM metadata")
-                conn.commit()
+            with self._lock:
+                self._check_no_transaction("clear_metadata")
+                with self._get_writer() as conn:
+                    cursor = conn.cursor()
+                    cursor.execute("BEGIN")
+                    cursor.execute("DROP TABLE IF EXISTS metadata")
+                    cursor.execute("DELETE FROM metadata_type_counts")
+                    cursor.execute("DELETE FROM sqlite_sequence WHERE name='metadata'")
+                    self._create_schema(cursor)
+                    conn.commit()
+                    self._commits += 1
+                    cursor.execute("PRAGMA wal_checkpoint(TRUNCATE)")
             return True
         except Exception as e:
             print(f"Error clearing metadata: {e}")
             return False
 
-    def delete_record(self, record_id):
+    def delete_record(self, record_id, conn=None):
         """Delete a specific metadata record by ID.
         
         Args:
             record_id (int): Database ID of the record to delete.
+            conn (sqlite3.Connection, optional): Connection from ``transaction()``.
             
         Returns:
             bool: True if deletion succeeded, False otherwise.
         """
         try:
-            with self._connect() as conn:
+            with self._write_conn(conn) as conn:
                 cursor = conn.cursor()
                 cursor.execute("DELETE FROM metadata WHERE id=?", (record_id,))
-                conn.commit()
                 return cursor.rowcount > 0
         except Exception as e:
             print(f"Error deleting record: {e}")
             return False
 
-    def filter_and_search_data(self, search_term: str, file_type_filter: str, date_filter: str, sort_option: str):
+    def filter_and_search_data(self, search_term: str, file_type_filter: str, date_filter: str, sort_option: str,
+                               limit: int | None = None, offset: int = 0, include_json: bool = True,
+                               display_times: bool = False):
         """Filter and search metadata records with multiple criteria.
         
         Args:
@@ -244,85 +829,168 @@ class MetadataDatabase:
             file_type_filter (str): File type filter (e.g., 'pdf', 'All').
             date_filter (str): Date range filter ('All Time', 'Today', 'This Week', 'This Month', 'Last 30 Days').
             sort_option (str): Sorting option ('Date (Newest)', 'Name (A-Z)', etc.).
+            limit (int, optional): Return at most this many rows, starting at ``offset``.
+            offset (int): Number of matching rows to skip when ``limit`` is given (default: 0).
+            include_json (bool): Include the full_metadata column (default: True).
+            display_times (bool): Return 7-column rows whose timestamps are the
+                stored display strings instead of ISO values; ignores ``include_json``.
             
         Returns:
             list: Filtered and sorted metadata records matching the criteria.
         """
-        with self._connect() as conn:
+        params, has_term, has_type, has_date = self._filter_params(search_term, file_type_filter, date_filter)
+        if display_times:
+            columns = self.DISPLAY_COLUMNS
+        else:
+            columns = self.ROW_COLUMNS if include_json else self.LITE_COLUMNS
+        paged = limit is not None
+        if paged:
+            params.extend([limit, offset])
+
+        query = self._build_filter_query(has_term, has_type, has_date, sort_option, paged, columns)
+        with self._read_conn() as conn:
             cursor = conn.cursor()
-
-            query = "SELECT * FROM metadata WHERE 1=1"
-            params = []
-
-            term = (search_term or "").strip()
-            if term:
-                query += " AND (file_name LIKE ? OR file_path LIKE ?)"
-                pattern = f"%{term}%"
-                params.extend([pattern, pattern])
-
-            if file_type_filter and file_type_filter != "All":
-                query += " AND file_type = ?"
-                params.append(file_type_filter)
-
-            if date_filter and date_filter != "All Time":
-                now = datetime.now()
-                if date_filter == "Today":
-                    start_date = now.replace(hour=0, minute=0, second=0, microsecond=0)
-                elif date_filter == "This Week":
-                    start_date = now - timedelta(days=now.weekday())
-                    start_date = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
-                elif date_filter == "This Month":
-                    start_date = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-                elif date_filter == "Last 30 Days":
-                    start_date = now - timedelta(days=30)
-                else:
-                    start_date = None
-                if start_date:
-                    query += " AND extracted_at >= ?"
-                    params.append(start_date.isoformat())
-
-            if sort_option == "Date (Newest)":
-                query += " ORDER BY extracted_at DESC"
-            elif sort_option == "Date (Oldest)":
-                query += " ORDER BY extracted_at ASC"
-            elif sort_option == "Name (A-Z)":
-                query += " ORDER BY file_name ASC"
-            elif sort_option == "Name (Z-A)":
-                query += " ORDER BY file_name DESC"
-            elif sort_option == "Size (Largest)":
-                query += " ORDER BY LENGTH(file_size_formatted) DESC, file_size_formatted DESC"
-            elif sort_option == "Size (Smallest)":
-                query += " ORDER BY LENGTH(file_size_formatted) ASC, file_size_formatted ASC"
-
             cursor.execute(query, params)
             return cursor.fetchall()
 
-    def export_data(self, format_type: str, data):
+    def iter_filtered_data(self, search_term: str, file_type_filter: str, date_filter: str, sort_option: str,
+                           chunk: int = 1000, include_json: bool = True):
+        """Stream the records ``filter_and_search_data`` would return.
+        
+        Rows are pulled from the cursor ``chunk`` at a time, like
+        ``iter_all_metadata``.
+        
+        Args:
+            search_term (str): Search term to find in file name or path.
+            file_type_filter (str): File type filter (e.g., 'pdf', 'All').
+            date_filter (str): Date range filter ('All Time', 'Today', 'This Week', 'This Month', 'Last 30 Days').
+            sort_option (str): Sorting option ('Date (Newest)', 'Name (A-Z)', etc.).
+            chunk (int): Number of rows fetched per round-trip (default: 1000).
+            include_json (bool): Include the full_metadata column (default: True).
+            
+        Yields:
+            tuple: A matching metadata record.
+        """
+        params, has_term, has_type, has_date = self._filter_params(search_term, file_type_filter, date_filter)
+        columns = self.ROW_COLUMNS if include_json else self.LITE_COLUMNS
+        query = self._build_filter_query(has_term, has_type, has_date, sort_option, False, columns)
+        with self._read_conn() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            while True:
+                rows = cursor.fetchmany(chunk)
+                if not rows:
+                    break
+                yield from rows
+
+    def count_filtered_data(self, search_term: str, file_type_filter: str, date_filter: str) -> int:
+        """Count the records ``filter_and_search_data`` would return for these filters.
+        
+        Args:
+            search_term (str): Search term to find in file name or path.
+            file_type_filter (str): File type filter (e.g., 'pdf', 'All').
+            date_filter (str): Date range filter ('All Time', 'Today', 'This Week', 'This Month', 'Last 30 Days').
+            
+        Returns:
+            int: Number of matching records.
+        """
+        params, has_term, has_type, has_date = self._filter_params(search_term, file_type_filter, date_filter)
+        query = self._build_filter_query(has_term, has_type, has_date, None, False, "COUNT(*)")
+        with self._read_conn() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            return cursor.fetchone()[0]
+
+    @staticmethod
+    def _filter_params(search_term: str, file_type_filter: str, date_filter: str) -> tuple[list, bool, bool, bool]:
+        """Return ``(params, has_term, has_type, has_date)`` for the History filters."""
+        params = []
+
+        term = (search_term or "").strip()
+        if term:
+            pattern = f"%{term}%"
+            params.extend([pattern, pattern])
+
+        has_type = bool(file_type_filter and file_type_filter != "All")
+        if has_type:
+            params.append(file_type_filter)
+
+        bucket_start = _DATE_BUCKETS.get(date_filter)
+        start_date = bucket_start(datetime.now()) if bucket_start else None
+        if start_date:
+            params.append(start_date.isoformat())
+
+        return params, bool(term), has_type, bool(start_date)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _build_filter_query(has_term: bool, has_type: bool, has_date: bool, sort_option: str | None,
+                            paged: bool = False, columns: str | None = None) -> str:
+        """Build the SQL for one combination of active filters.
+        
+        Only the shape of the query depends on these flags, so the result is
+        cached and the same SQL text is reused across calls. That lets
+        sqlite3's per-connection statement cache skip re-preparing it.
+        
+        Args:
+            has_term (bool): Whether a search term is applied.
+            has_type (bool): Whether a file type filter is applied.
+            has_date (bool): Whether a lower bound on extracted_at is applied.
+            sort_option (str | None): Sorting option ('Date (Newest)', 'Name (A-Z)', etc.);
+                anything else orders newest record first.
+            paged (bool): Append ``LIMIT ? OFFSET ?`` placeholders.
+            columns (str, optional): Select list (default: ``ROW_COLUMNS``).
+            
+        Returns:
+            str: Parameterized SELECT statement.
+        """
+        query = f"SELECT {columns or MetadataDatabase.ROW_COLUMNS} FROM metadata WHERE 1=1"
+        if has_term:
+            query += " AND (file_name LIKE ? OR file_path LIKE ?)"
+        if has_type:
+            query += " AND file_type = ?"
+        if has_date:
+            query += " AND extracted_at >= ?"
+        query += _SORT_CLAUSES.get(sort_option, _DEFAULT_SORT_CLAUSE)
+        if paged:
+            query += " LIMIT ? OFFSET ?"
+        return query
+
+    def export_data(self, format_type: str, data=None):
         """Export metadata records to various file formats.
         
         Args:
             format_type (str): Export format ('json', 'xml', 'excel', 'csv', 'pdf').
-            data (list): List of metadata records to export.
+            data (list | Iterable, optional): Metadata records to export. CSV
+                exports also accept an iterator such as ``iter_all_metadata()``
+                and write it row by row. When omitted, the whole database is
+                exported; CSV and Excel then leave out the full_metadata JSON.
             
         Returns:
             bool: True if export succeeded, False if no data provided.
         """
+        if data is None:
+            if format_type == "csv":
+                data = self.iter_all_metadata(include_json=False)
+            else:
+                data = self.fetch_all_metadata_lite(include_json=format_type != "excel")
+        if not isinstance(data, (list, tuple)) and data is not None:
+            # Iterators are always truthy, so peek at the first row to spot an empty one
+            rows = iter(data)
+            first = next(rows, None)
+            data = itertools.chain((first,), rows) if first is not None else None
         if not data:
             return False
 
-        df = pd.DataFrame(
-            data,
-            columns=[
-                "ID",
-                "File Path",
-                "File Name",
-                "File Size",
-                "File Type",
-                "Extracted At",
-                "Modified On",
-                "Full Metadata",
-            ],
-        )
+        if format_type == "csv":
+            # The CSV exporter works on the raw rows; no DataFrame needed.
+            self.reporter.export_to_csv(data)
+            return True
+
+        if not isinstance(data, list):
+            data = list(data)
+        width = len(data[0]) if data else len(EXPORT_COLUMNS)
+        df = pd.DataFrame.from_records(data, columns=EXPORT_COLUMNS[:width])
 
         if format_type == "json":
             self.reporter.export_to_json(df)
@@ -330,18 +998,57 @@ class MetadataDatabase:
             self.reporter.export_to_xml(df)
         elif format_type == "excel":
             self.reporter.export_to_excel(df)
-        elif format_type == "csv":
-            self.reporter.export_to_csv(data)
         elif format_type == "pdf":
             self.reporter.export_to_pdf(df)
         return True
 
-    def save_edited_metadata(self, file_path, payload):
+    def export_stream(self, format_type: str, file_path: str, search_term: str = "", file_type_filter: str = "All",
+                      date_filter: str = "All Time", sort_option: str = "Date (Newest)") -> int:
+        """Export the filtered records straight to ``file_path`` without dialogs.
+        
+        Rows come from ``iter_filtered_data``. CSV is written row by row as the
+        cursor yields them; the other formats build one DataFrame. Nothing here
+        touches Tk, so it can run on a worker thread.
+        
+        Args:
+            format_type (str): Export format ('json', 'xml', 'excel', 'csv', 'pdf').
+            file_path (str): Output file path.
+            search_term (str): Search term to find in file name or path.
+            file_type_filter (str): File type filter (e.g., 'pdf', 'All').
+            date_filter (str): Date range filter.
+            sort_option (str): Sorting option.
+            
+        Returns:
+            int: Number of records exported; no file is written when 0. An
+                unsupported ``format_type`` raises ValueError.
+        """
+        writers = {
+            "json": self.reporter.write_json,
+            "xml": self.reporter.write_xml,
+            "excel": self.reporter.write_excel,
+            "pdf": self.reporter.create_pdf_from_dataframe,
+        }
+        if format_type != "csv" and format_type not in writers:
+            raise ValueError(f"Unsupported export format: {format_type}")
+
+        rows = self.iter_filtered_data(search_term, file_type_filter, date_filter, sort_option)
+        if format_type == "csv":
+            return self.reporter.write_csv(rows, file_path)
+
+        data = list(rows)
+        if not data:
+            return 0
+        df = pd.DataFrame.from_records(data, columns=EXPORT_COLUMNS[:len(data[0])])
+        writers[format_type](df, file_path)
+        return len(data)
+
+    def save_edited_metadata(self, file_path, payload, conn=None):
         """Save edited metadata as a new database record.
         
         Args:
             file_path (str): Path to the original file.
             payload (dict): Dictionary with 'metadata' key containing edited metadata.
+            conn (sqlite3.Connection, optional): Connection from ``transaction()``.
             
         Returns:
             tuple: (bool, str) - Success status and message.
@@ -353,39 +1060,70 @@ class MetadataDatabase:
 
             file_name = os.path.basename(file_path) if file_path else ""
             try:
-                size_bytes = os.path.getsize(file_path) if file_path and os.path.exists(file_path) else 0
-            except Exception:
-                size_bytes = 0
+                st = os.stat(file_path)
+                size_bytes, mtime = st.st_size, st.st_mtime
+            except (OSError, TypeError, ValueError):
+                size_bytes, mtime = 0, None
             file_size_formatted = self.format_file_size(size_bytes)
             file_type = os.path.splitext(file_name)[1][1:].lower() if "." in file_name else ""
+            mod_time = _iso(mtime) if mtime is not None else None
+            extracted_at = _iso(time.time())
 
-            try:
-                mod_time = datetime.fromtimestamp(os.path.getmtime(file_path)).isoformat() if file_path and os.path.exists(file_path) else None
-            except Exception:
-                mod_time = None
-
-            with self._connect() as conn:
+            with self._write_conn(conn) as conn:
                 cursor = conn.cursor()
                 cursor.execute(
-                    """
-                    INSERT INTO metadata (file_path, file_name, file_size_formatted, file_type, extracted_at, modified_on, full_metadata)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """,
+                    self.INSERT_SQL,
                     (
                         file_path,
                         file_name,
                         file_size_formatted,
                         file_type,
-                        datetime.now().isoformat(),
+                        extracted_at,
                         mod_time,
-                        json.dumps(metadata),
+                        _JSON_ENCODE(metadata),
+                        size_bytes,
+                        self.format_timestamp(extracted_at),
+                        self.format_timestamp(mod_time),
                     ),
                 )
-                conn.commit()
             return True, "Edited metadata saved to database."
         except Exception as e:
             return False, f"DB save failed: {str(e)}"
 
+    def update_full_metadata(self, record_id, metadata, conn=None):
+        """Replace the stored metadata JSON of an existing record.
+        
+        Args:
+            record_id (int): Database ID of the record to update.
+            metadata (dict): New metadata dictionary.
+            conn (sqlite3.Connection, optional): Connection from ``transaction()``.
+            
+        Returns:
+            bool: True if a record was updated, False if the ID does not exist.
+        """
+        with self._write_conn(conn) as conn:
+            cursor = conn.cursor()
+            cursor.execute(self.UPDATE_METADATA_SQL, (_JSON_ENCODE(metadata), record_id))
+            return cursor.rowcount > 0
+
+    def update_full_metadata_many(self, updates, conn=None):
+        """Replace the stored metadata JSON of several records in one transaction.
+        
+        Args:
+            updates (Iterable[tuple[int, dict]]): ``(record_id, metadata)`` pairs.
+            conn (sqlite3.Connection, optional): Connection from ``transaction()``.
+            
+        Returns:
+            int: Number of records updated.
+        """
+        rows = [(_JSON_ENCODE(metadata), record_id) for record_id, metadata in updates]
+        if not rows:
+            return 0
+        with self._write_conn(conn) as conn:
+            cursor = conn.cursor()
+            cursor.executemany(self.UPDATE_METADATA_SQL, rows)
+            return cursor.rowcount
+
     def optimize_database(self):
         """Optimize the SQLite database for better performance.
         
@@ -393,10 +1131,12 @@ class MetadataDatabase:
             bool: True if optimization succeeded, False if an error occurred.
         """
         try:
-            with self._connect() as conn:
-                cursor = conn.cursor()
-                cursor.execute("PRAGMA optimize;")
-                conn.commit()
+            with self._lock:
+                self._check_no_transaction("optimize_database")
+                with self._get_writer() as conn:
+                    cursor = conn.cursor()
+                    cursor.execute("PRAGMA optimize;")
+                    conn.commit()
             return True
         except Exception as e:
             print(f"Error optimizing database: {e}")
@@ -404,79 +1144,160 @@ class MetadataDatabase:
 
 
 # Singleton instance and compatibility wrappers --------------------------------
-db_manager = MetadataDatabase()
+# The shared instance is created on first use so importing this module does
+# no file I/O. ``db.db_manager`` keeps working through __getattr__ below.
+_db_manager = None
+_db_manager_lock = threading.Lock()
+
+
+def _get_manager():
+    """Return the shared MetadataDatabase, creating it on first call."""
+    global _db_manager
+    if _db_manager is None:
+        with _db_manager_lock:
+            if _db_manager is None:
+                _db_manager = MetadataDatabase()
+    return _db_manager
+
+
+def __getattr__(name):
+    if name == "db_manager":
+        return _get_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def db_init():
     """Initialize database tables. Wrapper around db_manager._ensure_tables()."""
-    return db_manager._ensure_tables()
+    return _get_manager()._ensure_tables()
 
 
 def format_file_size(size_bytes):
     """Wrapper: Convert file size to human-readable format."""
-    return db_manager.format_file_size(size_bytes)
+    return MetadataDatabase.format_file_size(size_bytes)
+
+
+def transaction():
+    """Wrapper: Group several writes into one transaction."""
+    return _get_manager().transaction()
 
 
 def insert_metadata(file_path, metadata):
     """Wrapper: Insert metadata record for a file."""
-    return db_manager.insert_metadata(file_path, metadata)
+    return _get_manager().insert_metadata(file_path, metadata)
+
+
+def insert_metadata_many(items):
+    """Wrapper: Insert metadata records for many files in one transaction."""
+    return _get_manager().insert_metadata_many(items)
 
 
 def fetch_metadata_by_id(record_id):
     """Wrapper: Retrieve metadata record by ID."""
-    return db_manager.fetch_metadata_by_id(record_id)
+    return _get_manager().fetch_metadata_by_id(record_id)
 
 
 def fetch_all_metadata():
     """Wrapper: Retrieve all metadata records."""
-    return db_manager.fetch_all_metadata()
+    return _get_manager().fetch_all_metadata()
+
+
+def iter_all_metadata(chunk: int = 1000, include_json: bool = True):
+    """Wrapper: Stream all metadata records in chunks."""
+    return _get_manager().iter_all_metadata(chunk, include_json)
 
 
 def fetch_latest_by_path(path: str):
     """Wrapper: Retrieve most recent metadata for a file path."""
-    return db_manager.fetch_latest_by_path(path)
+    return _get_manager().fetch_latest_by_path(path)
+
+
+def fetch_latest_summary_by_path(path: str):
+    """Wrapper: Retrieve display fields of the most recent record for a file path."""
+    return _get_manager().fetch_latest_summary_by_path(path)
+
+
+def fetch_all_metadata_lite(include_json: bool = False):
+    """Wrapper: Retrieve all metadata records without the JSON payload."""
+    return _get_manager().fetch_all_metadata_lite(include_json)
 
 
 def fetch_all_metadata_formatted():
     """Wrapper: Retrieve formatted metadata for all records."""
-    return db_manager.fetch_all_metadata_formatted()
+    return _get_manager().fetch_all_metadata_formatted()
 
 
 def get_recent_records(limit: int = 10):
     """Wrapper: Retrieve recent metadata records."""
-    return db_manager.get_recent_records(limit)
+    return _get_manager().get_recent_records(limit)
 
 
 def get_database_stats():
     """Wrapper: Get database statistics."""
-    return db_manager.get_database_stats()
+    return _get_manager().get_database_stats()
 
 
 def clear_metadata():
     """Wrapper: Delete all metadata records."""
-    return db_manager.clear_metadata()
+    return _get_manager().clear_metadata()
 
 
 def delete_record(record_id):
     """Wrapper: Delete a specific metadata record."""
-    return db_manager.delete_record(record_id)
+    return _get_manager().delete_record(record_id)
 
 
-def filter_and_search_data(search_term: str, file_type_filter: str, date_filter: str, sort_option: str):
+def filter_and_search_data(search_term: str, file_type_filter: str, date_filter: str, sort_option: str,
+                           limit: int | None = None, offset: int = 0, include_json: bool = True,
+                           display_times: bool = False):
     """Wrapper: Filter and search metadata with criteria."""
-    return db_manager.filter_and_search_data(search_term, file_type_filter, date_filter, sort_option)
+    return _get_manager().filter_and_search_data(search_term, file_type_filter, date_filter, sort_option,
+                                                 limit, offset, include_json, display_times)
+
 
+def count_filtered_data(search_term: str, file_type_filter: str, date_filter: str):
+    """Wrapper: Count metadata records matching the History filters."""
+    return _get_manager().count_filtered_data(search_term, file_type_filter, date_filter)
 
-def export_data(format_type: str, data):
+
+def iter_filtered_data(search_term: str, file_type_filter: str, date_filter: str, sort_option: str,
+                       chunk: int = 1000, include_json: bool = True):
+    """Wrapper: Stream metadata records matching the History filters."""
+    return _get_manager().iter_filtered_data(search_term, file_type_filter, date_filter, sort_option,
+                                             chunk, include_json)
+
+
+def export_data(format_type: str, data=None):
     """Wrapper: Export metadata to various formats."""
-    return db_manager.export_data(format_type, data)
+    return _get_manager().export_data(format_type, data)
+
+
+def export_stream(format_type: str, file_path: str, search_term: str = "", file_type_filter: str = "All",
+                  date_filter: str = "All Time", sort_option: str = "Date (Newest)"):
+    """Wrapper: Export filtered metadata straight to a file without dialogs."""
+    return _get_manager().export_stream(format_type, file_path, search_term, file_type_filter,
+                                        date_filter, sort_option)
 
 
 def save_edited_metadata(file_path, payload):
     """Wrapper: Save edited metadata to database."""
-    return db_manager.save_edited_metadata(file_path, payload)
+    return _get_manager().save_edited_metadata(file_path, payload)
+
+
+def update_full_metadata(record_id, metadata):
+    """Wrapper: Replace the stored metadata JSON of an existing record."""
+    return _get_manager().update_full_metadata(record_id, metadata)
+
+
+def fetch_latest_ids_by_paths(paths):
+    """Wrapper: Map file paths to the ID of their most recent record."""
+    return _get_manager().fetch_latest_ids_by_paths(paths)
+
+
+def update_full_metadata_many(updates):
+    """Wrapper: Replace the stored metadata JSON of several records."""
+    return _get_manager().update_full_metadata_many(updates)
 
 
 def optimize_database():
     """Wrapper: Optimize the SQLite database."""
-    return db_manager.optimize_database()
+    return _get_manager().optimize_database()
@@ -7,17 +7,191 @@ Supports PDF, images (PNG/JPEG), audio (MP3), and text files.
 
 import json
 import re
+from collections import OrderedDict
 from datetime import datetime
 import db
 import os
 import shutil
+import tempfile
+import threading
+from types import SimpleNamespace
+
+
+# Optional writer libraries, imported on first use and then served from here.
+# A missing library raises ImportError from its loader on every call.
+_libs = {}
+
+
+def _pypdf2():
+    """Return ``(PdfReader, PdfWriter)`` from PyPDF2."""
+    if 'pypdf2' not in _libs:
+        from PyPDF2 import PdfReader, PdfWriter
+        _libs['pypdf2'] = (PdfReader, PdfWriter)
+    return _libs['pypdf2']
+
+
+def _pil():
+    """Return ``(Image, PngImagePlugin)`` from Pillow."""
+    if 'pil' not in _libs:
+        from PIL import Image, PngImagePlugin
+        _libs['pil'] = (Image, PngImagePlugin)
+    return _libs['pil']
+
+
+def _piexif():
+    """Return the piexif module."""
+    if 'piexif' not in _libs:
+        import piexif
+        _libs['piexif'] = piexif
+    return _libs['piexif']
+
+
+def _mutagen():
+    """Return a namespace with the mutagen classes used for audio tagging."""
+    if 'mutagen' not in _libs:
+        import mutagen
+        from mutagen.id3 import ID3, ID3NoHeaderError, TIT2, TPE1, TALB, COMM
+        from mutagen.flac import FLAC
+        from mutagen.mp4 import MP4
+        _libs['mutagen'] = SimpleNamespace(
+            File=mutagen.File, ID3=ID3, ID3NoHeaderError=ID3NoHeaderError,
+            TIT2=TIT2, TPE1=TPE1, TALB=TALB, COMM=COMM, FLAC=FLAC, MP4=MP4,
+        )
+    return _libs['mutagen']
+
+
+def _docx():
+    """Return the python-docx module."""
+    if 'docx' not in _libs:
+        import docx
+        _libs['docx'] = docx
+    return _libs['docx']
+
+
+def _clone_file(src: str, dst: str) -> None:
+    """Copy ``src`` to ``dst`` with metadata, letting the kernel share extents if it can.
+    
+    ``os.copy_file_range`` stays in the kernel and becomes a copy-on-write
+    reflink on filesystems that support it (Btrfs, XFS, NFS 4.2 server-side
+    copy), so seeding a temp file costs O(1) there. Anything else falls back
+    to ``shutil.copy2``.
+    """
+    copy_range = getattr(os, 'copy_file_range', None)
+    if copy_range is not None:
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = copy_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining <= 0:
+                shutil.copystat(src, dst)
+                return
+        except OSError:
+            pass
+    shutil.copy2(src, dst)
+
+
+# Editor fields written to their own ID3 frames (TIT2, TPE1, TALB)
+_ID3_NATIVE_KEYS = frozenset({'Title', 'Artist', 'Album'})
+
+
+def _id3_padding(info) -> int:
+    """mutagen padding policy that avoids moving the audio data when possible.
+    
+    Existing padding is kept whenever the new tag fits (mutagen's default may
+    shrink it, which also forces a rewrite); when the tag grows, at least 4 KiB
+    is reserved so the next edit fits in place.
+    """
+    if info.padding >= 0:
+        return info.padding
+    return max(info.get_default_padding(), 4096)
+
+
+# Compact JSON for metadata embedded in file tags (EXIF UserComment, ID3 COMM, MP4 comment)
+_JSON_ENCODE = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False, check_circular=False).encode
+
+# Standard header lines shown above the editable metadata fields.
+_HEADER_KEYS = frozenset({'File Name', 'File Size', 'File Type', 'Extracted At', 'Modified On'})
+
+# Read-only stand-in for a missing headers dict; never mutated
+_EMPTY = {}
+
+# Editor field names with a standard PDF /Info key; anything else becomes /<name>
+_PDF_KEY_MAP = {
+    'Title': '/Title',
+    'Author': '/Author',
+    'Subject': '/Subject',
+    'Creator': '/Creator',
+    'Producer': '/Producer',
+    'Keywords': '/Keywords',
+}
+
+# Writer method for each supported extension; unlisted types get a companion file
+_EXT_DISPATCH = {
+    '.pdf': 'write_pdf_metadata',
+    **dict.fromkeys(('.jpg', '.jpeg', '.png', '.tiff', '.tif', '.bmp', '.gif'), 'write_image_metadata'),
+    **dict.fromkeys(('.mp3', '.wav', '.flac', '.m4a', '.ogg'), 'write_audio_metadata'),
+    **dict.fromkeys(('.txt', '.json', '.xml', '.csv', '.md', '.log', '.yaml', '.yml'), 'write_text_metadata'),
+    **dict.fromkeys(('.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx'), 'write_office_metadata'),
+}
+
+def _fmt(dt_str: str) -> str:
+    """Format an ISO timestamp for display, e.g. ``Jan 05, 2024 03:07 PM``.
+    
+    Delegates to ``db.MetadataDatabase.format_timestamp`` so the editor and
+    History render (and reject) timestamps the same way.
+    """
+    return db.MetadataDatabase.format_timestamp(dt_str)
 
 
 class MetadataEditor:
     """Object-oriented metadata editor with parsing, validation, and file writing capabilities."""
 
+    # Latest-record summaries kept between opening the editor and saving it
+    LATEST_CACHE_SIZE = 128
+
     def __init__(self, db_client: db.MetadataDatabase | None = None) -> None:
-        self.db_client = db_client or db.db_manager
+        self._db_client = db_client
+        self._latest_cache: OrderedDict = OrderedDict()
+
+    @property
+    def db_client(self) -> db.MetadataDatabase:
+        """Database client; falls back to the shared ``db.db_manager`` on first use."""
+        if self._db_client is None:
+            self._db_client = db.db_manager
+        return self._db_client
+
+    @db_client.setter
+    def db_client(self, client: db.MetadataDatabase) -> None:
+        self._db_client = client
+
+    def _latest_summary(self, file_path: str):
+        """Return the latest record summary for a path, cached until the database changes.
+        
+        Entries are stamped with the client's ``write_version``; any insert,
+        update or delete makes them stale, including the editor's own saves.
+        
+        Args:
+            file_path (str): Path to the original file.
+            
+        Returns:
+            tuple | None: Row from ``fetch_latest_summary_by_path``.
+        """
+        version = self.db_client.write_version
+        hit = self._latest_cache.get(file_path)
+        if hit is not None and hit[0] == version:
+            self._latest_cache.move_to_end(file_path)
+            return hit[1]
+
+        latest = self.db_client.fetch_latest_summary_by_path(file_path)
+        self._latest_cache[file_path] = (version, latest)
+        self._latest_cache.move_to_end(file_path)
+        if len(self._latest_cache) > self.LATEST_CACHE_SIZE:
+            self._latest_cache.popitem(last=False)
+        return latest
 
     def parse_editor_text(self, text: str) -> dict:
         """Parse metadata text from editor into structured data.
@@ -30,26 +204,15 @@ class MetadataEditor:
         Returns:
             dict: Dictionary with 'headers' and 'metadata' keys containing parsed data.
         """
-        lines = text.strip().split('\n')
         headers = {}
         metadata = {}
 
-        for line in lines:
-            line = line.strip()
-            if not line or ':' not in line:
-                continue
-
-            parts = line.split(':', 1)
-            if len(parts) != 2:
+        for line in text.split('\n'):
+            key, sep, value = line.partition(':')
+            if not sep:
                 continue
-
-            key = parts[0].strip()
-            value = parts[1].strip()
-
-            if key in ['File Name', 'File Size', 'File Type', 'Extracted At', 'Modified On']:
-                headers[key] = value
-            else:
-                metadata[key] = value
+            key = key.strip()
+            (headers if key in _HEADER_KEYS else metadata)[key] = value.strip()
 
         return {'headers': headers, 'metadata': metadata}
 
@@ -62,12 +225,9 @@ class MetadataEditor:
         Returns:
             tuple: (is_valid, error_message)
         """
-        headers = parsed_data.get('headers', {})
-
-        required = ['File Name']
-        for field in required:
-            if field not in headers or not headers[field]:
-                return False, f"Missing required field: {field}"
+        headers = parsed_data.get('headers') or _EMPTY
+        if not headers.get('File Name'):
+            return False, "Missing required field: File Name"
 
         if not parsed_data.get('metadata'):
             return False, "Metadata cannot be empty"
@@ -84,31 +244,67 @@ class MetadataEditor:
         Returns:
             tuple: (success, message) - Boolean status and informational message.
         """
-        try:
-            valid, error = self.validate_metadata(parsed_data)
-            if not valid:
-                return False, error
-
-            latest = self.db_client.fetch_latest_by_path(file_path)
-            if not latest:
-                return False, "No existing record found for this file"
-
-            updated_metadata = parsed_data['metadata']
+        return self.save_edited_metadata_many([(file_path, parsed_data)])[0]
 
-            import sqlite3
-            with sqlite3.connect('file_metadata.db') as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    UPDATE metadata 
-                    SET full_metadata = ?
-                    WHERE id = ?
-                ''', (json.dumps(updated_metadata), latest[0]))
-                conn.commit()
+    def save_edited_metadata_many(self, items) -> list[tuple[bool, str]]:
+        """Save edited metadata for several files in a single transaction.
+        
+        Record IDs for all paths are resolved with one query and every update is
+        committed together, so N edits cost one commit.
+        
+        Args:
+            items (Iterable[tuple[str, dict]]): ``(file_path, parsed_data)`` pairs.
+            
+        Returns:
+            list: One ``(success, message)`` tuple per item, in input order.
+        """
+        items = list(items)
+        results: list[tuple[bool, str] | None] = [None] * len(items)
+        pending = []
 
-            return True, "Metadata updated successfully"
+        for idx, (file_path, parsed_data) in enumerate(items):
+            try:
+                valid, error = self.validate_metadata(parsed_data)
+            except Exception as e:
+                valid, error = False, f"Error saving metadata: {str(e)}"
+            if valid:
+                pending.append(idx)
+            else:
+                results[idx] = (False, error)
 
+        try:
+            # Paths opened in the editor since the last write already know their record id
+            version = self.db_client.write_version
+            latest_ids = {}
+            missing = []
+            for idx in pending:
+                file_path = items[idx][0]
+                hit = self._latest_cache.get(file_path)
+                if hit is not None and hit[0] == version and hit[1]:
+                    latest_ids[file_path] = hit[1][0]
+                else:
+                    missing.append(file_path)
+            if missing:
+                latest_ids.update(self.db_client.fetch_latest_ids_by_paths(missing))
+
+            updates = []
+            for idx in pending:
+                file_path, parsed_data = items[idx]
+                record_id = latest_ids.get(file_path)
+                if record_id is None:
+                    results[idx] = (False, "No existing record found for this file")
+                    continue
+                updates.append((record_id, parsed_data['metadata']))
+                results[idx] = (True, "Metadata updated successfully")
+
+            if updates:
+                self.db_client.update_full_metadata_many(updates)
         except Exception as e:
-            return False, f"Error saving metadata: {str(e)}"
+            for idx in pending:
+                if results[idx] is None or results[idx][0]:
+                    results[idx] = (False, f"Error saving metadata: {str(e)}")
+
+        return results
 
     def get_editable_text(self, file_path: str, metadata: dict) -> str:
         """Build editable text format from file path and metadata dict.
@@ -122,60 +318,77 @@ class MetadataEditor:
         Returns:
             str: Formatted text for display in editor.
         """
-        lines = []
-
         try:
-            latest = self.db_client.fetch_latest_by_path(file_path)
+            latest = self._latest_summary(file_path)
         except Exception:
             latest = None
 
-        def _fmt(dt_str):
-            if not dt_str:
-                return ""
-            try:
-                return datetime.fromisoformat(dt_str).strftime("%b %d, %Y %I:%M %p")
-            except Exception:
-                return dt_str
-
         file_name = os.path.basename(file_path)
         if latest:
-            size_fmt = latest[3]
-            ftype = latest[4]
-            extracted_at_h = _fmt(latest[5])
-            modified_on_h = _fmt(latest[6])
+            _, size_fmt, ftype, extracted_at, modified_on = latest
+            extracted_at_h = _fmt(extracted_at)
+            modified_on_h = _fmt(modified_on)
         else:
+            # One stat supplies both size and mtime
             try:
-                size_bytes = os.path.getsize(file_path)
-            except Exception:
+                st = os.stat(file_path)
+                size_bytes = st.st_size
+                modified_on_h = _fmt(datetime.fromtimestamp(st.st_mtime).isoformat())
+            except (OSError, ValueError, OverflowError):
                 size_bytes = 0
+                modified_on_h = ""
             size_fmt = db.format_file_size(size_bytes)
             ftype = os.path.splitext(file_name)[1][1:].lower() if "." in file_name else ""
             extracted_at_h = _fmt(datetime.now().isoformat())
-            try:
-                modified_on_h = _fmt(datetime.fromtimestamp(os.path.getmtime(file_path)).isoformat())
-            except Exception:
-                modified_on_h = ""
 
-        lines.append(f"File Name: {file_name}")
-        lines.append(f"File Size: {size_fmt}")
-        lines.append(f"File Type: {ftype}")
-        lines.append(f"Extracted At: {extracted_at_h}")
-        lines.append(f"Modified On: {modified_on_h}")
-        lines.append("")
+        header = (
+            f"File Name: {file_name}\n"
+            f"File Size: {size_fmt}\n"
+            f"File Type: {ftype}\n"
+            f"Extracted At: {extracted_at_h}\n"
+            f"Modified On: {modified_on_h}\n"
+        )
 
         if isinstance(metadata, dict):
-            for key, value in metadata.items():
-                lines.append(f"{key}: {value}")
-        else:
-            lines.append(str(metadata))
-
-        return "\n".join(lines)
+            return header + "".join(f"\n{key}: {value}" for key, value in metadata.items())
+        return header + "\n" + str(metadata)
 
     @staticmethod
     def clear_editor() -> str:
         """Return empty editor placeholder text."""
         return "No metadata loaded.\n\nExtract metadata from a file first, then click 'Editor' to edit it."
 
+    @staticmethod
+    def _atomic_write(file_path: str, write_fn, copy_original: bool = False) -> None:
+        """Produce a new version of a file in a sibling temp file and rename it into place.
+        
+        The original is never opened for writing, so a failed or interrupted write
+        leaves it untouched and no restore copy is needed.
+        
+        Args:
+            file_path (str): Path to the file being rewritten.
+            write_fn (callable): Called with the temp path; must leave the complete
+                new file there.
+            copy_original (bool): Seed the temp file with a copy of the original,
+                for libraries that edit tags in place.
+        """
+        directory, name = os.path.split(os.path.abspath(file_path))
+        fd, tmp_path = tempfile.mkstemp(prefix=f'.{name}.', suffix=os.path.splitext(name)[1], dir=directory)
+        os.close(fd)
+        try:
+            if copy_original:
+                _clone_file(file_path, tmp_path)
+            else:
+                shutil.copymode(file_path, tmp_path)
+            write_fn(tmp_path)
+            with open(tmp_path, 'rb') as f:
+                os.fsync(f.fileno())
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
     def write_metadata_to_file(self, file_path: str, metadata: dict) -> tuple[bool, str]:
         """Write metadata back to the source file based on file type.
         
@@ -194,361 +407,336 @@ class MetadataEditor:
         ext = os.path.splitext(file_path)[1].lower()
 
         try:
-            if ext == '.pdf':
-                return self.write_pdf_metadata(file_path, metadata)
-            elif ext in ['.jpg', '.jpeg', '.png', '.tiff', '.tif', '.bmp', '.gif']:
-                return self.write_image_metadata(file_path, metadata)
-            elif ext in ['.mp3', '.wav', '.flac', '.m4a', '.ogg']:
-                return self.write_audio_metadata(file_path, metadata)
-            elif ext in ['.txt', '.json', '.xml', '.csv', '.md', '.log', '.yaml', '.yml']:
-                return self.write_text_metadata(file_path, metadata)
-            elif ext in ['.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx']:
-                return self.write_office_metadata(file_path, metadata)
-            else:
-                return self.write_generic_metadata(file_path, metadata)
+            handler = getattr(self, _EXT_DISPATCH.get(ext, 'write_generic_metadata'))
+            return handler(file_path, metadata, ext=ext)
 
         except Exception as e:
             return False, f"Error writing metadata: {str(e)}"
 
-    def write_pdf_metadata(self, file_path: str, metadata: dict) -> tuple[bool, str]:
+    def write_pdf_metadata(self, file_path: str, metadata: dict, ext: str | None = None) -> tuple[bool, str]:
         """Write metadata to PDF file using PyPDF2.
         
-        Maps metadata keys to PDF standard properties. Creates backup before writing.
+        Maps metadata keys to PDF standard properties. Writes through a temp file.
         
         Args:
             file_path (str): Path to the PDF file.
             metadata (dict): Metadata dictionary to write.
+            ext (str | None): Ignored; accepted so every writer shares one dispatch signature.
             
         Returns:
             tuple: (success, message) - Boolean status and informational message.
         """
         try:
-            from PyPDF2 import PdfReader, PdfWriter
+            PdfReader, PdfWriter = _pypdf2()
 
             reader = PdfReader(file_path)
-            writer = PdfWriter()
-
-            for page in reader.pages:
-                writer.add_page(page)
-
-            pdf_metadata = {}
-            key_mapping = {
-                'Title': '/Title',
-                'Author': '/Author',
-                'Subject': '/Subject',
-                'Creator': '/Creator',
-                'Producer': '/Producer',
-                'Keywords': '/Keywords',
-            }
-
-            for key, value in metadata.items():
-                pdf_key = key_mapping.get(key, f'/{key}')
-                pdf_metadata[pdf_key] = str(value)
-
+            try:
+                # pypdf / newer PyPDF2 clone the whole document without re-adding pages
+                writer = PdfWriter(clone_from=reader)
+            except TypeError:
+                writer = PdfWriter()
+                for page in reader.pages:
+                    writer.add_page(page)
+
+            pdf_metadata = {_PDF_KEY_MAP.get(key, f'/{key}'): str(value) for key, value in metadata.items()}
             writer.add_metadata(pdf_metadata)
 
-            backup_path = file_path + '.backup'
-            shutil.copy2(file_path, backup_path)
-
-            try:
-                with open(file_path, 'wb') as output_file:
+            def _write(tmp_path):
+                with open(tmp_path, 'wb') as output_file:
                     writer.write(output_file)
 
-                os.remove(backup_path)
-                return True, "PDF metadata written successfully"
-            except Exception as e:
-                if os.path.exists(backup_path):
-                    shutil.copy2(backup_path, file_path)
-                    os.remove(backup_path)
-                raise e
+            self._atomic_write(file_path, _write)
+            return True, "PDF metadata written successfully"
 
         except ImportError:
             return False, "PyPDF2 not installed. Run: pip install PyPDF2"
         except Exception as e:
             return False, f"PDF write failed: {str(e)}"
 
-    def write_image_metadata(self, file_path: str, metadata: dict) -> tuple[bool, str]:
+    def write_image_metadata(self, file_path: str, metadata: dict, ext: str | None = None) -> tuple[bool, str]:
         """Write metadata to image file using PIL and piexif.
         
         Supports JPEG (EXIF), PNG (PNG text chunks), and other image formats.
-        Creates backup before writing.
+        JPEG EXIF is spliced in without re-encoding; writes go through a temp file.
         
         Args:
             file_path (str): Path to the image file.
             metadata (dict): Metadata dictionary to write.
+            ext (str | None): Lower-cased extension when the caller already has it.
             
         Returns:
             tuple: (success, message) - Boolean status and informational message.
         """
         try:
-            from PIL import Image
+            ext = ext or os.path.splitext(file_path)[1].lower()
 
-            ext = os.path.splitext(file_path)[1].lower()
-            img = Image.open(file_path)
-            backup_path = file_path + '.backup'
+            if ext in ['.jpg', '.jpeg']:
+                with open(file_path, 'rb') as f:
+                    data = f.read()
+
+                # EXIF lives in the APP1 segment, so a real JPEG is patched without touching pixels
+                if data[:2] == b'\xff\xd8':
+                    try:
+                        piexif = _piexif()
+                    except ImportError:
+                        return False, "piexif not installed for JPEG/TIFF. Run: pip install piexif"
+
+                    try:
+                        exif_bytes_new = piexif.dump(self._exif_with_comment(data, metadata))
+                        self._atomic_write(file_path, lambda tmp: piexif.insert(exif_bytes_new, data, tmp))
+                        return True, "Image EXIF metadata written successfully"
+                    except Exception as e:
+                        raise Exception(f"Failed to save EXIF: {str(e)}")
+
+            Image, PngImagePlugin = _pil()
 
-            shutil.copy2(file_path, backup_path)
+            img = Image.open(file_path)
+            # Decode now so single-frame images release the source handle before the rename
+            img.load()
 
             try:
                 if ext in ['.jpg', '.jpeg', '.tiff', '.tif']:
-                    import piexif
-
-                    exif_bytes = img.info.get('exif', None)
-                    if exif_bytes:
-                        try:
-                            exif_dict = piexif.load(exif_bytes)
-                        except:
-                            exif_dict = {"0th": {}, "Exif": {}, "GPS": {}, "1st": {}}
-                    else:
-                        exif_dict = {"0th": {}, "Exif": {}, "GPS": {}, "1st": {}}
+                    piexif = _piexif()
 
-                    comment = json.dumps(metadata)
-                    exif_dict["Exif"][piexif.ExifIFD.UserComment] = comment.encode('utf-8')
+                    exif_dict = self._exif_with_comment(img.info.get('exif', None), metadata)
 
                     try:
                         exif_bytes_new = piexif.dump(exif_dict)
 
                         if ext in ['.jpg', '.jpeg']:
-                            img.save(file_path, quality=95, exif=exif_bytes_new)
+                            self._atomic_write(file_path, lambda tmp: img.save(tmp, quality=95, exif=exif_bytes_new))
                         else:
-                            img.save(file_path, exif=exif_bytes_new)
+                            self._atomic_write(file_path, lambda tmp: img.save(tmp, exif=exif_bytes_new))
 
-                        os.remove(backup_path)
                         return True, "Image EXIF metadata written successfully"
                     except Exception as e:
                         raise Exception(f"Failed to save EXIF: {str(e)}")
 
                 elif ext == '.png':
-                    from PIL import PngImagePlugin
-
                     meta = PngImagePlugin.PngInfo()
                     for key, value in metadata.items():
                         meta.add_text(str(key), str(value))
 
                     try:
-                        img.save(file_path, pnginfo=meta)
-                        os.remove(backup_path)
+                        self._atomic_write(file_path, lambda tmp: img.save(tmp, pnginfo=meta))
                         return True, "PNG metadata written successfully"
                     except Exception as e:
                         raise Exception(f"Failed to save PNG: {str(e)}")
 
                 else:
-                    os.remove(backup_path)
                     return self.write_generic_metadata(file_path, metadata)
 
             except ImportError as ie:
-                os.remove(backup_path)
                 if "piexif" in str(ie):
                     return False, "piexif not installed for JPEG/TIFF. Run: pip install piexif"
                 raise ie
-            except Exception as e:
-                if os.path.exists(backup_path):
-                    shutil.copy2(backup_path, file_path)
-                    os.remove(backup_path)
-                raise e
 
         except ImportError:
             return False, "PIL not installed. Run: pip install Pillow"
         except Exception as e:
             return False, f"Image write failed: {str(e)}"
 
-    def write_audio_metadata(self, file_path: str, metadata: dict) -> tuple[bool, str]:
+    @staticmethod
+    def _exif_with_comment(exif_source, metadata: dict) -> dict:
+        """Load existing EXIF and store the metadata as JSON in its UserComment tag.
+        
+        Args:
+            exif_source (bytes | None): Raw EXIF bytes or complete JPEG data.
+            metadata (dict): Metadata dictionary to embed.
+            
+        Returns:
+            dict: piexif-style EXIF dictionary ready for piexif.dump.
+        """
+        piexif = _piexif()
+
+        exif_dict = None
+        if exif_source:
+            try:
+                exif_dict = piexif.load(exif_source)
+            except:
+                pass
+        if exif_dict is None:
+            exif_dict = {"0th": {}, "Exif": {}, "GPS": {}, "1st": {}}
+
+        comment = _JSON_ENCODE(metadata)
+        exif_dict["Exif"][piexif.ExifIFD.UserComment] = comment.encode('utf-8')
+        return exif_dict
+
+    def write_audio_metadata(self, file_path: str, metadata: dict, ext: str | None = None) -> tuple[bool, str]:
         """Write metadata to audio file using mutagen.
         
         Supports MP3 (ID3), FLAC, M4A/MP4, and other audio formats.
-        Creates backup before writing.
+        Tags a temp copy of the file, then renames it into place.
         
         Args:
             file_path (str): Path to the audio file.
             metadata (dict): Metadata dictionary to write.
+            ext (str | None): Lower-cased extension when the caller already has it.
             
         Returns:
             tuple: (success, message) - Boolean status and informational message.
         """
         try:
-            from mutagen.mp3 import MP3
-            from mutagen.id3 import ID3, TIT2, TPE1, TALB, TDRC, COMM
-            from mutagen.flac import FLAC
-            from mutagen.mp4 import MP4
+            mg = _mutagen()
+        except ImportError:
+            return False, "mutagen not installed. Run: pip install mutagen"
 
-            ext = os.path.splitext(file_path)[1].lower()
-            backup_path = file_path + '.backup'
-            shutil.copy2(file_path, backup_path)
+        try:
+            ext = ext or os.path.splitext(file_path)[1].lower()
 
-            try:
+            def _tag(tmp_path):
                 if ext == '.mp3':
-                    audio = MP3(file_path, ID3=ID3)
-
+                    # Only the ID3 block is read and rewritten; MPEG frames are never scanned
                     try:
-                        audio.add_tags()
-                    except:
-                        pass
+                        tags = mg.ID3(tmp_path)
+                    except mg.ID3NoHeaderError:
+                        tags = mg.ID3()
 
                     if 'Title' in metadata:
-                        audio.tags['TIT2'] = TIT2(encoding=3, text=metadata['Title'])
+                        tags.add(mg.TIT2(encoding=3, text=metadata['Title']))
                     if 'Artist' in metadata:
-                        audio.tags['TPE1'] = TPE1(encoding=3, text=metadata['Artist'])
+                        tags.add(mg.TPE1(encoding=3, text=metadata['Artist']))
                     if 'Album' in metadata:
-                        audio.tags['TALB'] = TALB(encoding=3, text=metadata['Album'])
+                        tags.add(mg.TALB(encoding=3, text=metadata['Album']))
 
-                    comment = json.dumps(metadata)
-                    audio.tags['COMM'] = COMM(encoding=3, lang='eng', desc='metadata', text=comment)
+                    # Fields with a native frame are not repeated in the JSON comment
+                    extra = {key: value for key, value in metadata.items() if key not in _ID3_NATIVE_KEYS}
+                    if extra:
+                        tags.add(mg.COMM(encoding=3, lang='eng', desc='metadata', text=_JSON_ENCODE(extra)))
+                    else:
+                        tags.delall('COMM:metadata:eng')
 
-                    audio.save()
+                    tags.save(tmp_path, padding=_id3_padding)
 
                 elif ext == '.flac':
-                    audio = FLAC(file_path)
+                    audio = mg.FLAC(tmp_path)
                     for key, value in metadata.items():
                         audio[key.upper()] = str(value)
                     audio.save()
 
                 elif ext in ['.m4a', '.mp4']:
-                    audio = MP4(file_path)
-                    audio['\xa9cmt'] = json.dumps(metadata)
+                    audio = mg.MP4(tmp_path)
+                    audio['\xa9cmt'] = _JSON_ENCODE(metadata)
                     audio.save()
 
                 else:
-                    from mutagen import File
-                    audio = File(file_path)
+                    audio = mg.File(tmp_path)
                     if audio is not None:
                         for key, value in metadata.items():
                             audio[key] = str(value)
                         audio.save()
 
-                os.remove(backup_path)
-                return True, f"{ext.upper()} metadata written successfully"
+            self._atomic_write(file_path, _tag, copy_original=True)
+            return True, f"{ext.upper()} metadata written successfully"
 
-            except Exception as e:
-                if os.path.exists(backup_path):
-                    shutil.copy2(backup_path, file_path)
-                    os.remove(backup_path)
-                raise e
-
-        except ImportError:
-            return False, "mutagen not installed. Run: pip install mutagen"
         except Exception as e:
             return False, f"Audio write failed: {str(e)}"
 
-    def write_text_metadata(self, file_path: str, metadata: dict) -> tuple[bool, str]:
+    def write_text_metadata(self, file_path: str, metadata: dict, ext: str | None = None) -> tuple[bool, str]:
         """Write metadata to text-based files by adding/updating metadata header.
         
         Supports JSON, XML, YAML, and plain text files. Adds metadata as comments or JSON.
-        Creates backup before writing.
+        Comment headers are streamed in front of the original bytes through a temp file.
         
         Args:
             file_path (str): Path to the text file.
             metadata (dict): Metadata dictionary to write.
+            ext (str | None): Lower-cased extension when the caller already has it.
             
         Returns:
             tuple: (success, message) - Boolean status and informational message.
         """
         try:
-            ext = os.path.splitext(file_path)[1].lower()
+            ext = ext or os.path.splitext(file_path)[1].lower()
+
+            if ext == '.json':
+                # JSON has to be parsed and re-serialized, so it stays in memory
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+
+                try:
+                    data = json.loads(content)
+                    if not isinstance(data, dict):
+                        data = {'content': data}
+                    data['_metadata'] = metadata
+                    new_content = json.dumps(data, indent=2)
+                except:
+                    new_content = json.dumps({'_metadata': metadata, 'original': content}, indent=2)
+
+                def _write(tmp_path):
+                    with open(tmp_path, 'w', encoding='utf-8') as f:
+                        f.write(new_content)
 
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            backup_path = file_path + '.backup'
-            shutil.copy2(file_path, backup_path)
-
-            try:
-                if ext == '.json':
-                    try:
-                        data = json.loads(content)
-                        if not isinstance(data, dict):
-                            data = {'content': data}
-                        data['_metadata'] = metadata
-                        new_content = json.dumps(data, indent=2)
-                    except:
-                        new_content = json.dumps({'_metadata': metadata, 'original': content}, indent=2)
-
-                elif ext in ['.xml']:
+            else:
+                if ext in ['.xml']:
                     meta_str = json.dumps(metadata, indent=2)
-                    new_content = f"<!-- Metadata:\n{meta_str}\n-->\n{content}"
+                    header = f"<!-- Metadata:\n{meta_str}\n-->\n"
 
                 elif ext in ['.yaml', '.yml']:
-                    meta_lines = ['# Metadata:']
-                    for key, value in metadata.items():
-                        meta_lines.append(f'#   {key}: {value}')
-                    new_content = '\n'.join(meta_lines) + '\n\n' + content
+                    body = ''.join(f'#   {key}: {value}\n' for key, value in metadata.items())
+                    header = f'# Metadata:\n{body}\n'
 
                 else:
-                    meta_lines = ['# === Metadata ===']
-                    for key, value in metadata.items():
-                        meta_lines.append(f'# {key}: {value}')
-                    meta_lines.append('# ==================\n')
-                    new_content = '\n'.join(meta_lines) + '\n' + content
+                    body = ''.join(f'# {key}: {value}\n' for key, value in metadata.items())
+                    header = f'# === Metadata ===\n{body}# ==================\n\n'
 
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(new_content)
+                # Prepend the header and stream the original bytes after it
+                def _write(tmp_path):
+                    with open(file_path, 'rb') as src, open(tmp_path, 'wb') as dst:
+                        dst.write(header.encode('utf-8'))
+                        shutil.copyfileobj(src, dst, 1 << 20)
 
-                os.remove(backup_path)
-                return True, f"{ext.upper()} metadata written as header/comment"
-
-            except Exception as e:
-                if os.path.exists(backup_path):
-                    shutil.copy2(backup_path, file_path)
-                    os.remove(backup_path)
-                raise e
+            self._atomic_write(file_path, _write)
+            return True, f"{ext.upper()} metadata written as header/comment"
 
         except Exception as e:
             return False, f"Text file write failed: {str(e)}"
 
-    def write_office_metadata(self, file_path: str, metadata: dict) -> tuple[bool, str]:
+    def write_office_metadata(self, file_path: str, metadata: dict, ext: str | None = None) -> tuple[bool, str]:
         """Write metadata to Microsoft Office files.
         
         Supports DOCX files (Word). Sets core properties like Title, Author, Subject.
-        Creates backup before writing.
+        Writes through a temp file.
         
         Args:
             file_path (str): Path to the Office file.
             metadata (dict): Metadata dictionary to write.
+            ext (str | None): Lower-cased extension when the caller already has it.
             
         Returns:
             tuple: (success, message) - Boolean status and informational message.
         """
         try:
-            import docx
-            from docx.opc.coreprops import CoreProperties
-
-            ext = os.path.splitext(file_path)[1].lower()
-            backup_path = file_path + '.backup'
-            shutil.copy2(file_path, backup_path)
-
-            try:
-                if ext in ['.docx']:
-                    doc = docx.Document(file_path)
-                    props = doc.core_properties
-
-                    if 'Title' in metadata:
-                        props.title = metadata['Title']
-                    if 'Author' in metadata:
-                        props.author = metadata['Author']
-                    if 'Subject' in metadata:
-                        props.subject = metadata['Subject']
-                    if 'Keywords' in metadata:
-                        props.keywords = metadata['Keywords']
-                    if 'Comments' in metadata:
-                        props.comments = metadata['Comments']
-
-                    doc.save(file_path)
-                    os.remove(backup_path)
-                    return True, "DOCX metadata written successfully"
-                else:
-                    return False, f"{ext.upper()} metadata writing requires additional libraries"
-
-            except Exception as e:
-                if os.path.exists(backup_path):
-                    shutil.copy2(backup_path, file_path)
-                    os.remove(backup_path)
-                raise e
+            docx = _docx()
+
+            ext = ext or os.path.splitext(file_path)[1].lower()
+
+            if ext in ['.docx']:
+                doc = docx.Document(file_path)
+                props = doc.core_properties
+
+                if 'Title' in metadata:
+                    props.title = metadata['Title']
+                if 'Author' in metadata:
+                    props.author = metadata['Author']
+                if 'Subject' in metadata:
+                    props.subject = metadata['Subject']
+                if 'Keywords' in metadata:
+                    props.keywords = metadata['Keywords']
+                if 'Comments' in metadata:
+                    props.comments = metadata['Comments']
+
+                self._atomic_write(file_path, doc.save)
+                return True, "DOCX metadata written successfully"
+            else:
+                return False, f"{ext.upper()} metadata writing requires additional libraries"
 
         except ImportError:
             return False, "python-docx not installed. Run: pip install python-docx"
         except Exception as e:
             return False, f"Office file write failed: {str(e)}"
 
-    def write_generic_metadata(self, file_path: str, metadata: dict) -> tuple[bool, str]:
+    def write_generic_metadata(self, file_path: str, metadata: dict, ext: str | None = None) -> tuple[bool, str]:
         """Write metadata to any file type by creating a companion .meta.json file.
         
         Fallback method for file types that don't have native metadata support.
@@ -556,6 +744,7 @@ class MetadataEditor:
         Args:
             file_path (str): Path to the file.
             metadata (dict): Metadata dictionary to write.
+            ext (str | None): Ignored; accepted so every writer shares one dispatch signature.
             
         Returns:
             tuple: (success, message) - Boolean status and informational message.
@@ -569,8 +758,10 @@ class MetadataEditor:
                 'updated_at': datetime.now().isoformat()
             }
 
-            with open(meta_file, 'w', encoding='utf-8') as f:
-                json.dump(meta_data, f, indent=2)
+            # Serialize up front and hand the file one buffer instead of streaming chunks
+            payload = json.dumps(meta_data, indent=2).encode('utf-8')
+            with open(meta_file, 'wb') as f:
+                f.write(payload)
 
             return True, f"Metadata saved to companion file: {os.path.basename(meta_file)}"
 
@@ -591,69 +782,91 @@ class MetadataEditor:
 
 
 # Module-level wrapper instance and compatibility functions
-_editor = MetadataEditor()
+_default_editor = None
+_default_editor_lock = threading.Lock()
+
+
+def _get_editor() -> MetadataEditor:
+    """Return the shared MetadataEditor, creating it on first call."""
+    global _default_editor
+    if _default_editor is None:
+        with _default_editor_lock:
+            if _default_editor is None:
+                _default_editor = MetadataEditor()
+    return _default_editor
+
+
+def __getattr__(name):
+    if name == "_editor":
+        return _get_editor()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def parse_editor_text(text: str) -> dict:
     """Wrapper: Parse metadata text from editor into structured data."""
-    return _editor.parse_editor_text(text)
+    return _get_editor().parse_editor_text(text)
 
 
 def validate_metadata(parsed_data: dict) -> tuple[bool, str]:
     """Wrapper: Validate parsed metadata for required fields and format."""
-    return _editor.validate_metadata(parsed_data)
+    return _get_editor().validate_metadata(parsed_data)
 
 
 def save_edited_metadata(file_path: str, parsed_data: dict) -> tuple[bool, str]:
     """Wrapper: Save edited metadata back to the database."""
-    return _editor.save_edited_metadata(file_path, parsed_data)
+    return _get_editor().save_edited_metadata(file_path, parsed_data)
+
+
+def save_edited_metadata_many(items) -> list[tuple[bool, str]]:
+    """Wrapper: Save edited metadata for several files in one transaction."""
+    return _get_editor().save_edited_metadata_many(items)
 
 
 def get_editable_text(file_path: str, metadata: dict) -> str:
     """Wrapper: Build editable text format from file path and metadata dict."""
-    return _editor.get_editable_text(file_path, metadata)
+    return _get_editor().get_editable_text(file_path, metadata)
 
 
 def clear_editor() -> str:
     """Wrapper: Return empty editor placeholder text."""
-    return _editor.clear_editor()
+    return _get_editor().clear_editor()
 
 
 def write_metadata_to_file(file_path: str, metadata: dict) -> tuple[bool, str]:
     """Wrapper: Write metadata back to the source file based on file type."""
-    return _editor.write_metadata_to_file(file_path, metadata)
+    return _get_editor().write_metadata_to_file(file_path, metadata)
 
 
 def write_pdf_metadata(file_path: str, metadata: dict) -> tuple[bool, str]:
     """Wrapper: Write metadata to a PDF file."""
-    return _editor.write_pdf_metadata(file_path, metadata)
+    return _get_editor().write_pdf_metadata(file_path, metadata)
 
 
 def write_image_metadata(file_path: str, metadata: dict) -> tuple[bool, str]:
     """Wrapper: Write metadata to an image file."""
-    return _editor.write_image_metadata(file_path, metadata)
+    return _get_editor().write_image_metadata(file_path, metadata)
 
 
 def write_audio_metadata(file_path: str, metadata: dict) -> tuple[bool, str]:
     """Wrapper: Write metadata to an audio file."""
-    return _editor.write_audio_metadata(file_path, metadata)
+    return _get_editor().write_audio_metadata(file_path, metadata)
 
 
 def write_text_metadata(file_path: str, metadata: dict) -> tuple[bool, str]:
     """Wrapper: Write metadata to a text-based file."""
-    return _editor.write_text_metadata(file_path, metadata)
+    return _get_editor().write_text_metadata(file_path, metadata)
 
 
 def write_office_metadata(file_path: str, metadata: dict) -> tuple[bool, str]:
     """Wrapper: Write metadata to a Microsoft Office file."""
-    return _editor.write_office_metadata(file_path, metadata)
+    return _get_editor().write_office_metadata(file_path, metadata)
 
 
 def write_generic_metadata(file_path: str, metadata: dict) -> tuple[bool, str]:
     """Wrapper: Write metadata to a companion .meta.json file."""
-    return _editor.write_generic_metadata(file_path, metadata)
+    return _get_editor().write_generic_metadata(file_path, metadata)
 
 
 def can_write_metadata(file_path: str) -> bool:
     """Wrapper: Check if metadata can be written to this file type."""
-    return _editor.can_write_metadata(file_path)
+    return _get_editor().can_write_metadata(file_path)
@@ -1,11 +1,45 @@
 from hachoir.metadata import extractMetadata
 from hachoir.parser import createParser
 from PyPDF2 import PdfReader
+from PyPDF2.generic import create_string_object
+from collections import OrderedDict, deque
+from collections.abc import Sized
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, as_completed, wait
+from concurrent.futures.process import BrokenProcessPool
+import functools
+import itertools
 import mimetypes
+import mmap
+import operator
 import os
-from typing import Any, Callable, Iterable
+import queue
+import re
+import stat
+import threading
+from typing import Any, Callable, Iterable, Literal
 import db
 
+try:
+    import pypdfium2 as pdfium
+except ImportError:  # optional native PDF backend
+    pdfium = None
+
+if not mimetypes.inited:
+    mimetypes.init()
+
+# Extractor method for each extension, precomputed from the mimetypes table so
+# dispatch is one dict lookup; unlisted types go to _hachoir_metadata
+_EXT_HANDLERS = {
+    **{ext.lower(): '_text_metadata' for ext, mime in mimetypes.types_map.items() if mime.startswith('text')},
+    **dict.fromkeys(('.py', '.txt', '.cpp', '.c', '.java', '.js', '.json', '.csv', '.md', '.html', '.css'),
+                    '_text_metadata'),
+    **{ext.lower(): '_pdf_metadata' for ext, mime in mimetypes.types_map.items() if mime == 'application/pdf'},
+    '.pdf': '_pdf_metadata',
+}
+
+# Extractor method for each ``file_type`` hint accepted by extract()
+_TYPE_HANDLERS = {'pdf': '_pdf_metadata', 'text': '_text_metadata', 'media': '_hachoir_metadata'}
+
 
 class MetadataExtractor:
     """Object-oriented metadata extractor with optional DB persistence.
@@ -14,8 +48,84 @@ class MetadataExtractor:
     hachoir and PyPDF2 libraries. Can optionally persist extracted metadata to database.
     """
 
+    # Below this many files a process pool's startup cost outweighs the speedup
+    PARALLEL_MIN_FILES = 8
+    # In-process batches ask the kernel to start reading this many files ahead
+    READAHEAD_FILES = 16
+    # Files submitted to the pool per worker before waiting for one to finish
+    POOL_BACKLOG = 4
+    # Successful extractions remembered per (path, mtime, size)
+    CACHE_SIZE = 512
+    # Extracted results waiting for the batch DB writer before extraction blocks
+    WRITE_QUEUE_SIZE = 1024
+    # Rows the batch DB writer commits together with ``insert_metadata_many``
+    WRITE_BATCH_SIZE = 256
+
     def __init__(self, db_client: db.MetadataDatabase | None = None) -> None:
-        self.db_client = db_client or db.db_manager
+        self._db_client = db_client
+        self._cache: OrderedDict = OrderedDict()
+
+    @property
+    def db_client(self) -> db.MetadataDatabase:
+        """Database client; falls back to the shared ``db.db_manager`` on first use.
+        
+        Resolved lazily so pool workers, which only extract, never open the database.
+        """
+        if self._db_client is None:
+            self._db_client = db.db_manager
+        return self._db_client
+
+    @db_client.setter
+    def db_client(self, client: db.MetadataDatabase) -> None:
+        self._db_client = client
+
+    @staticmethod
+    def _cache_key(file_path: str, st: os.stat_result | None = None):
+        """Return the cache key for a file's current contents, or None if it can't be stat'ed."""
+        if st is None:
+            try:
+                st = os.stat(file_path)
+            except (OSError, ValueError, TypeError):
+                return None
+        return os.path.abspath(file_path), st.st_mtime_ns, st.st_size
+
+    def _cache_get(self, key):
+        """Return the cached metadata for ``key`` (refreshing its LRU position), or None."""
+        if key is None:
+            return None
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+        return cached
+
+    def _cache_put(self, key, metadata: dict[str, Any]) -> None:
+        """Remember a successful extraction, evicting the least recently used entry."""
+        if key is None or not isinstance(metadata, dict) or "Error" in metadata:
+            return
+        self._cache[key] = dict(metadata)
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+
+    @staticmethod
+    def _stat_file(file_path: str) -> tuple[os.stat_result | None, str]:
+        """Stat a path once and check that it is a regular file.
+        
+        Args:
+            file_path (str): Path to validate.
+            
+        Returns:
+            tuple: (os.stat_result or None, str) - (stat result if valid, error_message)
+        """
+        if not file_path:
+            return None, "No file path provided."
+        try:
+            st = os.stat(file_path)
+        except (OSError, ValueError):
+            return None, f"File not found: {file_path}"
+        if not stat.S_ISREG(st.st_mode):
+            return None, f"Path is not a file: {file_path}"
+        return st, ""
 
     @staticmethod
     def _validate_file_path(file_path: str) -> tuple[bool, str]:
@@ -27,13 +137,8 @@ class MetadataExtractor:
         Returns:
             tuple: (bool, str) - (is_valid, error_message)
         """
-        if not file_path:
-            return False, "No file path provided."
-        if not os.path.exists(file_path):
-            return False, f"File not found: {file_path}"
-        if not os.path.isfile(file_path):
-            return False, f"Path is not a file: {file_path}"
-        return True, ""
+        st, error = MetadataExtractor._stat_file(file_path)
+        return st is not None, error
 
     def extract_pdf_metadata(self, file_path: str) -> dict[str, Any]:
         """Extract metadata from a PDF file.
@@ -47,13 +152,18 @@ class MetadataExtractor:
         is_valid, error = self._validate_file_path(file_path)
         if not is_valid:
             return {"Error": error}
+        return self._pdf_metadata(file_path)
 
+    @staticmethod
+    def _pdf_metadata(file_path: str, st: os.stat_result | None = None) -> dict[str, Any]:
+        """PDF extraction body for an already validated path."""
         try:
-            reader = PdfReader(file_path)
-            info = reader.metadata or {}
-            meta_dict = {k[1:]: v for k, v in info.items()}
-            meta_dict["Pages"] = len(reader.pages)
-            return meta_dict
+            meta_dict = _fast_pdf_info(file_path)
+            if meta_dict is None and pdfium is not None:
+                meta_dict = _pdfium_info(file_path)
+            if meta_dict is not None:
+                return meta_dict
+            return _pdf_reader_info(file_path)
         except Exception as e:
             return {"Error": f"PDF extraction failed: {e}"}
 
@@ -66,57 +176,80 @@ class MetadataExtractor:
         Returns:
             dict: Dictionary with file size, line count, and encoding, or {'Error': message} on failure.
         """
-        is_valid, error = self._validate_file_path(file_path)
-        if not is_valid:
+        st, error = self._stat_file(file_path)
+        if st is None:
             return {"Error": error}
+        return self._text_metadata(file_path, st)
 
+    @staticmethod
+    def _text_metadata(file_path: str, st: os.stat_result) -> dict[str, Any]:
+        """Text extraction body for a path already stat'ed by ``_stat_file``."""
         try:
-            with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                lines = f.readlines()
-            stat = os.stat(file_path)
-            return {"File Size (bytes)": stat.st_size, "Line Count": len(lines), "Encoding": "utf-8"}
+            line_count = _count_lines(file_path)
+            return {"File Size (bytes)": st.st_size, "Line Count": line_count, "Encoding": "utf-8"}
         except Exception as e:
             return {"Error": f"Text extraction failed: {e}"}
 
-    def extract(self, file_path: str) -> dict[str, Any]:
+    def extract(self, file_path: str, file_type: Literal["pdf", "text", "media"] | None = None) -> dict[str, Any]:
         """Extract metadata from any supported file type.
         
         Automatically detects file type and uses appropriate extraction method
-        (PDF, text, or hachoir parser for media files).
+        (PDF, text, or hachoir parser for media files). Results for a file whose
+        path, mtime and size are unchanged are served from an LRU cache.
         
         Args:
             file_path (str): Path to the file.
+            file_type (str, optional): 'pdf', 'text' or 'media' to skip type detection.
             
         Returns:
             dict: Extracted metadata dictionary, or {'Error': message} on failure.
         """
-        is_valid, error = self._validate_file_path(file_path)
-        if not is_valid:
+        if file_type is not None and file_type not in _TYPE_HANDLERS:
+            return {"Error": f"Unknown file type: {file_type}"}
+        st, error = self._stat_file(file_path)
+        if st is None:
             return {"Error": error}
 
-        mime_type, _ = mimetypes.guess_type(file_path)
-        ext = os.path.splitext(file_path)[1].lower()
-
-        if ext == ".pdf" or (mime_type and mime_type == "application/pdf"):
-            return self.extract_pdf_metadata(file_path)
+        key = self._cache_key(file_path, st)
+        if key is not None and file_type is not None:
+            key += (file_type,)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return dict(cached)
+
+        if file_type is None:
+            metadata = self._extract_uncached(file_path, st)
+        else:
+            metadata = getattr(self, _TYPE_HANDLERS[file_type])(file_path, st)
+        self._cache_put(key, metadata)
+        return metadata
+
+    def _extract_uncached(self, file_path: str, st: os.stat_result) -> dict[str, Any]:
+        """Detect the file type and run the matching extractor, bypassing the cache."""
+        handler = getattr(self, _EXT_HANDLERS.get(os.path.splitext(file_path)[1].lower(), '_hachoir_metadata'))
+        return handler(file_path, st)
 
-        text_exts = {".py", ".txt", ".cpp", ".c", ".java", ".js", ".json", ".csv", ".md", ".html", ".css"}
-        if ext in text_exts or (mime_type and mime_type.startswith("text")):
-            return self.extract_text_metadata(file_path)
+    @staticmethod
+    def _hachoir_metadata(file_path: str, st: os.stat_result | None = None) -> dict[str, Any]:
+        """Media/other extraction body for an already validated path, via hachoir.
+        
+        Extensions no hachoir parser claims (``.docx`` is really a zip) are
+        only parsed when the file starts with a signature some parser knows;
+        otherwise they are rejected without building a parser. Files without
+        an extension are still guessed from their content.
+        """
+        ext = os.path.splitext(file_path)[1].lower()
+        if ext and ext not in _hachoir_exts() and not _has_hachoir_magic(file_path):
+            return {"Error": f"Unsupported file type: {ext}"}
 
         try:
             parser = createParser(file_path)
             if not parser:
                 return {"Error": "Unable to parse the file (unsupported or corrupted)."}
-            metadata = extractMetadata(parser)
-            if not metadata:
-                return {"Error": "No metadata found."}
-            meta_dict = {}
-            for item in metadata.exportPlaintext():
-                if ": " in item:
-                    key, value = item.split(": ", 1)
-                    meta_dict[key.strip()] = value.strip()
-            return meta_dict
+            # Close the input stream now rather than whenever the parser is collected
+            with parser:
+                meta_dict = _hachoir_dict(extractMetadata(parser))
+            return meta_dict or {"Error": "No metadata found."}
         except Exception as e:
             return {"Error": f"An error occurred: {e}"}
 
@@ -147,45 +280,152 @@ class MetadataExtractor:
 
         return metadata, db_row
 
-    def batch_extract(self, file_paths: Iterable[str], progress_callback: Callable[[str, float], None] | None = None) -> dict[str, Any]:
+    def _iter_extractions(self, jobs: Iterable[tuple[int, str]], max_workers: int):
+        """Yield ``(index, file_path, get_result)`` as extraction results become available.
+        
+        ``jobs`` is consumed lazily. Once ``PARALLEL_MIN_FILES`` uncached files
+        have been seen they are spread over a process pool and yielded in
+        completion order; short inputs, ``max_workers <= 1`` or platforms without
+        working process support run in-process and in input order. ``get_result``
+        returns the metadata dict or raises the extraction error.
+        """
+        jobs = iter(jobs)
+
+        if max_workers > 1:
+            # Workers have their own caches, so unchanged files are answered here first
+            misses = []
+            for i, path in jobs:
+                key = self._cache_key(path)
+                cached = self._cache_get(key)
+                if cached is not None:
+                    yield i, path, functools.partial(dict, cached)
+                    continue
+                misses.append((i, path, key))
+                if len(misses) >= self.PARALLEL_MIN_FILES:
+                    break
+
+            if len(misses) >= self.PARALLEL_MIN_FILES:
+                try:
+                    executor = ProcessPoolExecutor(max_workers=max_workers, initializer=_worker_init)
+                except (OSError, NotImplementedError):
+                    executor = None
+                if executor is not None:
+                    yield from self._iter_pool(executor, misses, jobs, max_workers)
+                    return
+            jobs = itertools.chain(((i, path) for i, path, _ in misses), jobs)
+
+        window = deque()
+        for job in jobs:
+            _readahead(job[1])
+            window.append(job)
+            if len(window) > self.READAHEAD_FILES:
+                i, path = window.popleft()
+                yield i, path, functools.partial(self.extract, path)
+        for i, path in window:
+            yield i, path, functools.partial(self.extract, path)
+
+    def _iter_pool(self, executor: ProcessPoolExecutor, misses: list, jobs, max_workers: int):
+        """Pool branch of ``_iter_extractions``: keep at most ``POOL_BACKLOG`` files per worker in flight."""
+        in_flight = {}
+
+        def _result(future, path, key):
+            try:
+                metadata = future.result()
+            except BrokenProcessPool:
+                return self.extract(path)
+            self._cache_put(key, metadata)
+            return metadata
+
+        def _finished(futures):
+            for future in futures:
+                i, path, key = in_flight.pop(future)
+                yield i, path, functools.partial(_result, future, path, key)
+
+        with executor:
+            for i, path, key in itertools.chain(misses, ((i, path, None) for i, path in jobs)):
+                if key is None:
+                    key = self._cache_key(path)
+                    cached = self._cache_get(key)
+                    if cached is not None:
+                        yield i, path, functools.partial(dict, cached)
+                        continue
+                try:
+                    in_flight[executor.submit(_extract_one, path)] = (i, path, key)
+                except (BrokenProcessPool, RuntimeError):
+                    yield i, path, functools.partial(self.extract, path)
+                    continue
+                if len(in_flight) >= max_workers * self.POOL_BACKLOG:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    yield from _finished(done)
+            yield from _finished(as_completed(list(in_flight)))
+
+    def batch_extract(self, file_paths: Iterable[str], progress_callback: Callable[[str, float], None] | None = None,
+                      max_workers: int | None = None, total: int | None = None) -> dict[str, Any]:
         """Extract metadata from multiple files with optional progress reporting.
         
+        Extraction runs in worker processes (see ``PARALLEL_MIN_FILES``); results
+        are stored through ``db_client`` from this process only, by a writer
+        thread that runs while the next files are extracted. ``file_paths`` is
+        consumed lazily, so a generator (e.g. over ``os.walk``) starts being
+        extracted before it is exhausted.
+        
         Args:
             file_paths (Iterable[str]): List/iterable of file paths to extract.
             progress_callback (Callable, optional): Callback function(filename, progress_percent) for progress updates.
+                When the total is unknown the second argument is the number of files processed so far.
+            max_workers (int, optional): Worker process limit (default: ``min(32, os.cpu_count())``).
+                Use 1 to extract in-process.
+            total (int, optional): Expected number of files, for progress on unsized iterables.
             
         Returns:
-            dict: Summary with 'successful', 'failed', 'total' counts and 'results' list.
+            dict: Summary with 'successful', 'failed', 'total' counts and 'results' list
+                (in input order).
         """
-        successful_extractions = 0
-        failed_extractions = 0
+        if total is None and isinstance(file_paths, Sized):
+            total = len(file_paths)
         results = []
-        file_paths = list(file_paths)
-        total_files = len(file_paths)
+        if max_workers is None:
+            max_workers = min(32, os.cpu_count() or 1)
 
-        safe_progress_callback = progress_callback
-        for i, file_path in enumerate(file_paths):
-            try:
-                if safe_progress_callback:
-                    progress = (i / total_files) * 100 if total_files else 0
-                    try:
-                        safe_progress_callback(f"Processing: {os.path.basename(file_path)}", progress)
-                    except Exception:
-                        safe_progress_callback = None
-
-                meta_dict = self.extract(file_path)
-
-                if meta_dict and "Error" not in meta_dict:
-                    row = self.db_client.insert_metadata(file_path, meta_dict)
-                    results.append({"file_path": file_path, "status": "success", "data": row})
-                    successful_extractions += 1
-                else:
-                    results.append({"file_path": file_path, "status": "failed", "error": meta_dict.get("Error", "Unknown error")})
-                    failed_extractions += 1
+        def _numbered():
+            for i, path in enumerate(file_paths):
+                results.append(None)
+                yield i, path
 
-            except Exception as e:
-                results.append({"file_path": file_path, "status": "failed", "error": str(e)})
-                failed_extractions += 1
+        pending = queue.Queue(maxsize=self.WRITE_QUEUE_SIZE)
+        writer = threading.Thread(target=self._store_pending, args=(pending, results), daemon=True)
+        writer.start()
+
+        safe_progress_callback = progress_callback
+        try:
+            for done, (i, file_path, get_result) in enumerate(self._iter_extractions(_numbered(), max_workers)):
+                try:
+                    if safe_progress_callback:
+                        if total is None:
+                            progress = done
+                        else:
+                            progress = (done / total) * 100 if total else 0
+                        try:
+                            safe_progress_callback(f"Processing: {os.path.basename(file_path)}", progress)
+                        except Exception:
+                            safe_progress_callback = None
+
+                    meta_dict = get_result()
+
+                    if meta_dict and "Error" not in meta_dict:
+                        pending.put((i, file_path, meta_dict))
+                    else:
+                        results[i] = {"file_path": file_path, "status": "failed", "error": meta_dict.get("Error", "Unknown error")}
+
+                except Exception as e:
+                    results[i] = {"file_path": file_path, "status": "failed", "error": str(e)}
+        finally:
+            pending.put(None)
+            writer.join()
+
+        total_files = len(results)
+        successful_extractions = sum(1 for result in results if result and result["status"] == "success")
+        failed_extractions = total_files - successful_extractions
 
         if safe_progress_callback:
             try:
@@ -195,6 +435,447 @@ class MetadataExtractor:
 
         return {"successful": successful_extractions, "failed": failed_extractions, "total": total_files, "results": results}
 
+    def _store_pending(self, pending: queue.Queue, results: list) -> None:
+        """DB-writer stage of ``batch_extract``: store queued results until a None sentinel.
+        
+        Whatever is queued (up to ``WRITE_BATCH_SIZE``) is committed in one
+        ``insert_metadata_many`` call. If that fails, the batch is retried row by
+        row so the error is reported against the file that caused it. Any other
+        error fails the whole batch but the queue keeps draining, so the
+        producer never blocks on a full queue.
+        
+        Args:
+            pending (queue.Queue): ``(index, file_path, metadata)`` items, then None.
+            results (list): Batch results list, filled in at each item's index.
+        """
+        done = False
+        while not done:
+            item = pending.get()
+            if item is None:
+                return
+            batch = [item]
+            while len(batch) < self.WRITE_BATCH_SIZE:
+                try:
+                    item = pending.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    done = True
+                    break
+                batch.append(item)
+
+            try:
+                self._store_batch(batch, results)
+            except Exception as e:
+                for i, file_path, _ in batch:
+                    if results[i] is None:
+                        results[i] = {"file_path": file_path, "status": "failed", "error": str(e)}
+
+    def _store_batch(self, batch: list, results: list) -> None:
+        """Store one batch of ``(index, file_path, metadata)`` items for ``_store_pending``.
+        
+        Args:
+            batch (list): Items taken from the writer queue.
+            results (list): Batch results list, filled in at each item's index.
+        """
+        rows = None
+        insert_many = getattr(self.db_client, "insert_metadata_many", None)
+        if insert_many is not None and len(batch) > 1:
+            try:
+                rows = insert_many([(file_path, meta_dict) for _, file_path, meta_dict in batch])
+            except Exception:
+                rows = None
+        if rows is not None:
+            for (i, file_path, _), row in zip(batch, rows):
+                results[i] = {"file_path": file_path, "status": "success", "data": row}
+            return
+
+        for i, file_path, meta_dict in batch:
+            try:
+                row = self.db_client.insert_metadata(file_path, meta_dict)
+                results[i] = {"file_path": file_path, "status": "success", "data": row}
+            except Exception as e:
+                results[i] = {"file_path": file_path, "status": "failed", "error": str(e)}
+
+
+_COUNT_CHUNK = 1 << 20
+_BY_PRIORITY = operator.attrgetter("priority")
+
+
+@functools.cache
+def _hachoir_exts() -> frozenset[str]:
+    """Return the extensions (``'.mp3'``, ...) registered by hachoir's parsers, loaded on first use."""
+    from hachoir.parser.parser_list import HachoirParserList
+
+    exts = set()
+    for parser in HachoirParserList.getInstance():
+        for ext in parser.PARSER_TAGS.get("file_ext", ()):
+            if ext.strip("."):
+                exts.add("." + ext.lstrip(".").lower())
+    return frozenset(exts)
+
+
+@functools.cache
+def _hachoir_magics() -> tuple[tuple[tuple[int, bytes], ...], int]:
+    """Return hachoir's ``(byte_offset, signature)`` magics and how many header bytes cover them."""
+    from hachoir.parser.parser_list import HachoirParserList
+
+    magics = set()
+    for parser in HachoirParserList.getInstance():
+        for magic in parser.PARSER_TAGS.get("magic", ()):
+            signature, bit_offset = (magic + (0,))[:2]
+            if signature and bit_offset % 8 == 0:
+                magics.add((bit_offset // 8, signature))
+    header_size = max((offset + len(signature) for offset, signature in magics), default=0)
+    return tuple(sorted(magics)), header_size
+
+
+def _has_hachoir_magic(file_path: str) -> bool:
+    """Return True if the file's header matches a signature registered by a hachoir parser."""
+    magics, header_size = _hachoir_magics()
+    try:
+        with open(file_path, "rb") as f:
+            header = f.read(header_size)
+    except OSError:
+        return False
+    return any(header.startswith(signature, offset) for offset, signature in magics)
+
+
+def _hachoir_dict(metadata) -> dict[str, str]:
+    """Flatten hachoir metadata (root and groups) into a plain dict of strings.
+    
+    Items are read directly, keyed the way ``exportPlaintext()`` lines
+    (``"- Description: text"``) used to split; later values and groups win.
+    Only the returned dict outlives the call.
+    """
+    meta_dict = {}
+    if not metadata:
+        return meta_dict
+    groups = metadata.iterGroups() if hasattr(metadata, "iterGroups") else ()
+    for node in (metadata, *groups):
+        for data in sorted(node, key=_BY_PRIORITY):
+            if data.values:
+                meta_dict[f"- {data.description}"] = data.values[-1].text.strip()
+    return meta_dict
+
+
+def _count_lines(file_path: str) -> int:
+    """Count lines the way text-mode ``readlines()`` would, without decoding.
+    
+    ``\n``, ``\r\n`` and a lone ``\r`` each end a line and a final unterminated
+    line counts too. The file is scanned in 1 MiB binary chunks with
+    ``bytes.count``, so memory stays flat regardless of file size.
+    """
+    lines = 0
+    prev_cr = False
+    last = b""
+    with open(file_path, "rb", buffering=0) as f:
+        while chunk := f.read(_COUNT_CHUNK):
+            lines += chunk.count(b"\n") + chunk.count(b"\r") - chunk.count(b"\r\n")
+            if prev_cr and chunk[:1] == b"\n":
+                # A \r\n split across chunks was counted once for each half
+                lines -= 1
+            last = chunk[-1:]
+            prev_cr = last == b"\r"
+    if last and last not in (b"\n", b"\r"):
+        lines += 1
+    return lines
+
+
+_PDF_WHITESPACE = b" \t\r\n\f\x00"
+_PDF_REGULAR = re.compile(rb"[^\s()<>\[\]{}/%]+")
+_PDF_REF = re.compile(rb"(\d+)\s+(\d+)\s+R(?![^\s()<>\[\]{}/%])")
+_PDF_OBJ = re.compile(rb"\s*(\d+)\s+(\d+)\s+obj")
+_PDF_XREF = re.compile(rb"\s*xref")
+_PDF_SUBSECTION = re.compile(rb"\s*(\d+)[ \t]+(\d+)[ \t]*(?:\r\n|\r|\n)")
+_PDF_XREF_ENTRY = re.compile(rb"(\d{10}) (\d{5}) ([nf])")
+_PDF_TRAILER = re.compile(rb"\s*trailer")
+_PDF_NAME_ESCAPE = re.compile(rb"#([0-9A-Fa-f]{2})")
+_PDF_ESCAPES = {ord("n"): 0x0A, ord("r"): 0x0D, ord("t"): 0x09, ord("b"): 0x08, ord("f"): 0x0C}
+
+
+def _fast_pdf_info(file_path: str) -> dict[str, Any] | None:
+    """Read a PDF's Info dictionary and page count straight from its trailer.
+    
+    The file is memory-mapped, ``startxref`` is found from the end, and only the
+    trailer, the catalog, the root ``/Pages`` node and the Info dictionary are
+    parsed, so the cost doesn't grow with the number of pages. Only classic
+    xref tables are understood; xref streams, encrypted files and anything
+    unexpected return None so the caller can fall back to ``PdfReader``.
+    """
+    try:
+        with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            return _parse_pdf_info(buf)
+    except Exception:
+        return None
+
+
+def _parse_pdf_info(buf) -> dict[str, Any] | None:
+    """Parse the trailer-reachable metadata of a PDF held in ``buf`` (see ``_fast_pdf_info``)."""
+    tail = buf.rfind(b"startxref")
+    if tail < 0:
+        return None
+    pos, _ = _pdf_value(buf, tail + len(b"startxref"))
+
+    # Newest section first, following /Prev through incremental updates
+    sections = []
+    trailer = {}
+    seen = set()
+    while isinstance(pos, int) and pos not in seen:
+        seen.add(pos)
+        section_trailer = _pdf_xref_section(buf, pos, sections)
+        for key, value in section_trailer.items():
+            trailer.setdefault(key, value)
+        pos = section_trailer.get("/Prev")
+    if "/Encrypt" in trailer:
+        return None
+
+    def resolve(value):
+        for _ in range(32):
+            if not isinstance(value, tuple):
+                return value
+            value = _pdf_object(buf, sections, value)
+        raise ValueError("reference chain too long")
+
+    pages = resolve(resolve(trailer["/Root"])["/Pages"])
+    count = resolve(pages["/Count"])
+    if type(count) is not int:
+        return None
+
+    info = resolve(trailer["/Info"]) if "/Info" in trailer else {}
+    meta_dict = {}
+    for key, value in info.items():
+        value = resolve(value)
+        if isinstance(value, bytes):
+            value = create_string_object(value)
+        elif isinstance(value, (dict, list)):
+            return None
+        meta_dict[key[1:]] = value
+    meta_dict["Pages"] = count
+    return meta_dict
+
+
+def _pdfium_info(file_path: str) -> dict[str, Any] | None:
+    """Read a PDF's standard Info keys and page count with PDFium, or None if it can't open it."""
+    try:
+        pdf = pdfium.PdfDocument(file_path)
+    except Exception:
+        return None
+    try:
+        meta_dict = dict(pdf.get_metadata_dict(skip_empty=True))
+        meta_dict["Pages"] = len(pdf)
+        return meta_dict
+    except Exception:
+        return None
+    finally:
+        pdf.close()
+
+
+def _pdf_reader_info(file_path: str) -> dict[str, Any]:
+    """Read a PDF's metadata and page count with PyPDF2 over a memory map of the file.
+    
+    Given a path, ``PdfReader`` copies the whole file into a ``BytesIO``; a
+    read-only ``mmap`` gives it the same random access straight from the page
+    cache. Values are resolved before the map is closed. Files that can't be
+    mapped (e.g. empty ones) are read through the file object instead.
+    """
+    with open(file_path, "rb") as f:
+        try:
+            stream = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            stream = f
+        try:
+            reader = PdfReader(stream)
+            info = reader.metadata or {}
+            meta_dict = {k[1:]: info[k] for k in info}
+            meta_dict["Pages"] = len(reader.pages)
+            return meta_dict
+        finally:
+            if stream is not f:
+                stream.close()
+
+
+def _pdf_xref_section(buf, pos: int, sections: list) -> dict:
+    """Index one classic xref section at ``pos`` into ``sections`` and return its trailer.
+    
+    Subsections are recorded as ``(first, count, offset)`` and entries are read
+    on demand, relying on their fixed 20-byte width.
+    """
+    match = _PDF_XREF.match(buf, pos)
+    if match is None:
+        raise ValueError("not a classic xref table")
+    pos = match.end()
+    while (match := _PDF_SUBSECTION.match(buf, pos)) is not None:
+        first, count = int(match.group(1)), int(match.group(2))
+        sections.append((first, count, match.end()))
+        pos = match.end() + 20 * count
+    match = _PDF_TRAILER.match(buf, pos)
+    if match is None:
+        raise ValueError("trailer not found")
+    trailer, _ = _pdf_value(buf, match.end())
+    return trailer
+
+
+def _pdf_object(buf, sections: list, ref: tuple):
+    """Return the value of indirect object ``ref`` using the indexed xref sections."""
+    num, gen = ref
+    for first, count, start in sections:
+        if first <= num < first + count:
+            entry = _PDF_XREF_ENTRY.match(buf, start + 20 * (num - first))
+            if entry is None or entry.group(3) != b"n":
+                break
+            match = _PDF_OBJ.match(buf, int(entry.group(1)))
+            if match is None or (int(match.group(1)), int(match.group(2))) != (num, gen):
+                break
+            return _pdf_value(buf, match.end())[0]
+    raise KeyError(f"object {num} {gen} not found")
+
+
+def _pdf_skip(buf, pos: int) -> int:
+    """Skip whitespace and comments starting at ``pos``."""
+    while True:
+        c = buf[pos]
+        if c in _PDF_WHITESPACE:
+            pos += 1
+        elif c == 0x25:  # %
+            while buf[pos] not in b"\r\n":
+                pos += 1
+        else:
+            return pos
+
+
+def _pdf_value(buf, pos: int):
+    """Parse one PDF object at ``pos`` and return ``(value, end)``.
+    
+    Dictionaries become dicts, arrays lists, names ``'/Name'`` strings, strings
+    raw bytes and indirect references ``(num, gen)`` tuples.
+    """
+    pos = _pdf_skip(buf, pos)
+    c = buf[pos]
+    if c == 0x2F:  # /
+        match = _PDF_REGULAR.match(buf, pos + 1)
+        end = match.end() if match else pos + 1
+        name = buf[pos:end]
+        if b"#" in name:
+            name = _PDF_NAME_ESCAPE.sub(lambda m: bytes.fromhex(m.group(1).decode()), name)
+        return name.decode("latin-1"), end
+    if c == 0x3C and buf[pos + 1] == 0x3C:  # <<
+        result = {}
+        pos += 2
+        while True:
+            pos = _pdf_skip(buf, pos)
+            if buf[pos:pos + 2] == b">>":
+                return result, pos + 2
+            key, pos = _pdf_value(buf, pos)
+            if not isinstance(key, str) or not key.startswith("/"):
+                raise ValueError("dictionary key is not a name")
+            result[key], pos = _pdf_value(buf, pos)
+    if c == 0x3C:  # <hex string>
+        end = buf.find(b">", pos)
+        digits = re.sub(rb"\s", b"", buf[pos + 1:end])
+        if len(digits) % 2:
+            digits += b"0"
+        return bytes.fromhex(digits.decode("ascii")), end + 1
+    if c == 0x28:  # (literal string)
+        return _pdf_literal(buf, pos + 1)
+    if c == 0x5B:  # [
+        result = []
+        pos += 1
+        while True:
+            pos = _pdf_skip(buf, pos)
+            if buf[pos] == 0x5D:
+                return result, pos + 1
+            value, pos = _pdf_value(buf, pos)
+            result.append(value)
+    match = _PDF_REF.match(buf, pos)
+    if match is not None:
+        return (int(match.group(1)), int(match.group(2))), match.end()
+    match = _PDF_REGULAR.match(buf, pos)
+    if match is None:
+        raise ValueError(f"unexpected byte {c:#x} at {pos}")
+    token = match.group()
+    if token in (b"true", b"false"):
+        return token == b"true", match.end()
+    if token == b"null":
+        return None, match.end()
+    try:
+        return int(token), match.end()
+    except ValueError:
+        return float(token), match.end()
+
+
+def _pdf_literal(buf, pos: int) -> tuple[bytes, int]:
+    """Decode a literal string whose opening parenthesis ends just before ``pos``."""
+    out = bytearray()
+    depth = 1
+    while True:
+        c = buf[pos]
+        pos += 1
+        if c == 0x5C:  # backslash
+            c = buf[pos]
+            pos += 1
+            if 0x30 <= c <= 0x37:
+                code = c - 0x30
+                for _ in range(2):
+                    if not 0x30 <= buf[pos] <= 0x37:
+                        break
+                    code = code * 8 + buf[pos] - 0x30
+                    pos += 1
+                out.append(code & 0xFF)
+            elif c == 0x0D:  # line continuation
+                if buf[pos] == 0x0A:
+                    pos += 1
+            elif c != 0x0A:
+                out.append(_PDF_ESCAPES.get(c, c))
+            continue
+        if c == 0x28:
+            depth += 1
+        elif c == 0x29:
+            depth -= 1
+            if depth == 0:
+                return bytes(out), pos
+        out.append(c)
+
+
+def _readahead(file_path: str) -> None:
+    """Hint the kernel to start reading a file in the background (POSIX only).
+    
+    Queuing upcoming files with ``POSIX_FADV_WILLNEED`` keeps several reads in
+    flight while the current file is parsed, so a batch waits roughly on the
+    slowest read instead of the sum of them. Errors are ignored; the read that
+    follows reports them.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+    except (OSError, ValueError, TypeError):
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _worker_init() -> None:
+    """Process-pool initializer: give the worker its own extractor and load hachoir's parsers.
+    
+    A forked worker would otherwise share the parent's module-level extractor,
+    including any database client assigned to it. Loading the parser registry
+    here moves that cost to worker start-up instead of the first file.
+    """
+    global _extractor
+    _extractor = MetadataExtractor()
+    _hachoir_exts()
+    _hachoir_magics()
+
+
+def _extract_one(file_path: str) -> dict[str, Any]:
+    """Process-pool entry point: extract one file with the worker's module-level extractor."""
+    return _extractor.extract(file_path)
+
 
 _extractor = MetadataExtractor()
 
@@ -210,9 +891,9 @@ def extract_text_metadata(file_path):
     return _extractor.extract_text_metadata(file_path)
 
 
-def extract(file_path):
+def extract(file_path, file_type=None):
     """Wrapper: Extract metadata from any supported file type."""
-    return _extractor.extract(file_path)
+    return _extractor.extract(file_path, file_type)
 
 
 def extract_and_store(file_path):
@@ -220,6 +901,6 @@ def extract_and_store(file_path):
     return _extractor.extract_and_store(file_path)
 
 
-def batch_extract(file_paths, progress_callback=None):
+def batch_extract(file_paths, progress_callback=None, max_workers=None, total=None):
     """Wrapper: Extract metadata from multiple files with optional progress reporting."""
-    return _extractor.batch_extract(file_paths, progress_callback)
+    return _extractor.batch_extract(file_paths, progress_callback, max_workers, total)
@@ -8,17 +8,23 @@ from tkinter import Menu, filedialog
 from tkinter import ttk
 from tkinter import scrolledtext
 from tkinter import messagebox
+from tkinter import font as tkfont
 import os
 import json
 import tempfile
+import hashlib
+import math
+import time
+import functools
 import db
 import report
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
 from datetime import datetime, timedelta
-from collections import defaultdict, Counter
+from collections import OrderedDict, defaultdict, Counter
 import threading
+import concurrent.futures
 
 # Try importing extractor module for metadata extraction
 try:
@@ -38,6 +44,83 @@ try:
 except ImportError:  # pragma: no cover - optional dependency
     risk_analyzer = None
 
+# Try importing orjson for faster JSON exports
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# Try importing Pillow for the report image preview and zoom
+try:
+    from PIL import Image, ImageTk
+except ImportError:  # pragma: no cover - optional dependency
+    Image = ImageTk = None
+
+# Try importing pdf2image for rasterizing report previews
+try:
+    from pdf2image import convert_from_path
+except ImportError:  # pragma: no cover - optional dependency
+    convert_from_path = None
+
+
+@functools.lru_cache(maxsize=4096)
+def _humanize(dt_str: str) -> str:
+    """Format a stored ISO timestamp for display, e.g. ``Jan 05, 2024 03:07 PM``.
+    
+    History reloads format the same timestamps over and over, so results are
+    memoized. Unparseable values are returned unchanged.
+    """
+    return db.MetadataDatabase.format_timestamp(dt_str)
+
+
+def _build_preview_pyramid(img, levels: int = 4, min_side: int = 64) -> list:
+    """Return ``[img, img/2, img/4, ...]`` for rendering zoomed previews.
+    
+    Args:
+        img (PIL.Image.Image): Full-resolution preview image.
+        levels (int): Maximum number of levels, including ``img`` itself.
+        min_side (int): Stop halving once the shorter side would drop below this.
+        
+    Returns:
+        list: Images ordered from largest to smallest.
+    """
+    pyramid = [img]
+    while len(pyramid) < levels:
+        width, height = pyramid[-1].size
+        if min(width, height) // 2 < min_side:
+            break
+        pyramid.append(pyramid[-1].resize((width // 2, height // 2), Image.Resampling.BILINEAR))
+    return pyramid
+
+
+def _integer_zoom_step(factor: float):
+    """Return ``("zoom", n)`` or ``("subsample", n)`` when ``factor`` is ``n`` or ``1/n``.
+    
+    Returns None for 1.0 and for factors Tk cannot scale natively.
+    """
+    if factor >= 1.0:
+        n = round(factor)
+        if n >= 2 and abs(factor - n) < 0.01:
+            return ("zoom", n)
+    elif factor > 0:
+        n = round(1 / factor)
+        if n >= 2 and abs(factor * n - 1) < 0.01:
+            return ("subsample", n)
+    return None
+
+
+def _pick_mipmap(pyramid: list, target_size: tuple, oversample: float = 1.5):
+    """Return the smallest pyramid level at least ``oversample`` times ``target_size``.
+    
+    Falls back to the full-resolution image when no reduced level is big enough.
+    """
+    target_width, target_height = target_size
+    for level in reversed(pyramid):
+        width, height = level.size
+        if width >= target_width * oversample and height >= target_height * oversample:
+            return level
+    return pyramid[0]
+
 
 class MetadataAnalyzerApp:
     """Class-based GUI application for TraceLens.
@@ -51,6 +134,34 @@ class MetadataAnalyzerApp:
     """
 
     NON_EDITABLE_FIELDS = {"File Name", "File Size", "File Type", "Extracted At", "Modified On"}
+    # History tree columns, in display order, with their ttk column options
+    HISTORY_COLUMN_SPECS = {
+        "S.No": dict(stretch=NO, minwidth=50, width=60, anchor=CENTER),
+        "File Path": dict(stretch=YES, minwidth=220, width=260, anchor=W),
+        "File Name": dict(stretch=YES, minwidth=160, width=190, anchor=W),
+        "File Size": dict(stretch=NO, minwidth=90, width=110, anchor=CENTER),
+        "File Type": dict(stretch=NO, minwidth=70, width=80, anchor=CENTER),
+        "Extracted At": dict(stretch=NO, minwidth=150, width=180, anchor=CENTER),
+        "Modified On": dict(stretch=NO, minwidth=150, width=180, anchor=CENTER),
+        "Record ID": dict(stretch=NO, minwidth=0, width=0, anchor=CENTER),
+    }
+    # History search/filter changes within this window trigger a single reload
+    HISTORY_SEARCH_DELAY_MS = 180
+    # History rows scrolled out of the window stay detached for reuse, up to this many
+    HISTORY_DETACHED_ROWS = 200
+    # Recent History query results reused while the database is unchanged
+    HISTORY_CACHE_SIZE = 32
+    HISTORY_CACHE_SECONDS = 30
+    # Smooth preview renders kept per zoom level for the current image
+    PREVIEW_ZOOM_CACHE_SIZE = 6
+    # Rendered report preview pages kept by report text
+    PREVIEW_RENDER_CACHE_SIZE = 4
+    # Report preview pages are rasterized at most at this DPI
+    PREVIEW_MAX_DPI = 150
+    # Largest preview zoom factor; pages are rendered sharp enough for it
+    PREVIEW_MAX_ZOOM = 2.0
+    # Preview canvas resizes within this window re-center the image once
+    PREVIEW_RESIZE_DELAY_MS = 50
 
     def __init__(self) -> None:
         # Core state
@@ -59,23 +170,37 @@ class MetadataAnalyzerApp:
 
         # UI references
         self.root = None
+        self._fonts = {}  # (size, style) -> shared named font
         self.c1_text = None
+        self._c1_segments = None  # Segments c1_text currently shows
         self.status_var = None
+        self._pending_status = None  # Latest message waiting for the idle flush
+        self._status_scheduled = False
         self.progress_var = None
         self.progress_bar = None
         self.nb_widget = None
         self.tab2_ref = None
+        self.tab3_ref = None
         self.tab5_ref = None
         self.tab4_ref = None
         self.editor_entry_fields = {}
         self.editor_entry_frame = None
+        self._editor_row_pool = []  # (frame, label, entry) rows reused across records
+        self._editor_rows_shown = 0  # Leading pool rows currently packed
         self.editor_canvas = None
         self.editor_status = None
+        self._lazy_tabs = {}  # Tk path of an unbuilt tab -> builder
         self.report_preview = None
         self.report_image_label = None
         self.report_preview_tk_img = None
         self.preview_image_zoom = 1.0  # Image zoom scale factor
         self.preview_base_image = None  # Store original PIL image
+        self._preview_pyramid = []  # Halved copies of preview_base_image for zooming
+        self._preview_zoom_after_id = None  # Pending high-quality zoom redraw
+        self._canvas_cfg_after_id = None  # Pending re-center after a canvas resize
+        self._zoom_cache = OrderedDict()  # (zoom, width, height) -> PhotoImage of the current image
+        self._base_scale_ratio = None  # Fit-to-window scale of preview_base_image
+        self._base_tk_photo = None  # PhotoImage of the preview at 100% zoom
         self.preview_canvas = None  # Canvas for scrollable image
         self.preview_scrollbar = None  # Scrollbar for preview canvas
         self.risk_summary_text = None
@@ -92,9 +217,18 @@ class MetadataAnalyzerApp:
 
         # Report state
         self.report_last_text = ""
+        self._report_rendered_text = None  # Text the preview tab currently shows
 
         # Hooks
         self.history_refresh = None
+
+        # Single background worker for History queries and exports
+        self._db_executor = None
+        self._preview_executor = None  # Single worker for report preview renders
+        self._preview_future = None  # Latest render; older results are dropped
+        self._preview_render_cache = OrderedDict()  # report text digest -> first page image
+        self._history_cache = OrderedDict()  # query key -> (write_version, time, result)
+        self._history_cache_lock = threading.Lock()
         
         # Statistics cache
         self.stats_cache = None
@@ -114,6 +248,9 @@ class MetadataAnalyzerApp:
         self._build_menu_bar()
         self._setup_keyboard_shortcuts()
         self.root.mainloop()
+        for executor in (self._db_executor, self._preview_executor):
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
 
     # ------------------------------------------------------------------
     # Window and widgets
@@ -138,17 +275,42 @@ class MetadataAnalyzerApp:
         logo = PhotoImage(file="Metadata.png")
         self.root.iconphoto(True, logo)
 
+    def _font(self, size: int, style: str = "") -> tkfont.Font:
+        """Return the shared Segoe UI font for a size and style.
+        
+        Widgets reference one named Tk font per spec instead of each parsing
+        its own font tuple, and a spec can be changed in one place.
+        
+        Args:
+            size (int): Point size.
+            style (str): "bold", "italic" or "" for regular.
+            
+        Returns:
+            tkinter.font.Font: Font owned by the main window.
+        """
+        font = self._fonts.get((size, style))
+        if font is None:
+            font = tkfont.Font(
+                root=self.root,
+                family="Segoe UI",
+                size=size,
+                weight="bold" if style == "bold" else "normal",
+                slant="italic" if style == "italic" else "roman",
+            )
+            self._fonts[(size, style)] = font
+        return font
+
     def _create_widgets(self) -> None:
         """Build UI components: title, notebook tabs (Extractor, Editor, History), controls, and status bar."""
         # Title label
-        title_label = Label(self.root, text="TraceLens", bg="#f5f7fa", font=("Segoe UI", 24, "bold"), fg="#1a1a1a")
+        title_label = Label(self.root, text="TraceLens", bg="#f5f7fa", font=self._font(24, "bold"), fg="#1a1a1a")
         title_label.place(x=10, y=10, width=self.window_width - 20, height=40)
 
         # Configure modern flat design theme
         style = ttk.Style()
         style.theme_use("clam")
         style.configure("TNotebook", background="#f5f7fa", borderwidth=0)
-        style.configure("TNotebook.Tab", padding=[20, 10], font=("Segoe UI", 10))
+        style.configure("TNotebook.Tab", padding=[20, 10], font=self._font(10))
 
         nb = ttk.Notebook(self.root)
         nb.place(x=10, y=55, width=self.window_width - 20, height=self.window_height - 70)
@@ -170,7 +332,7 @@ class MetadataAnalyzerApp:
         controls_frame.pack_propagate(False)
 
         # Configure button styling with modern colors
-        style.configure("TButton", font=("Segoe UI", 10, "bold"), padding=10)
+        style.configure("TButton", font=self._font(10, "bold"), padding=10)
         style.map(
             "TButton",
             foreground=[("pressed", "#ffffff"), ("active", "#ffffff")],
@@ -194,19 +356,58 @@ class MetadataAnalyzerApp:
         status_frame = Frame(c1, bg="#2c3e50", height=30)
         status_frame.pack(side=BOTTOM, fill=X)
         status_frame.pack_propagate(False)
-        status_bar = Label(status_frame, textvariable=self.status_var, relief=FLAT, anchor=W, font=("Segoe UI", 9), background="#2c3e50", foreground="#ecf0f1", padx=10)
+        status_bar = Label(status_frame, textvariable=self.status_var, relief=FLAT, anchor=W, font=self._font(9), background="#2c3e50", foreground="#ecf0f1", padx=10)
         status_bar.pack(side=LEFT, fill=X, expand=True, pady=8)
 
         # Text widget for displaying metadata with scrollbar
-        self.c1_text = scrolledtext.ScrolledText(c1, wrap=WORD, bg="#ffffff", font=("Segoe UI", 11), fg="#333333", bd=0, relief=FLAT, highlightthickness=0, pady=15, padx=15)
+        self.c1_text = scrolledtext.ScrolledText(c1, wrap=WORD, bg="#ffffff", font=self._font(11), fg="#333333", bd=0, relief=FLAT, highlightthickness=0, pady=15, padx=15)
         self.c1_text.pack(fill=BOTH, expand=True, padx=0, pady=(0, 0))
-        self.c1_text.tag_configure("bold", font=("Segoe UI", 11, "bold"), foreground="#0066cc")
-        self.c1_text.tag_configure("header", font=("Segoe UI", 13, "bold"), foreground="#1a1a1a")
+        self.c1_text.tag_configure("bold", font=self._font(11, "bold"), foreground="#0066cc")
+        self.c1_text.tag_configure("header", font=self._font(13, "bold"), foreground="#1a1a1a")
         self._show_welcome_text()
 
         # Editor tab setup
         nb.add(tab2, text="Editor")
         self.tab2_ref = tab2
+
+        # History tab
+        nb.add(tab3, text="History")
+        self.tab3_ref = tab3
+
+        # Risk analyzer tab
+        nb.add(tab5, text="Risk analyzer")
+        self.tab5_ref = tab5
+        self._build_risk_tab(tab5)
+
+        # Report tab
+        nb.add(tab4, text="Preview")
+        self.tab4_ref = tab4
+
+        # Editor, History and Preview widgets are built on first use
+        self._lazy_tabs = {
+            str(tab2): lambda: self._build_editor_tab(tab2),
+            str(tab3): lambda: self._build_history_tab(tab3),
+            str(tab4): lambda: self._build_preview_tab(tab4),
+        }
+
+        nb.bind("<<NotebookTabChanged>>", lambda e: self._on_tab_changed(e, tab2, tab3, tab5))
+
+    def _ensure_tab_built(self, tab) -> None:
+        """Build a lazily constructed tab's widgets if that has not happened yet.
+        
+        Args:
+            tab: Tab frame or its Tk path name.
+        """
+        builder = self._lazy_tabs.pop(str(tab), None)
+        if builder is not None:
+            builder()
+
+    def _build_editor_tab(self, tab2: Frame) -> None:
+        """Construct editor tab with the scrollable field list and action buttons.
+        
+        Args:
+            tab2 (Frame): Tkinter Frame widget for the editor tab.
+        """
         c2 = Frame(tab2, bg="#ffffff")
         c2.pack(fill=BOTH, expand=1)
 
@@ -222,13 +423,13 @@ class MetadataAnalyzerApp:
         editor_status_frame = Frame(c2, bg="#2c3e50", height=30)
         editor_status_frame.pack(side=BOTTOM, fill=X)
         editor_status_frame.pack_propagate(False)
-        self.editor_status = Label(editor_status_frame, text="", relief=FLAT, anchor=W, font=("Segoe UI", 9), background="#2c3e50", foreground="#ffffff", padx=10)
+        self.editor_status = Label(editor_status_frame, text="", relief=FLAT, anchor=W, font=self._font(9), background="#2c3e50", foreground="#ffffff", padx=10)
         self.editor_status.pack(side=LEFT, fill=X, expand=True, pady=8)
 
         editor_fields_container = Frame(c2, bg="#ffffff")
         editor_fields_container.pack(fill=BOTH, expand=True)
 
-        Label(editor_fields_container, text="Metadata Editor", bg="#ffffff", font=("Segoe UI", 14, "bold"), fg="#1a1a1a", anchor=W).pack(fill=X, padx=15, pady=(12, 4))
+        Label(editor_fields_container, text="Metadata Editor", bg="#ffffff", font=self._font(14, "bold"), fg="#1a1a1a", anchor=W).pack(fill=X, padx=15, pady=(12, 4))
 
         self.editor_canvas = Canvas(editor_fields_container, bg="#ffffff", highlightthickness=0, bd=0)
         self.editor_canvas.pack(side=LEFT, fill=BOTH, expand=True)
@@ -255,26 +456,22 @@ class MetadataAnalyzerApp:
         self.editor_entry_frame.bind("<Button-4>", _on_mousewheel)
         self.editor_entry_frame.bind("<Button-5>", _on_mousewheel)
 
-        # History tab
-        nb.add(tab3, text="History")
-
-        # Risk analyzer tab
-        nb.add(tab5, text="Risk analyzer")
-        self.tab5_ref = tab5
-        self._build_risk_tab(tab5)
-
-        # Report tab: preview on the left, controls on the right
-        nb.add(tab4, text="Preview")
-        self.tab4_ref = tab4
+    def _build_preview_tab(self, tab4: Frame) -> None:
+        """Construct preview tab with the report/image canvas and zoom controls.
+        
+        Args:
+            tab4 (Frame): Tkinter Frame widget for the preview tab.
+        """
+        # Preview on the left, controls on the right
         report_container = Frame(tab4, bg="#ffffff")
         report_container.pack(fill=BOTH, expand=True)
 
         preview_frame = Frame(report_container, bg="#e8e8e8")
         preview_frame.pack(side=LEFT, fill=BOTH, expand=True)
-        preview_label = Label(preview_frame, text="Report Preview", bg="#e8e8e8", font=("Segoe UI", 12, "bold"), fg="#1a1a1a")
+        preview_label = Label(preview_frame, text="Report Preview", bg="#e8e8e8", font=self._font(12, "bold"), fg="#1a1a1a")
         preview_label.pack(anchor=W, padx=12, pady=(12, 6))
 
-        self.report_preview = scrolledtext.ScrolledText(preview_frame, wrap=WORD, bg="#ffffff", font=("Segoe UI", 11), fg="#333333", bd=1, relief=SOLID, highlightthickness=0, pady=12, padx=12)
+        self.report_preview = scrolledtext.ScrolledText(preview_frame, wrap=WORD, bg="#ffffff", font=self._font(11), fg="#333333", bd=1, relief=SOLID, highlightthickness=0, pady=12, padx=12)
         self.report_preview.config(state=DISABLED)
 
         # Container for canvas and scrollbar
@@ -296,7 +493,7 @@ class MetadataAnalyzerApp:
             self.preview_canvas,
             bg="#e8e8e8",
             text="No report generated yet.\n\nGenerate a report from the Extractor or Editor tab to see preview.",
-            font=("Segoe UI", 11),
+            font=self._font(11),
             fg="#666666",
             justify=CENTER,
         )
@@ -327,24 +524,19 @@ class MetadataAnalyzerApp:
         controls_side = Frame(report_container, bg="#f8f9fa", width=220)
         controls_side.pack(side=RIGHT, fill=Y, padx=2, pady=2)
         controls_side.pack_propagate(False)
-        Label(controls_side, text="Actions", bg="#f8f9fa", font=("Segoe UI", 11, "bold"), fg="#1a1a1a").pack(anchor=W, padx=12, pady=(12, 6))
-        Button(controls_side, text="Save Report", command=lambda: report.save_metadata(self.report_last_text), bg="#007acc", fg="white", font=("Segoe UI", 10, "bold"), relief=FLAT, cursor="hand2", pady=8).pack(fill=X, padx=12, pady=6)
-        Button(controls_side, text="Print Report", command=lambda: report.print_metadata_report(self.report_last_text), bg="#28a745", fg="white", font=("Segoe UI", 10, "bold"), relief=FLAT, cursor="hand2", pady=8).pack(fill=X, padx=12, pady=6)
+        Label(controls_side, text="Actions", bg="#f8f9fa", font=self._font(11, "bold"), fg="#1a1a1a").pack(anchor=W, padx=12, pady=(12, 6))
+        Button(controls_side, text="Save Report", command=lambda: report.save_metadata(self.report_last_text), bg="#007acc", fg="white", font=self._font(10, "bold"), relief=FLAT, cursor="hand2", pady=8).pack(fill=X, padx=12, pady=6)
+        Button(controls_side, text="Print Report", command=lambda: report.print_metadata_report(self.report_last_text), bg="#28a745", fg="white", font=self._font(10, "bold"), relief=FLAT, cursor="hand2", pady=8).pack(fill=X, padx=12, pady=6)
         
-        Label(controls_side, text="Zoom", bg="#f8f9fa", font=("Segoe UI", 11, "bold"), fg="#1a1a1a").pack(anchor=W, padx=12, pady=(24, 6))
+        Label(controls_side, text="Zoom", bg="#f8f9fa", font=self._font(11, "bold"), fg="#1a1a1a").pack(anchor=W, padx=12, pady=(24, 6))
         zoom_frame = Frame(controls_side, bg="#f8f9fa")
         zoom_frame.pack(fill=X, padx=12, pady=6)
-        Button(zoom_frame, text="+", command=self.zoom_in_image, bg="#007acc", fg="white", font=("Segoe UI", 10, "bold"), relief=FLAT, cursor="hand2", width=3).pack(side=LEFT, padx=(0, 6))
-        Button(zoom_frame, text="−", command=self.zoom_out_image, bg="#007acc", fg="white", font=("Segoe UI", 10, "bold"), relief=FLAT, cursor="hand2", width=3).pack(side=LEFT, padx=(0, 6))
-        Button(zoom_frame, text="Reset", command=self.reset_zoom_image, bg="#6c757d", fg="white", font=("Segoe UI", 9, "bold"), relief=FLAT, cursor="hand2", width=5).pack(side=LEFT)
-        self.zoom_display_label = Label(controls_side, text="100%", bg="#f8f9fa", font=("Segoe UI", 10), fg="#333333")
+        Button(zoom_frame, text="+", command=self.zoom_in_image, bg="#007acc", fg="white", font=self._font(10, "bold"), relief=FLAT, cursor="hand2", width=3).pack(side=LEFT, padx=(0, 6))
+        Button(zoom_frame, text="−", command=self.zoom_out_image, bg="#007acc", fg="white", font=self._font(10, "bold"), relief=FLAT, cursor="hand2", width=3).pack(side=LEFT, padx=(0, 6))
+        Button(zoom_frame, text="Reset", command=self.reset_zoom_image, bg="#6c757d", fg="white", font=self._font(9, "bold"), relief=FLAT, cursor="hand2", width=5).pack(side=LEFT)
+        self.zoom_display_label = Label(controls_side, text="100%", bg="#f8f9fa", font=self._font(10), fg="#333333")
         self.zoom_display_label.pack(anchor=W, padx=12, pady=(6, 0))
 
-        # History tab widgets
-        self._build_history_tab(tab3)
-
-        nb.bind("<<NotebookTabChanged>>", lambda e: self._on_tab_changed(e, tab2, tab3, tab5))
-
     def _build_history_tab(self, tab3: Frame) -> None:
         """Construct history tab with search/filter/export controls.
         
@@ -359,14 +551,14 @@ class MetadataAnalyzerApp:
         search_row1 = Frame(history_container, bg="#ffffff")
         search_row1.pack(fill=X, pady=(0, 12))
 
-        Label(search_row1, text="Search:", bg="#ffffff", font=("Segoe UI", 10, "bold"), fg="#1a1a1a").pack(side=LEFT, padx=(0, 8))
+        Label(search_row1, text="Search:", bg="#ffffff", font=self._font(10, "bold"), fg="#1a1a1a").pack(side=LEFT, padx=(0, 8))
         search_var = StringVar()
-        search_entry = ttk.Entry(search_row1, textvariable=search_var, width=25, font=("Segoe UI", 10))
+        search_entry = ttk.Entry(search_row1, textvariable=search_var, width=25, font=self._font(10))
         search_entry.pack(side=LEFT, padx=(0, 15))
 
-        Label(search_row1, text="File Type:", bg="#ffffff", font=("Segoe UI", 10, "bold"), fg="#1a1a1a").pack(side=LEFT, padx=(0, 8))
+        Label(search_row1, text="File Type:", bg="#ffffff", font=self._font(10, "bold"), fg="#1a1a1a").pack(side=LEFT, padx=(0, 8))
         filter_var = StringVar()
-        filter_combo = ttk.Combobox(search_row1, textvariable=filter_var, width=16, state="readonly", font=("Segoe UI", 10))
+        filter_combo = ttk.Combobox(search_row1, textvariable=filter_var, width=16, state="readonly", font=self._font(10))
         filter_combo["values"] = [
             "All",
             "pdf",
@@ -387,16 +579,16 @@ class MetadataAnalyzerApp:
         filter_combo.set("All")
         filter_combo.pack(side=LEFT, padx=(0, 15))
 
-        Label(search_row1, text="Date Range:", bg="#ffffff", font=("Segoe UI", 10, "bold"), fg="#1a1a1a").pack(side=LEFT, padx=(0, 8))
+        Label(search_row1, text="Date Range:", bg="#ffffff", font=self._font(10, "bold"), fg="#1a1a1a").pack(side=LEFT, padx=(0, 8))
         date_var = StringVar()
-        date_combo = ttk.Combobox(search_row1, textvariable=date_var, width=17, state="readonly", font=("Segoe UI", 10))
+        date_combo = ttk.Combobox(search_row1, textvariable=date_var, width=17, state="readonly", font=self._font(10))
         date_combo["values"] = ["All Time", "Today", "This Week", "This Month", "Last 30 Days"]
         date_combo.set("All Time")
         date_combo.pack(side=LEFT, padx=(0, 15))
 
-        Label(search_row1, text="Sort by:", bg="#ffffff", font=("Segoe UI", 10, "bold"), fg="#1a1a1a").pack(side=LEFT, padx=(0, 8))
+        Label(search_row1, text="Sort by:", bg="#ffffff", font=self._font(10, "bold"), fg="#1a1a1a").pack(side=LEFT, padx=(0, 8))
         sort_var = StringVar()
-        sort_combo = ttk.Combobox(search_row1, textvariable=sort_var, width=20, state="readonly", font=("Segoe UI", 10))
+        sort_combo = ttk.Combobox(search_row1, textvariable=sort_var, width=20, state="readonly", font=self._font(10))
         sort_combo["values"] = [
             "Date (Newest)",
             "Date (Oldest)",
@@ -411,33 +603,21 @@ class MetadataAnalyzerApp:
         tree_frame = Frame(history_container, bg="#ffffff")
         tree_frame.pack(fill=BOTH, expand=True)
 
-        columns = ("S.No", "File Path", "File Name", "File Size", "File Type", "Extracted At", "Modified On", "Record ID")
-        tree = ttk.Treeview(tree_frame, columns=columns, show="headings")
+        columns = tuple(self.HISTORY_COLUMN_SPECS)
+        # Record ID rides along in each row's values but is never drawn
+        tree = ttk.Treeview(tree_frame, columns=columns, show="headings",
+                            displaycolumns=tuple(col for col in columns if col != "Record ID"))
 
         for col in columns:
             tree.heading(col, text=col)
-            if col == "S.No":
-                tree.column(col, stretch=NO, minwidth=50, width=60, anchor=CENTER)
-            elif col == "File Path":
-                tree.column(col, stretch=YES, minwidth=220, width=260, anchor=W)
-            elif col == "File Name":
-                tree.column(col, stretch=YES, minwidth=160, width=190, anchor=W)
-            elif col == "File Size":
-                tree.column(col, stretch=NO, minwidth=90, width=110, anchor=CENTER)
-            elif col == "File Type":
-                tree.column(col, stretch=NO, minwidth=70, width=80, anchor=CENTER)
-            elif col == "Extracted At":
-                tree.column(col, stretch=NO, minwidth=150, width=180, anchor=CENTER)
-            elif col == "Modified On":
-                tree.column(col, stretch=NO, minwidth=150, width=180, anchor=CENTER)
-            elif col == "Record ID":
-                tree.column(col, stretch=NO, minwidth=0, width=0, anchor=CENTER)
+            tree.column(col, **self.HISTORY_COLUMN_SPECS[col])
 
         tree.pack(side=LEFT, fill=BOTH, expand=True)
 
-        v_scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=tree.yview)
+        # The tree only ever holds the rows in view; this scrollbar is driven by
+        # the window over the filtered result set (see _scroll_window below)
+        v_scrollbar = ttk.Scrollbar(tree_frame, orient="vertical")
         v_scrollbar.pack(side=RIGHT, fill=Y)
-        tree.configure(yscrollcommand=v_scrollbar.set)
 
         h_scrollbar = ttk.Scrollbar(history_container, orient="horizontal", command=tree.xview)
         h_scrollbar.pack(side=BOTTOM, fill=X, pady=(4, 0))
@@ -467,24 +647,184 @@ class MetadataAnalyzerApp:
         refresh_btn = ttk.Button(button_frame, text="Refresh")
         refresh_btn.pack(side=RIGHT, padx=6)
 
-        def humanize(dt_str: str) -> str:
-            if not dt_str:
-                return ""
+        # Windowed rendering state: first row shown, size of the filtered result
+        # set, how many rows fit (measured from the first row's bbox) and the
+        # values currently shown (or detached for reuse) for each row iid (the record id)
+        view = {"offset": 0, "total": 0, "rows": 25, "load_after_id": None, "rendered": {}, "detached": OrderedDict(),
+                "load_future": None, "recount": False, "open_future": None, "export_future": None}
+
+        def _visible_rows() -> int:
+            children = tree.get_children()
+            bbox = tree.bbox(children[0]) if children else None
+            height = tree.winfo_height()
+            if bbox and bbox[3] > 0 and height > 1:
+                view["rows"] = max(1, (height - bbox[1]) // bbox[3])
+            return view["rows"]
+
+        def _query_window(filters, start, rows, total):
+            # Runs on the DB worker: recount if asked, clamp, then fetch one window
+            if total is None:
+                total = self._cached_history_query(db.count_filtered_data, *filters[:3])
+            start = max(0, min(start, total - rows))
+            data = self._cached_history_query(db.filter_and_search_data, *filters,
+                                              limit=rows + 1, offset=start, display_times=True)
+            return total, start, rows, data
+
+        def _request_window(start: int, recount: bool = False, then=None) -> None:
+            previous = view["load_future"]
+            if previous is not None:
+                previous.cancel()
+            # A superseded request may still owe a recount
+            recount = recount or view["recount"]
+            view["recount"] = recount
+            view["offset"] = max(0, start)
+            filters = (search_var.get(), filter_var.get(), date_var.get(), sort_var.get())
+            view["load_future"] = self._submit_db(
+                _query_window, filters, view["offset"], _visible_rows(), None if recount else view["total"],
+                on_done=lambda future: _apply_window(future, then),
+            )
+
+        def _apply_window(future, then=None) -> None:
+            if future is not view["load_future"]:
+                return
+            view["load_future"] = None
+            view["recount"] = False
             try:
-                from datetime import datetime
+                total, start, rows, data = future.result()
+            except Exception as e:
+                self.set_status(f"History load error: {str(e)}")
+                return
+            view["total"] = total
+            view["offset"] = start
+            # Diff against what is shown: only changed rows touch the widget, and
+            # kept rows stay selected. Rows leaving the window are detached, and
+            # reattached if they come back
+            rendered = view["rendered"]
+            detached = view["detached"]
+            new_rows = [
+                (str(row[0]), (idx, row[1], row[2], row[3], row[4], row[5] or "", row[6] or "", row[0]))
+                for idx, row in enumerate(data, start=start + 1)
+            ]
+            new_ids = {iid for iid, _ in new_rows}
+            stale = [iid for iid in rendered if iid not in new_ids]
+            if stale:
+                selected_stale = set(tree.selection()).intersection(stale)
+                if selected_stale:
+                    tree.selection_remove(*selected_stale)
+                tree.detach(*stale)
+                for iid in stale:
+                    detached[iid] = rendered.pop(iid)
+            order = list(tree.get_children())
+            for index, (iid, values) in enumerate(new_rows):
+                if iid in rendered:
+                    if rendered[iid] != values:
+                        tree.item(iid, values=values)
+                    if index >= len(order) or order[index] != iid:
+                        tree.move(iid, "", index)
+                        order.remove(iid)
+                        order.insert(index, iid)
+                elif iid in detached:
+                    if detached.pop(iid) != values:
+                        tree.item(iid, values=values)
+                    tree.move(iid, "", index)
+                    order.insert(index, iid)
+                else:
+                    tree.insert("", index, iid=iid, values=values)
+                    order.insert(index, iid)
+                rendered[iid] = values
+            excess = len(detached) - self.HISTORY_DETACHED_ROWS
+            if excess > 0:
+                evicted = [detached.popitem(last=False)[0] for _ in range(excess)]
+                tree.delete(*evicted)
+            tree.yview_moveto(0)
+            if total:
+                v_scrollbar.set(start / total, min(1.0, (start + rows) / total))
+            else:
+                v_scrollbar.set(0.0, 1.0)
+            if rows != _visible_rows():
+                # The first render measured a different row height; fill the real height
+                _request_window(start, then=then)
+            elif then is not None:
+                then()
+
+        def _cancel_pending_load():
+            pending = view["load_after_id"]
+            if pending is not None:
+                try:
+                    tree.after_cancel(pending)
+                except Exception:
+                    pass
+                view["load_after_id"] = None
 
-                return datetime.fromisoformat(dt_str).strftime("%b %d, %Y %I:%M %p")
-            except Exception:
-                return dt_str
+        def schedule_load(*args):
+            """Reload once typing/selection settles instead of on every trace event."""
+            _cancel_pending_load()
+            view["load_after_id"] = tree.after(self.HISTORY_SEARCH_DELAY_MS, load_data)
+
+        def load_data(reset: bool = True):
+            _cancel_pending_load()
+            _request_window(0 if reset else view["offset"], recount=True)
+
+        def _scroll_window(*args):
+            if not args:
+                return
+            rows = view["rows"]
+            if args[0] == "moveto":
+                start = int(float(args[1]) * view["total"])
+            elif args[0] == "scroll":
+                step = int(args[1])
+                start = view["offset"] + (step * max(1, rows - 1) if args[2] == "pages" else step)
+            else:
+                return
+            if start != view["offset"]:
+                _request_window(start)
+
+        def _on_tree_mousewheel(event):
+            delta_steps = 0
+            if hasattr(event, "delta") and event.delta:
+                delta_steps = int(-1 * (event.delta / 120)) * 3
+            elif getattr(event, "num", None) == 4:
+                delta_steps = -3
+            elif getattr(event, "num", None) == 5:
+                delta_steps = 3
+            if delta_steps:
+                _scroll_window("scroll", delta_steps, "units")
+            return "break"
+
+        def _on_tree_arrow(event):
+            # Moving past the first/last fully visible row slides the window by one
+            children = tree.get_children()
+            if not children:
+                return None
+            last_full = children[min(len(children), view["rows"]) - 1]
+            if event.keysym == "Up" and tree.focus() == children[0] and view["offset"] > 0:
+                step, edge = -1, 0
+            elif event.keysym == "Down" and tree.focus() == last_full and view["offset"] + view["rows"] < view["total"]:
+                step, edge = 1, -1
+            else:
+                return None
+            def _focus_edge():
+                children = tree.get_children()
+                if not children:
+                    return
+                target = children[0] if edge == 0 else children[min(len(children), view["rows"]) - 1]
+                tree.selection_set(target)
+                tree.focus(target)
+
+            _request_window(view["offset"] + step, then=_focus_edge)
+            return "break"
 
-        def load_data():
-            data = db.filter_and_search_data(search_var.get(), filter_var.get(), date_var.get(), sort_var.get())
-            tree.delete(*tree.get_children())
-            for idx, row in enumerate(data, start=1):
-                extracted_at = humanize(row[5])
-                modified_on = humanize(row[6])
-                tree.insert("", END, values=(idx, row[1], row[2], row[3], row[4], extracted_at, modified_on, row[0]))
-            return data
+        def _on_tree_configure(event):
+            if view["rows"] != _visible_rows():
+                _request_window(view["offset"])
+
+        v_scrollbar.configure(command=_scroll_window)
+        tree.bind("<MouseWheel>", _on_tree_mousewheel)
+        tree.bind("<Button-4>", _on_tree_mousewheel)
+        tree.bind("<Button-5>", _on_tree_mousewheel)
+        tree.bind("<Up>", _on_tree_arrow)
+        tree.bind("<Down>", _on_tree_arrow)
+        tree.bind("<Configure>", _on_tree_configure)
 
         def clear_filters():
             search_var.set("")
@@ -495,7 +835,7 @@ class MetadataAnalyzerApp:
             load_data()
 
         def refresh_data():
-            load_data()
+            load_data(reset=False)
 
         def delete_selected_record():
             selected = tree.selection()
@@ -509,7 +849,7 @@ class MetadataAnalyzerApp:
                     messagebox.showinfo("Success", "Record deleted successfully.")
                 else:
                     messagebox.showerror("Error", "Failed to delete record.")
-                load_data()
+                load_data(reset=False)
 
         def delete_all_records():
             if messagebox.askyesno("Confirm Delete", "Delete all metadata records? This cannot be undone."):
@@ -520,17 +860,46 @@ class MetadataAnalyzerApp:
                 load_data()
 
         def export_handler(fmt):
-            data = load_data()
-            if not data:
+            if not view["total"]:
+                messagebox.showwarning("No Data", "No records to export with current filters.")
+                return
+            file_path = report.ask_export_path(fmt)
+            if not file_path:
+                return
+            previous = view["export_future"]
+            if previous is not None:
+                previous.cancel()
+            if self.progress_bar:
+                self.progress_bar.start()
+            self.set_status(f"Exporting {fmt.upper()}...")
+            # Filters are re-applied in SQL and rows stream to the file on the worker
+            view["export_future"] = self._submit_db(
+                db.export_stream, fmt, file_path, search_var.get(), filter_var.get(), date_var.get(), sort_var.get(),
+                on_done=lambda future: _finish_export(future, fmt, file_path),
+            )
+
+        def _finish_export(future, fmt, file_path):
+            if future is not view["export_future"]:
+                return
+            view["export_future"] = None
+            if self.progress_bar:
+                self.progress_bar.stop()
+            try:
+                count = future.result()
+            except Exception as e:
+                self.set_status("Export failed")
+                messagebox.showerror("Export Error", f"Failed to export {fmt.upper()}: {str(e)}")
+                return
+            self.set_status("Ready")
+            if not count:
                 messagebox.showwarning("No Data", "No records to export with current filters.")
                 return
-            db.export_data(fmt, data)
-            messagebox.showinfo("Export", f"Exported data as {fmt.upper()}.")
+            messagebox.showinfo("Export", f"Exported {count} records as {fmt.upper()} to {file_path}")
 
-        search_var.trace("w", lambda *args: load_data())
-        filter_var.trace("w", lambda *args: load_data())
-        date_var.trace("w", lambda *args: load_data())
-        sort_var.trace("w", lambda *args: load_data())
+        search_var.trace("w", schedule_load)
+        filter_var.trace("w", schedule_load)
+        date_var.trace("w", schedule_load)
+        sort_var.trace("w", schedule_load)
 
         clear_btn.config(command=clear_filters)
         refresh_btn.config(command=refresh_data)
@@ -550,8 +919,14 @@ class MetadataAnalyzerApp:
             if not values or len(values) < 2:
                 return
             record_id = values[-1]
+            view["open_future"] = self._submit_db(db.fetch_metadata_by_id, record_id, on_done=_open_record)
+
+        def _open_record(future):
+            if future is not view["open_future"]:
+                return
+            view["open_future"] = None
             try:
-                row = db.fetch_metadata_by_id(record_id)
+                row = future.result()
             except Exception:
                 row = None
             if not row:
@@ -578,33 +953,23 @@ class MetadataAnalyzerApp:
                 except Exception:
                     self.risk_analysis = None
 
-            def humanize_local(dt_str: str) -> str:
-                if not dt_str:
-                    return ""
-                try:
-                    from datetime import datetime
-
-                    return datetime.fromisoformat(dt_str).strftime("%b %d, %Y %I:%M %p")
-                except Exception:
-                    return dt_str
-
             if self.c1_text:
-                self.c1_text.config(state=NORMAL)
-                self.c1_text.delete(1.0, END)
-                self.c1_text.insert(END, "File Information\n", "header")
-                self.c1_text.insert(END, "\n")
-                self.c1_text.insert(END, f"Filename:  {row[2]}\n", "bold")
-                self.c1_text.insert(END, f"Path:  {row[1]}\n", "bold")
-                self.c1_text.insert(END, f"Type:  {row[4]}\n", "bold")
-                self.c1_text.insert(END, f"Size:  {row[3]}\n", "bold")
-                self.c1_text.insert(END, f"Extracted At:  {humanize_local(row[5])}\n", "bold")
-                self.c1_text.insert(END, f"Modified On:  {humanize_local(row[6])}\n\n", "bold")
+                segments = [
+                    ("File Information\n", "header"),
+                    ("\n", ""),
+                    (f"Filename:  {row[2]}\n", "bold"),
+                    (f"Path:  {row[1]}\n", "bold"),
+                    (f"Type:  {row[4]}\n", "bold"),
+                    (f"Size:  {row[3]}\n", "bold"),
+                    (f"Extracted At:  {_humanize(row[5])}\n", "bold"),
+                    (f"Modified On:  {_humanize(row[6])}\n\n", "bold"),
+                ]
                 if isinstance(self.extracted_metadata, dict):
-                    for k, v in self.extracted_metadata.items():
-                        self.c1_text.insert(END, f"{k}: {v}\n")
+                    body = "".join(f"{k}: {v}\n" for k, v in self.extracted_metadata.items())
                 else:
-                    self.c1_text.insert(END, f"{self.extracted_metadata}\n")
-                self.c1_text.config(state=DISABLED)
+                    body = f"{self.extracted_metadata}\n"
+                segments.append((body, ""))
+                self._write_c1_text(segments)
 
             try:
                 if self.nb_widget is not None:
@@ -617,7 +982,7 @@ class MetadataAnalyzerApp:
         tree.bind("<Double-1>", on_tree_double_click)
 
         load_data()
-        self.history_refresh = load_data
+        self.history_refresh = lambda: load_data(reset=False)
 
     def _build_risk_tab(self, tab5: Frame) -> None:
         """Construct Risk analyzer tab using stacked charts on left and summary panel on right."""
@@ -631,16 +996,16 @@ class MetadataAnalyzerApp:
         right_column.pack(side=RIGHT, fill=BOTH, expand=False, padx=(8, 10), pady=10)
         right_column.pack_propagate(False)
 
-        Label(left_panel, text="Risk Meter", bg="#ffffff", font=("Segoe UI", 11, "bold"), fg="#1a1a1a", anchor=W).pack(fill=X, padx=2, pady=(0, 4))
+        Label(left_panel, text="Risk Meter", bg="#ffffff", font=self._font(11, "bold"), fg="#1a1a1a", anchor=W).pack(fill=X, padx=2, pady=(0, 4))
         risk_meter_frame = Frame(left_panel, bg="#ffffff", relief=SOLID, bd=1, height=200)
         risk_meter_frame.pack(fill=X, expand=False)
         risk_meter_frame.pack_propagate(False)
 
-        Label(left_panel, text="Forensic Timeline", bg="#ffffff", font=("Segoe UI", 11, "bold"), fg="#1a1a1a", anchor=W).pack(fill=X, padx=2, pady=(12, 4))
+        Label(left_panel, text="Forensic Timeline", bg="#ffffff", font=self._font(11, "bold"), fg="#1a1a1a", anchor=W).pack(fill=X, padx=2, pady=(12, 4))
         timeline_frame = Frame(left_panel, bg="#ffffff", relief=SOLID, bd=1)
         timeline_frame.pack(fill=BOTH, expand=True)
 
-        Label(right_column, text="Comments", bg="#ffffff", font=("Segoe UI", 11, "bold"), fg="#1a1a1a", anchor=W).pack(fill=X, padx=2, pady=(0, 4))
+        Label(right_column, text="Comments", bg="#ffffff", font=self._font(11, "bold"), fg="#1a1a1a", anchor=W).pack(fill=X, padx=2, pady=(0, 4))
         comments_frame = Frame(right_column, bg="#ffffff", relief=SOLID, bd=1)
         comments_frame.pack(fill=BOTH, expand=True)
 
@@ -650,7 +1015,7 @@ class MetadataAnalyzerApp:
         self.timeline_chart_canvas = FigureCanvasTkAgg(Figure(figsize=(6.0, 2.6), facecolor="white"), master=timeline_frame)
         self.timeline_chart_canvas.get_tk_widget().pack(fill=BOTH, expand=True, padx=8, pady=8)
 
-        self.risk_summary_text = scrolledtext.ScrolledText(comments_frame, wrap=WORD, bg="#f5f5f5", font=("Segoe UI", 10), fg="#333333", bd=0, relief=FLAT, padx=10, pady=10)
+        self.risk_summary_text = scrolledtext.ScrolledText(comments_frame, wrap=WORD, bg="#f5f5f5", font=self._font(10), fg="#333333", bd=0, relief=FLAT, padx=10, pady=10)
         self.risk_summary_text.pack(fill=BOTH, expand=True)
         self.risk_summary_text.config(state=DISABLED)
 
@@ -721,8 +1086,6 @@ class MetadataAnalyzerApp:
             ax = fig.add_subplot(111)
             if timeline:
                 # Convert timeline to trend chart
-                from datetime import datetime
-                
                 # Parse timestamps and sort
                 events_with_dates = []
                 for event in timeline:
@@ -741,7 +1104,6 @@ class MetadataAnalyzerApp:
                 
                 if events_with_dates:
                     # Group events by date and collect event names
-                    from collections import defaultdict
                     date_events = defaultdict(list)
                     for dt, event_name in events_with_dates:
                         date_key = dt.date()
@@ -822,6 +1184,21 @@ class MetadataAnalyzerApp:
     # ------------------------------------------------------------------
     # Tab and editor helpers
     # ------------------------------------------------------------------
+    def _refresh_history_if_visible(self) -> None:
+        """Reload the History tab after a database write, if it is on screen.
+        
+        A hidden History tab reloads when it is selected, so there is no
+        point querying the database for it now.
+        """
+        if not callable(self.history_refresh):
+            return
+        try:
+            if self.nb_widget is not None and self.nb_widget.select() != str(self.tab3_ref):
+                return
+        except Exception:
+            pass
+        self.history_refresh()
+
     def _on_tab_changed(self, event, tab2: Frame, tab3: Frame, tab5: Frame) -> None:
         """Handle notebook tab changes for refresh logic.
         
@@ -835,51 +1212,69 @@ class MetadataAnalyzerApp:
         """
         try:
             current = self.nb_widget.select()
+            if current == str(tab2) and (not self.file_path or not self.extracted_metadata):
+                messagebox.showwarning("No Data", "Please extract metadata first.")
+                first_tab = self.nb_widget.tabs()[0]
+                self.nb_widget.select(first_tab)
+                return
+            self._ensure_tab_built(current)
             if current == str(tab3):
                 if callable(self.history_refresh):
                     self.history_refresh()
             elif current == str(tab5):
                 self._render_risk_analysis(self.risk_analysis)
-            elif current == str(tab2):
-                if not self.file_path or not self.extracted_metadata:
-                    messagebox.showwarning("No Data", "Please extract metadata first.")
-                    first_tab = self.nb_widget.tabs()[0]
-                    self.nb_widget.select(first_tab)
         except Exception:
             pass
 
     def _populate_editor_fields(self, metadata: dict) -> None:
         """Populate editor UI with metadata key-value entry fields.
         
-        Creates scrollable frame with Entry widgets for editing metadata.
+        Fills Entry widgets in the scrollable editor frame. Rows are pooled:
+        existing ones are relabelled and refilled, and new widgets are only
+        created when a record has more fields than any shown before.
         
         Args:
             metadata (dict): Dictionary of metadata to populate fields.
         """
-        self._clear_editor_fields()
-        if not metadata or not isinstance(metadata, dict):
-            return
-        for key, value in metadata.items():
-            field_frame = Frame(self.editor_entry_frame, bg="#ffffff")
-            field_frame.pack(fill=X, padx=15, pady=8)
+        self._ensure_tab_built(self.tab2_ref)
+        self.editor_entry_fields.clear()
+        items = list(metadata.items()) if metadata and isinstance(metadata, dict) else []
+        pool = self._editor_row_pool
+        for index, (key, value) in enumerate(items):
+            if index < len(pool):
+                field_frame, label, entry = pool[index]
+                label.config(text=f"{key}:")
+                entry.state(["!disabled"])
+                entry.delete(0, END)
+            else:
+                field_frame = Frame(self.editor_entry_frame, bg="#ffffff")
 
-            label = Label(field_frame, text=f"{key}:", bg="#ffffff", font=("Segoe UI", 10, "bold"), fg="#1a1a1a", width=20, anchor=W)
-            label.pack(side=LEFT, padx=(0, 10))
+                label = Label(field_frame, text=f"{key}:", bg="#ffffff", font=self._font(10, "bold"), fg="#1a1a1a", width=20, anchor=W)
+                label.pack(side=LEFT, padx=(0, 10))
 
-            entry = ttk.Entry(field_frame, font=("Segoe UI", 10), width=50)
-            entry.pack(side=LEFT, fill=X, expand=True)
+                entry = ttk.Entry(field_frame, font=self._font(10), width=50)
+                entry.pack(side=LEFT, fill=X, expand=True)
+                pool.append((field_frame, label, entry))
+            if index >= self._editor_rows_shown:
+                field_frame.pack(fill=X, padx=15, pady=8)
             entry.insert(0, str(value))
             if not self._is_editable_field(key):
                 entry.state(["disabled"])
 
             self.editor_entry_fields[key] = entry
+        self._hide_editor_rows(len(items))
 
     def _clear_editor_fields(self) -> None:
         """Clear all metadata entry fields from the editor."""
-        for widget in self.editor_entry_frame.winfo_children():
-            widget.destroy()
+        self._hide_editor_rows(0)
         self.editor_entry_fields.clear()
 
+    def _hide_editor_rows(self, keep: int) -> None:
+        """Unpack pooled editor rows past the first ``keep`` without destroying them."""
+        for field_frame, _, _ in self._editor_row_pool[keep:self._editor_rows_shown]:
+            field_frame.pack_forget()
+        self._editor_rows_shown = min(keep, len(self._editor_row_pool))
+
     def _is_editable_field(self, field_name: str) -> bool:
         """Check if a field is user-editable.
         
@@ -891,19 +1286,43 @@ class MetadataAnalyzerApp:
         """
         return field_name not in self.NON_EDITABLE_FIELDS
 
-    def _show_welcome_text(self) -> None:
-        """Display welcome message in the metadata text widget."""
+    def _write_c1_text(self, segments) -> None:
+        """Replace the metadata text widget's contents with one Tk insert call.
+        
+        Text.insert takes alternating text and tag arguments, so a whole
+        report lands in a single Tcl round-trip however many fields it has.
+        Writing the segments the widget already shows is a no-op.
+        
+        Args:
+            segments (Iterable[tuple[str, str]]): ``(text, tag)`` pairs; use
+                ``""`` for untagged text.
+        """
         if not self.c1_text:
             return
+        segments = tuple(segments)
+        if segments == self._c1_segments and self.c1_text.get("1.0", "end-1c"):
+            return
+        self._c1_segments = segments
+        args = []
+        for text, tag in segments:
+            args.append(text)
+            args.append(tag)
         self.c1_text.config(state=NORMAL)
         self.c1_text.delete(1.0, END)
-        self.c1_text.insert(END, "Welcome to TraceLens: A Comprehensive Metadata Analysis Toolkit\n", "header")
-        self.c1_text.insert(END, "\nThis tool allows you to extract & edit metadata from various file types including images, documents, and audio files.\n\n")
-        self.c1_text.insert(END, "Getting Started:\n", "bold")
-        self.c1_text.insert(END, "1. Click 'Choose File' to select a file\n2. Click 'Extract' to analyze its metadata\n3. Use 'Generate report' to export the results\n\n")
-        self.c1_text.insert(END, "For more information, refer to the Help section in the menu bar.", "bold")
+        if args:
+            self.c1_text.insert(END, *args)
         self.c1_text.config(state=DISABLED)
 
+    def _show_welcome_text(self) -> None:
+        """Display welcome message in the metadata text widget."""
+        self._write_c1_text((
+            ("Welcome to TraceLens: A Comprehensive Metadata Analysis Toolkit\n", "header"),
+            ("\nThis tool allows you to extract & edit metadata from various file types including images, documents, and audio files.\n\n", ""),
+            ("Getting Started:\n", "bold"),
+            ("1. Click 'Choose File' to select a file\n2. Click 'Extract' to analyze its metadata\n3. Use 'Generate report' to export the results\n\n", ""),
+            ("For more information, refer to the Help section in the menu bar.", "bold"),
+        ))
+
     def _get_timeline_fallbacks(self, extracted_at: str | None = None, modified_on: str | None = None) -> dict:
         """Build fallback timestamps when metadata has no timeline fields."""
         fallback = {}
@@ -923,17 +1342,138 @@ class MetadataAnalyzerApp:
         fallback["Extraction Date"] = extracted_at or datetime.now().isoformat(sep=" ", timespec="seconds")
         return fallback
 
+    # ------------------------------------------------------------------
+    # Background work
+    # ------------------------------------------------------------------
+    def _submit_db(self, func, *args, on_done=None, **kwargs):
+        """Run a database call on the background worker thread.
+        
+        Args:
+            func (callable): Function to run off the Tk main thread.
+            *args: Positional arguments for ``func``.
+            on_done (callable, optional): Called on the Tk main thread with the
+                finished future. Not called for a cancelled future.
+            **kwargs: Keyword arguments for ``func``.
+            
+        Returns:
+            concurrent.futures.Future: The submitted call.
+        """
+        if self._db_executor is None:
+            self._db_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="history-db")
+        return self._submit_to(self._db_executor, func, *args, on_done=on_done, **kwargs)
+
+    def _submit_preview(self, func, *args, on_done=None, **kwargs):
+        """Run a report preview render on its own background worker thread.
+        
+        Kept apart from the database worker so a slow PDF render never holds
+        up History queries.
+        
+        Args:
+            func (callable): Function to run off the Tk main thread.
+            *args: Positional arguments for ``func``.
+            on_done (callable, optional): Called on the Tk main thread with the
+                finished future. Not called for a cancelled future.
+            **kwargs: Keyword arguments for ``func``.
+            
+        Returns:
+            concurrent.futures.Future: The submitted call.
+        """
+        if self._preview_executor is None:
+            self._preview_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="report-preview")
+        return self._submit_to(self._preview_executor, func, *args, on_done=on_done, **kwargs)
+
+    def _submit_to(self, executor, func, *args, on_done=None, **kwargs):
+        """Submit ``func`` to ``executor`` and hand the result back to Tk.
+        
+        Args:
+            executor (concurrent.futures.Executor): Worker to run ``func`` on.
+            func (callable): Function to run off the Tk main thread.
+            *args: Positional arguments for ``func``.
+            on_done (callable, optional): Called on the Tk main thread with the
+                finished future. Not called for a cancelled future.
+            **kwargs: Keyword arguments for ``func``.
+            
+        Returns:
+            concurrent.futures.Future: The submitted call.
+        """
+        future = executor.submit(func, *args, **kwargs)
+        if on_done is not None:
+            def _deliver(fut):
+                if fut.cancelled():
+                    return
+                try:
+                    self.root.after(0, lambda: on_done(fut))
+                except Exception:
+                    pass  # Window already closed
+            future.add_done_callback(_deliver)
+        return future
+
+    def _cached_history_query(self, func, *args, **kwargs):
+        """Run a History query, reusing its result for ``HISTORY_CACHE_SECONDS``.
+        
+        Entries are stamped with the database ``write_version`` read before
+        the query runs, so any insert, update or delete makes them stale
+        before the time limit runs out. A result is not cached at all if a
+        write landed while the query was running.
+        
+        Args:
+            func (callable): ``db`` query function.
+            *args: Positional arguments for ``func``.
+            **kwargs: Keyword arguments for ``func``.
+            
+        Returns:
+            Any: Result of ``func``, possibly from the cache.
+        """
+        key = (func.__name__, args, tuple(sorted(kwargs.items())))
+        version = db.db_manager.write_version
+        now = time.monotonic()
+        with self._history_cache_lock:
+            hit = self._history_cache.get(key)
+            if hit is not None and hit[0] == version and now - hit[1] < self.HISTORY_CACHE_SECONDS:
+                self._history_cache.move_to_end(key)
+                return hit[2]
+        result = func(*args, **kwargs)
+        if db.db_manager.write_version != version:
+            return result  # May predate the write; don't keep it
+        with self._history_cache_lock:
+            self._history_cache[key] = (version, now, result)
+            self._history_cache.move_to_end(key)
+            while len(self._history_cache) > self.HISTORY_CACHE_SIZE:
+                self._history_cache.popitem(last=False)
+        return result
+
     # ------------------------------------------------------------------
     # Status helpers
     # ------------------------------------------------------------------
     def set_status(self, message: str) -> None:
         """Update the status bar with a message.
         
+        Calls between two idle points of the event loop coalesce into one
+        update showing the last message.
+        
         Args:
             message (str): Status message to display.
         """
-        if self.status_var:
-            self.status_var.set(message)
+        if not self.status_var:
+            return
+        self._pending_status = message
+        if self._status_scheduled:
+            return
+        if self.root is None:
+            self._flush_status()
+            return
+        self._status_scheduled = True
+        try:
+            self.root.after_idle(self._flush_status)
+        except Exception:
+            self._flush_status()
+
+    def _flush_status(self) -> None:
+        """Write the pending status message to the status bar."""
+        self._status_scheduled = False
+        if self.status_var and self._pending_status is not None:
+            self.status_var.set(self._pending_status)
+        self._pending_status = None
 
     def _display_extracted_metadata(self, metadata, file_path: str, db_row) -> None:
         """Display extracted metadata in the text widget.
@@ -948,42 +1488,34 @@ class MetadataAnalyzerApp:
         if not self.c1_text:
             return
 
-        self.c1_text.config(state=NORMAL)
-        self.c1_text.delete(1.0, END)
-        self.c1_text.insert(END, "Extracted Metadata\n", "header")
-        self.c1_text.insert(END, f"File: {os.path.basename(file_path)}\n\n", "bold")
+        segments = [
+            ("Extracted Metadata\n", "header"),
+            (f"File: {os.path.basename(file_path)}\n\n", "bold"),
+        ]
 
         if isinstance(metadata, dict):
             if "Error" in metadata:
-                self.c1_text.insert(END, f"Error: {metadata['Error']}\n", "bold")
+                segments.append((f"Error: {metadata['Error']}\n", "bold"))
             else:
                 for key, value in metadata.items():
-                    self.c1_text.insert(END, f"{key}: ", "bold")
-                    self.c1_text.insert(END, f"{value}\n")
+                    segments.append((f"{key}: ", "bold"))
+                    segments.append((f"{value}\n", ""))
         else:
-            self.c1_text.insert(END, str(metadata))
+            segments.append((str(metadata), ""))
 
         if db_row:
-            def _fmt(dt_str):
-                if not dt_str:
-                    return ""
-                try:
-                    from datetime import datetime
-
-                    return datetime.fromisoformat(dt_str).strftime("%b %d, %Y %I:%M %p")
-                except Exception:
-                    return dt_str
-
-            extracted_at_disp = _fmt(db_row[5]) if len(db_row) > 5 else ""
-            modified_on_disp = _fmt(db_row[6]) if len(db_row) > 6 else ""
+            extracted_at_disp = _humanize(db_row[5]) if len(db_row) > 5 else ""
+            modified_on_disp = _humanize(db_row[6]) if len(db_row) > 6 else ""
 
-            self.c1_text.insert(END, "\n")
-            self.c1_text.insert(END, "Extracted At: ", "bold")
-            self.c1_text.insert(END, f"{extracted_at_disp}\n")
-            self.c1_text.insert(END, "Modified On: ", "bold")
-            self.c1_text.insert(END, f"{modified_on_disp}\n")
+            segments += [
+                ("\n", ""),
+                ("Extracted At: ", "bold"),
+                (f"{extracted_at_disp}\n", ""),
+                ("Modified On: ", "bold"),
+                (f"{modified_on_disp}\n", ""),
+            ]
 
-        self.c1_text.config(state=DISABLED)
+        self._write_c1_text(segments)
 
     # ------------------------------------------------------------------
     # Core actions
@@ -1035,8 +1567,7 @@ class MetadataAnalyzerApp:
                 self.set_status("Extraction completed")
 
             try:
-                if callable(self.history_refresh):
-                    self.history_refresh()
+                self._refresh_history_if_visible()
             except Exception:
                 pass
 
@@ -1118,8 +1649,7 @@ class MetadataAnalyzerApp:
                 if self.progress_bar:
                     self.progress_bar.stop()
                 self._display_extracted_metadata(self.extracted_metadata, self.file_path, db_row)
-                if callable(self.history_refresh):
-                    self.history_refresh()
+                self._refresh_history_if_visible()
             except Exception as exc:
                 if self.progress_bar:
                     self.progress_bar.stop()
@@ -1162,20 +1692,15 @@ class MetadataAnalyzerApp:
             self.file_path = selected_file
             self.extracted_metadata = {}
             self.risk_analysis = None
-            if self.progress_bar:
-                self.progress_bar.start()
-                self.root.after(2000, lambda: self.progress_bar.stop())
             self.set_status(f"File selected: {os.path.basename(selected_file)}")
-            if self.c1_text:
-                self.c1_text.config(state=NORMAL)
-                self.c1_text.delete(1.0, END)
-                self.c1_text.insert(END, "File Information\n", "header")
-                self.c1_text.insert(END, "\n")
-                self.c1_text.insert(END, f"Filename:  {os.path.basename(selected_file)}\n", "bold")
-                self.c1_text.insert(END, f"Path:  {selected_file}\n", "bold")
-                self.c1_text.insert(END, "\nStatus:  Ready for extraction\n\n", "bold")
-                self.c1_text.insert(END, "Click 'Extract' to analyze the file metadata.", "bold")
-                self.c1_text.config(state=DISABLED)
+            self._write_c1_text((
+                ("File Information\n", "header"),
+                ("\n", ""),
+                (f"Filename:  {os.path.basename(selected_file)}\n"
+                 f"Path:  {selected_file}\n"
+                 "\nStatus:  Ready for extraction\n\n"
+                 "Click 'Extract' to analyze the file metadata.", "bold"),
+            ))
 
     def update_report_preview(self, text: str) -> None:
         """Update the report preview panel with formatted text.
@@ -1186,6 +1711,15 @@ class MetadataAnalyzerApp:
             text (str): Report text to display in preview.
         """
         self.report_last_text = text or ""
+        self._ensure_tab_built(self.tab4_ref)
+
+        if self.report_last_text == self._report_rendered_text:
+            try:
+                if self.nb_widget is not None and self.tab4_ref is not None:
+                    self.nb_widget.select(self.tab4_ref)
+            except Exception:
+                pass
+            return
 
         def _show_text_preview():
             try:
@@ -1207,14 +1741,14 @@ class MetadataAnalyzerApp:
 
         def _show_image_preview(pil_img):
             try:
-                try:
-                    from PIL import ImageTk, Image
-                except ImportError:
+                if ImageTk is None:
                     _show_text_preview()
                     return
 
                 # Store original image for zoom operations
                 self.preview_base_image = pil_img
+                self._preview_pyramid = _build_preview_pyramid(pil_img)
+                self._zoom_cache.clear()
                 self.preview_image_zoom = 1.0  # Reset zoom when new image is loaded
                 
                 max_width = self.window_width - 280 if self.window_width else 900
@@ -1224,14 +1758,17 @@ class MetadataAnalyzerApp:
                 width_ratio = max_width / img_width
                 height_ratio = max_height / img_height
                 scale_ratio = min(width_ratio, height_ratio, 1.0)
+                self._base_scale_ratio = scale_ratio
 
                 if scale_ratio < 1.0:
                     new_width = int(img_width * scale_ratio)
                     new_height = int(img_height * scale_ratio)
-                    pil_img = pil_img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+                    source = _pick_mipmap(self._preview_pyramid, (new_width, new_height))
+                    pil_img = source.resize((new_width, new_height), Image.Resampling.LANCZOS)
                     img_width, img_height = new_width, new_height
 
                 self.report_preview_tk_img = ImageTk.PhotoImage(pil_img)
+                self._base_tk_photo = self.report_preview_tk_img
 
                 # Hide text preview
                 if self.report_preview and self.report_preview.winfo_exists():
@@ -1261,40 +1798,27 @@ class MetadataAnalyzerApp:
                 print(f"Error showing image preview: {e}")
                 _show_text_preview()
 
-        def _try_render_image_from_pdf(pdf_path: str) -> bool:
+        def _on_rendered(future):
+            if future is not self._preview_future:
+                return  # A newer report replaced this one
+            self._preview_future = None
             try:
-                try:
-                    from pdf2image import convert_from_path
-                except ImportError:
-                    print("pdf2image not available")
-                    return False
-
-                poppler_path = r"C:\\poppler\\Library\\bin"
-                if poppler_path:
-                    images = convert_from_path(pdf_path, dpi=150, first_page=1, last_page=1, poppler_path=poppler_path)
-                else:
-                    images = convert_from_path(pdf_path, dpi=150, first_page=1, last_page=1)
-
-                if images:
-                    _show_image_preview(images[0])
-                    return True
-                return False
-            except Exception as e:  # pragma: no cover - UI fallback
-                print(f"Error rendering PDF to image: {e}")
-                return False
-
-        def _render_image_preview() -> bool:
-            try:
-                temp_dir = tempfile.gettempdir()
-                temp_pdf = os.path.join(temp_dir, f"metadata_report_preview_{os.getpid()}.pdf")
-                report.create_pdf_report_from_text(self.report_last_text, temp_pdf)
-                return _try_render_image_from_pdf(temp_pdf)
-            except Exception as e:  # pragma: no cover - UI fallback
-                print(f"Error creating preview PDF: {e}")
-                return False
+                pil_img = future.result()
+            except Exception:
+                pil_img = None
+            if pil_img is not None:
+                _show_image_preview(pil_img)
+            else:
+                _show_text_preview()
 
-        if not _render_image_preview():
+        self._report_rendered_text = self.report_last_text
+        if convert_from_path is None or ImageTk is None:
+            self._preview_future = None
             _show_text_preview()
+            return
+        self._preview_future = self._submit_preview(
+            self._render_report_image, self.report_last_text, self._preview_render_dpi(), on_done=_on_rendered
+        )
 
         try:
             if self.nb_widget is not None and self.tab4_ref is not None:
@@ -1302,6 +1826,71 @@ class MetadataAnalyzerApp:
         except Exception:
             pass
 
+    def _preview_render_dpi(self) -> int:
+        """Return the DPI at which to rasterize report pages for the preview.
+        
+        Poppler renders straight at the resolution the fitted page needs at
+        the largest zoom, instead of a full 150 DPI page that is then mostly
+        thrown away by the downscale.
+        
+        Returns:
+            int: Render DPI, at most ``PREVIEW_MAX_DPI``.
+        """
+        max_width = self.window_width - 280 if self.window_width else 900
+        max_height = self.window_height - 150 if self.window_height else 600
+        page_width_in, page_height_in = report.A4[0] / 72, report.A4[1] / 72
+        fit_dpi = min(max_width / page_width_in, max_height / page_height_in)
+        return max(1, min(self.PREVIEW_MAX_DPI, math.ceil(fit_dpi * self.PREVIEW_MAX_ZOOM)))
+
+    def _render_report_image(self, text: str, dpi: int = PREVIEW_MAX_DPI):
+        """Render report text to a PDF and return its first page as an image.
+        
+        Runs on the preview worker thread, so it must not touch any widget.
+        Pages are cached by report text, so previewing a report again skips
+        both the PDF write and the poppler run.
+        
+        Args:
+            text (str): Report text to render.
+            dpi (int): Resolution to rasterize the page at.
+            
+        Returns:
+            PIL.Image.Image | None: First page image, or None when rendering
+                is unavailable or fails.
+        """
+        if convert_from_path is None or Image is None:
+            return None  # No rasterizer, so the PDF would never be shown
+
+        key = (hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest(), dpi)
+        cached = self._preview_render_cache.get(key)
+        if cached is not None:
+            self._preview_render_cache.move_to_end(key)
+            return cached
+
+        try:
+            temp_dir = tempfile.gettempdir()
+            temp_pdf = os.path.join(temp_dir, f"metadata_report_preview_{os.getpid()}.pdf")
+            report.create_pdf_report_from_text(text, temp_pdf)
+        except Exception as e:  # pragma: no cover - UI fallback
+            print(f"Error creating preview PDF: {e}")
+            return None
+
+        try:
+            poppler_path = r"C:\\poppler\\Library\\bin"
+            if poppler_path:
+                images = convert_from_path(temp_pdf, dpi=dpi, first_page=1, last_page=1, poppler_path=poppler_path)
+            else:
+                images = convert_from_path(temp_pdf, dpi=dpi, first_page=1, last_page=1)
+            if not images:
+                return None
+        except Exception as e:  # pragma: no cover - UI fallback
+            print(f"Error rendering PDF to image: {e}")
+            return None
+
+        self._preview_render_cache[key] = images[0]
+        if len(self._preview_render_cache) > self.PREVIEW_RENDER_CACHE_SIZE:
+            self._preview_render_cache.popitem(last=False)
+        return images[0]
+
     def save_report_from_preview(self) -> None:
         """Save the current report preview to a PDF file.
         
@@ -1332,7 +1921,20 @@ class MetadataAnalyzerApp:
     # Canvas centering helper
     # ------------------------------------------------------------------
     def _on_canvas_configure(self, event=None) -> None:
+        """Re-center the image once a burst of canvas resize events settles."""
+        if self.root is None:
+            self._do_center_canvas()
+            return
+        if self._canvas_cfg_after_id is not None:
+            try:
+                self.root.after_cancel(self._canvas_cfg_after_id)
+            except Exception:
+                pass
+        self._canvas_cfg_after_id = self.root.after(self.PREVIEW_RESIZE_DELAY_MS, self._do_center_canvas)
+
+    def _do_center_canvas(self) -> None:
         """Center the image in canvas when canvas is configured/resized."""
+        self._canvas_cfg_after_id = None
         try:
             if self.preview_canvas and self.preview_canvas.winfo_exists():
                 canvas_width = self.preview_canvas.winfo_width()
@@ -1352,7 +1954,7 @@ class MetadataAnalyzerApp:
         if self.preview_base_image is None:
             return
         
-        self.preview_image_zoom = min(self.preview_image_zoom + 0.2, 2.0)  # Max 200%
+        self.preview_image_zoom = min(self.preview_image_zoom + 0.2, self.PREVIEW_MAX_ZOOM)  # Max 200%
         self._apply_image_zoom()
     
     def zoom_out_image(self) -> None:
@@ -1371,31 +1973,74 @@ class MetadataAnalyzerApp:
         self.preview_image_zoom = 1.0
         self._apply_image_zoom()
     
-    def _apply_image_zoom(self) -> None:
-        """Apply the current zoom level to the preview image."""
+    def _apply_image_zoom(self, final: bool = False) -> None:
+        """Apply the current zoom level to the preview image.
+        
+        Renders from the smallest pyramid level that covers the zoomed size.
+        Zoom clicks get a quick NEAREST redraw, and a BILINEAR redraw follows
+        once they stop. The smooth renders are cached per zoom level.
+        
+        Args:
+            final (bool): Draw the smooth version now instead of scheduling it.
+        """
         try:
-            from PIL import ImageTk, Image
-            
-            if self.preview_base_image is None:
+            if ImageTk is None or self.preview_base_image is None:
                 return
+
+            if self._preview_zoom_after_id is not None:
+                try:
+                    self.root.after_cancel(self._preview_zoom_after_id)
+                except Exception:
+                    pass
+                self._preview_zoom_after_id = None
             
-            # Calculate dimensions with zoom
-            max_width = self.window_width - 280 if self.window_width else 900
-            max_height = self.window_height - 150 if self.window_height else 600
-            
+            if not self._preview_pyramid or self._preview_pyramid[0] is not self.preview_base_image:
+                self._preview_pyramid = _build_preview_pyramid(self.preview_base_image)
+                self._zoom_cache.clear()
+                self._base_scale_ratio = None
+
+            # The fit-to-window scale only changes with the base image
             img_width, img_height = self.preview_base_image.size
-            width_ratio = max_width / img_width
-            height_ratio = max_height / img_height
-            base_scale_ratio = min(width_ratio, height_ratio, 1.0)
+            if self._base_scale_ratio is None:
+                max_width = self.window_width - 280 if self.window_width else 900
+                max_height = self.window_height - 150 if self.window_height else 600
+                self._base_scale_ratio = min(max_width / img_width, max_height / img_height, 1.0)
             
             # Apply base scale and zoom
-            final_scale = base_scale_ratio * self.preview_image_zoom
+            final_scale = self._base_scale_ratio * self.preview_image_zoom
             new_width = int(img_width * final_scale)
             new_height = int(img_height * final_scale)
             
-            # Resize image
-            resized_img = self.preview_base_image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            self.report_preview_tk_img = ImageTk.PhotoImage(resized_img)
+            # Reuse a smooth render of this zoom level, else resize from the closest mipmap
+            zoom_key = (round(self.preview_image_zoom, 2), new_width, new_height)
+            cached = self._zoom_cache.get(zoom_key)
+            native_step = _integer_zoom_step(self.preview_image_zoom)
+            if cached is not None:
+                self._zoom_cache.move_to_end(zoom_key)
+                self.report_preview_tk_img = cached
+            elif self._base_tk_photo is not None and abs(self.preview_image_zoom - 1.0) < 0.01:
+                # 100% is the fitted image that was shown first
+                self.report_preview_tk_img = self._base_tk_photo
+            elif self._base_tk_photo is not None and native_step is not None and not final:
+                # Integer ratios scale the 100% image in Tk itself; the smooth redraw follows
+                method, n = native_step
+                # ImageTk photos lack zoom()/subsample(), so issue Tk's "copy" directly
+                scaled = PhotoImage(master=self.root)
+                scaled.tk.call(scaled, "copy", str(self._base_tk_photo), f"-{method}", n, n)
+                self.report_preview_tk_img = scaled
+                if self.root is not None:
+                    self._preview_zoom_after_id = self.root.after(200, lambda: self._apply_image_zoom(final=True))
+            else:
+                source = _pick_mipmap(self._preview_pyramid, (new_width, new_height))
+                resample = Image.Resampling.BILINEAR if final else Image.Resampling.NEAREST
+                resized_img = source.resize((new_width, new_height), resample)
+                self.report_preview_tk_img = ImageTk.PhotoImage(resized_img)
+                if final:
+                    self._zoom_cache[zoom_key] = self.report_preview_tk_img
+                    if len(self._zoom_cache) > self.PREVIEW_ZOOM_CACHE_SIZE:
+                        self._zoom_cache.popitem(last=False)
+                elif self.root is not None:
+                    self._preview_zoom_after_id = self.root.after(200, lambda: self._apply_image_zoom(final=True))
             
             # Update label
             if self.report_image_label and self.report_image_label.winfo_exists():
@@ -1503,8 +2148,7 @@ class MetadataAnalyzerApp:
                 messagebox.showwarning("Partial Success", f"✓ Database updated\n⚠ File: {file_message}")
 
             try:
-                if callable(self.history_refresh):
-                    self.history_refresh()
+                self._refresh_history_if_visible()
             except Exception:
                 pass
 
@@ -1568,30 +2212,30 @@ class MetadataAnalyzerApp:
         main_frame.pack(fill=BOTH, expand=True)
         
         # Title label
-        title_label = Label(main_frame, text="Add Custom Metadata", bg="#ffffff", font=("Segoe UI", 13, "bold"), fg="#1a1a1a")
+        title_label = Label(main_frame, text="Add Custom Metadata", bg="#ffffff", font=self._font(13, "bold"), fg="#1a1a1a")
         title_label.pack(anchor=W, pady=(0, 20))
         
         # Description label
-        desc_label = Label(main_frame, text="Add new metadata field for your file (e.g., GPS location, camera info, custom tags)", bg="#ffffff", font=("Segoe UI", 9), fg="#666666", wraplength=500, justify=LEFT)
+        desc_label = Label(main_frame, text="Add new metadata field for your file (e.g., GPS location, camera info, custom tags)", bg="#ffffff", font=self._font(9), fg="#666666", wraplength=500, justify=LEFT)
         desc_label.pack(anchor=W, pady=(0, 18))
         
         # Field name label and entry
-        field_name_label = Label(main_frame, text="Field Name:", bg="#ffffff", font=("Segoe UI", 11, "bold"), fg="#333333")
+        field_name_label = Label(main_frame, text="Field Name:", bg="#ffffff", font=self._font(11, "bold"), fg="#333333")
         field_name_label.pack(anchor=W, pady=(0, 8))
         
-        field_name_entry = ttk.Entry(main_frame, font=("Segoe UI", 10), width=50)
+        field_name_entry = ttk.Entry(main_frame, font=self._font(10), width=50)
         field_name_entry.pack(fill=X, pady=(0, 16))
         field_name_entry.focus()
         
         # Field value label and entry
-        field_value_label = Label(main_frame, text="Field Value:", bg="#ffffff", font=("Segoe UI", 11, "bold"), fg="#333333")
+        field_value_label = Label(main_frame, text="Field Value:", bg="#ffffff", font=self._font(11, "bold"), fg="#333333")
         field_value_label.pack(anchor=W, pady=(0, 8))
         
-        field_value_entry = ttk.Entry(main_frame, font=("Segoe UI", 10), width=50)
+        field_value_entry = ttk.Entry(main_frame, font=self._font(10), width=50)
         field_value_entry.pack(fill=X, pady=(0, 12))
         
         # Example text
-        example_label = Label(main_frame, text="Examples: GPS Latitude: 40.7128 | Camera Model: Canon EOS | Author: John Doe", bg="#ffffff", font=("Segoe UI", 9, "italic"), fg="#999999", wraplength=500, justify=LEFT)
+        example_label = Label(main_frame, text="Examples: GPS Latitude: 40.7128 | Camera Model: Canon EOS | Author: John Doe", bg="#ffffff", font=self._font(9, "italic"), fg="#999999", wraplength=500, justify=LEFT)
         example_label.pack(anchor=W, pady=(0, 20))
         
         # Buttons frame
@@ -1687,12 +2331,18 @@ class MetadataAnalyzerApp:
         )
         if filepath:
             try:
-                with open(filepath, "w", encoding="utf-8") as f:
-                    if filepath.endswith(".json"):
-                        json.dump(self.extracted_metadata, f, indent=4)
-                    else:
-                        for key, value in self.extracted_metadata.items():
-                            f.write(f"{key}: {value}\n")
+                # Both JSON paths write the same layout: 2-space indents (all
+                # orjson supports) and UTF-8 text rather than \u escapes
+                if filepath.endswith(".json") and orjson is not None:
+                    with open(filepath, "wb") as f:
+                        f.write(orjson.dumps(self.extracted_metadata, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+                else:
+                    with open(filepath, "w", encoding="utf-8") as f:
+                        if filepath.endswith(".json"):
+                            json.dump(self.extracted_metadata, f, indent=2, ensure_ascii=False)
+                        else:
+                            for key, value in self.extracted_metadata.items():
+                                f.write(f"{key}: {value}\n")
                 self.set_status(f"Exported to {os.path.basename(filepath)}")
                 messagebox.showinfo("Success", "Metadata exported successfully.")
             except Exception as e:
@@ -1703,11 +2353,7 @@ class MetadataAnalyzerApp:
             self.extracted_metadata = {}
             self.file_path = None
             self.risk_analysis = None
-            if self.c1_text:
-                self.c1_text.config(state=NORMAL)
-                self.c1_text.delete(1.0, END)
-                self.c1_text.insert(END, "Data cleared. Ready to start.\n")
-                self.c1_text.config(state=DISABLED)
+            self._write_c1_text((("Data cleared. Ready to start.\n", ""),))
             self._render_risk_analysis(None)
             self._clear_editor_fields()
             self.set_status("Data cleared")
@@ -1735,7 +2381,6 @@ class MetadataAnalyzerApp:
     def menu_backup_database(self) -> None:
         try:
             import shutil
-            from datetime import datetime
 
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_path = filedialog.asksaveasfilename(
@@ -1755,8 +2400,7 @@ class MetadataAnalyzerApp:
         if messagebox.askyesno("Clear History", "Delete all metadata history? This cannot be undone."):
             if db.clear_metadata():
                 messagebox.showinfo("Success", "History cleared successfully.")
-                if callable(self.history_refresh):
-                    self.history_refresh()
+                self._refresh_history_if_visible()
                 self.set_status("History cleared")
             else:
                 messagebox.showerror("Error", "Failed to clear history.")
@@ -1822,13 +2466,13 @@ class MetadataAnalyzerApp:
         settings_window.transient(self.root)
         settings_window.grab_set()
 
-        title_label = Label(settings_window, text="Application Settings", font=("Segoe UI", 14, "bold"), bg="#f5f7fa")
+        title_label = Label(settings_window, text="Application Settings", font=self._font(14, "bold"), bg="#f5f7fa")
         title_label.pack(fill=X, padx=15, pady=(15, 10))
 
         settings_frame = Frame(settings_window, bg="#ffffff")
         settings_frame.pack(fill=BOTH, expand=True, padx=15, pady=10)
 
-        Label(settings_frame, text="Display Settings", font=("Segoe UI", 11, "bold"), bg="#ffffff").pack(anchor=W, pady=(0, 8))
+        Label(settings_frame, text="Display Settings", font=self._font(11, "bold"), bg="#ffffff").pack(anchor=W, pady=(0, 8))
 
         theme_frame = Frame(settings_frame, bg="#ffffff")
         theme_frame.pack(fill=X, pady=5)
@@ -1842,7 +2486,7 @@ class MetadataAnalyzerApp:
         font_var = StringVar(value="11")
         ttk.Combobox(font_frame, textvariable=font_var, values=["9", "10", "11", "12", "13", "14"], state="readonly", width=20).pack(side=LEFT)
 
-        Label(settings_frame, text="Behavior Settings", font=("Segoe UI", 11, "bold"), bg="#ffffff").pack(anchor=W, pady=(15, 8))
+        Label(settings_frame, text="Behavior Settings", font=self._font(11, "bold"), bg="#ffffff").pack(anchor=W, pady=(15, 8))
 
         auto_refresh_var = BooleanVar(value=True)
         Checkbutton(settings_frame, text="Auto-refresh history on data change", variable=auto_refresh_var, bg="#ffffff").pack(anchor=W, pady=3)
@@ -1892,7 +2536,7 @@ class MetadataAnalyzerApp:
         Label(
             header_frame, 
             text="Recent Files", 
-            font=("Segoe UI", 16, "bold"), 
+            font=self._font(16, "bold"), 
             bg="#0066cc", 
             fg="white"
         ).pack(side=LEFT, padx=20, pady=15)
@@ -1900,7 +2544,7 @@ class MetadataAnalyzerApp:
         Label(
             header_frame, 
             text="Last 10 extracted files", 
-            font=("Segoe UI", 9), 
+            font=self._font(9), 
             bg="#0066cc", 
             fg="#b3d9ff"
         ).pack(side=LEFT, padx=(0, 20), pady=15)
@@ -1920,7 +2564,7 @@ class MetadataAnalyzerApp:
                 Label(
                     empty_frame, 
                     text="No Files", 
-                    font=("Segoe UI", 24, "bold"), 
+                    font=self._font(24, "bold"), 
                     bg="#ffffff", 
                     fg="#cccccc"
                 ).pack(pady=(40, 10))
@@ -1928,7 +2572,7 @@ class MetadataAnalyzerApp:
                 Label(
                     empty_frame, 
                     text="No recent files", 
-                    font=("Segoe UI", 12, "bold"), 
+                    font=self._font(12, "bold"), 
                     bg="#ffffff", 
                     fg="#666666"
                 ).pack(pady=(0, 5))
@@ -1936,7 +2580,7 @@ class MetadataAnalyzerApp:
                 Label(
                     empty_frame, 
                     text="Extract metadata from files to see them here", 
-                    font=("Segoe UI", 10), 
+                    font=self._font(10), 
                     bg="#ffffff", 
                     fg="#999999"
                 ).pack(pady=(0, 40))
@@ -1994,7 +2638,7 @@ class MetadataAnalyzerApp:
                     Label(
                         index_frame, 
                         text=str(idx), 
-                        font=("Segoe UI", 12, "bold"), 
+                        font=self._font(12, "bold"), 
                         bg="#0066cc", 
                         fg="white"
                     ).place(relx=0.5, rely=0.5, anchor=CENTER)
@@ -2007,7 +2651,7 @@ class MetadataAnalyzerApp:
                     Label(
                         info_frame, 
                         text=row[2], 
-                        font=("Segoe UI", 11, "bold"), 
+                        font=self._font(11, "bold"), 
                         bg="#ffffff", 
                         fg="#1a1a1a", 
                         anchor=W
@@ -2017,7 +2661,7 @@ class MetadataAnalyzerApp:
                     path_label = Label(
                         info_frame, 
                         text=f"Path: {row[1]}", 
-                        font=("Segoe UI", 9), 
+                        font=self._font(9), 
                         bg="#ffffff", 
                         fg="#666666", 
                         anchor=W
@@ -2031,7 +2675,7 @@ class MetadataAnalyzerApp:
                     Label(
                         meta_frame, 
                         text=row[4].upper(), 
-                        font=("Segoe UI", 8, "bold"), 
+                        font=self._font(8, "bold"), 
                         bg="#e8f4fd", 
                         fg="#0066cc", 
                         relief=FLAT,
@@ -2042,7 +2686,7 @@ class MetadataAnalyzerApp:
                     Label(
                         meta_frame, 
                         text=row[3], 
-                        font=("Segoe UI", 8), 
+                        font=self._font(8), 
                         bg="#f0f0f0", 
                         fg="#666666",
                         relief=FLAT,
@@ -2055,7 +2699,7 @@ class MetadataAnalyzerApp:
                         Label(
                             meta_frame, 
                             text=row[5], 
-                            font=("Segoe UI", 8), 
+                            font=self._font(8), 
                             bg="#f0f0f0", 
                             fg="#666666",
                             relief=FLAT,
@@ -2070,7 +2714,7 @@ class MetadataAnalyzerApp:
             Label(
                 error_frame, 
                 text="ERROR", 
-                font=("Segoe UI", 24, "bold"), 
+                font=self._font(24, "bold"), 
                 bg="#ffffff", 
                 fg="#ff6b6b"
             ).pack(pady=(40, 10))
@@ -2078,7 +2722,7 @@ class MetadataAnalyzerApp:
             Label(
                 error_frame, 
                 text="Error Loading Recent Files", 
-                font=("Segoe UI", 12, "bold"), 
+                font=self._font(12, "bold"), 
                 bg="#ffffff", 
                 fg="#ff6b6b"
             ).pack(pady=(0, 5))
@@ -2086,7 +2730,7 @@ class MetadataAnalyzerApp:
             Label(
                 error_frame, 
                 text=str(e), 
-                font=("Segoe UI", 9), 
+                font=self._font(9), 
                 bg="#ffffff", 
                 fg="#999999", 
                 wraplength=500
@@ -2148,12 +2792,12 @@ class MetadataAnalyzerApp:
         batch_window.transient(self.root)
         batch_window.grab_set()
 
-        Label(batch_window, text="Batch Process Metadata Extraction", font=("Segoe UI", 14, "bold"), bg="#f5f7fa").pack(fill=X, padx=15, pady=10)
+        Label(batch_window, text="Batch Process Metadata Extraction", font=self._font(14, "bold"), bg="#f5f7fa").pack(fill=X, padx=15, pady=10)
 
         main_frame = Frame(batch_window, bg="#ffffff")
         main_frame.pack(fill=BOTH, expand=True, padx=15, pady=10)
 
-        Label(main_frame, text="Select files to process:", font=("Segoe UI", 10, "bold"), bg="#ffffff").pack(anchor=W, pady=(0, 8))
+        Label(main_frame, text="Select files to process:", font=self._font(10, "bold"), bg="#ffffff").pack(anchor=W, pady=(0, 8))
 
         files_listbox = Listbox(main_frame, height=10, bg="#ffffff", fg="#333333")
         files_listbox.pack(fill=BOTH, expand=True, pady=(0, 10))
@@ -2215,8 +2859,7 @@ class MetadataAnalyzerApp:
 
                 messagebox.showinfo("Batch Process Complete", result_msg)
                 self._render_risk_analysis(self.risk_analysis)
-                if callable(self.history_refresh):
-                    self.history_refresh()
+                self._refresh_history_if_visible()
                 batch_window.destroy()
             except Exception as e:
                 messagebox.showerror("Error", f"Batch process failed: {str(e)}")
@@ -2261,18 +2904,18 @@ class MetadataAnalyzerApp:
         content_frame.pack(fill=BOTH, expand=True, padx=20, pady=18)
         
         # Title
-        title_label = Label(content_frame, text=title, font=("Segoe UI", 10, "bold"), 
+        title_label = Label(content_frame, text=title, font=self._font(10, "bold"), 
                            bg=bg_start, fg="white", anchor=W)
         title_label.pack(fill=X, pady=(0, 8))
         
         # Value
-        value_label = Label(content_frame, text=value, font=("Segoe UI", 24, "bold"), 
+        value_label = Label(content_frame, text=value, font=self._font(24, "bold"), 
                            bg=bg_start, fg="white", anchor=W)
         value_label.pack(fill=X, pady=(0, 5))
         
         # Subtitle
         if subtitle:
-            subtitle_label = Label(content_frame, text=subtitle, font=("Segoe UI", 9), 
+            subtitle_label = Label(content_frame, text=subtitle, font=self._font(9), 
                                   bg=bg_start, fg="#f0f0f0", anchor=W)
             subtitle_label.pack(fill=X)
         
@@ -2351,12 +2994,12 @@ class MetadataAnalyzerApp:
         header_content.pack(fill=BOTH, expand=True, padx=20, pady=10)
         
         Label(header_content, text="Statistical Dashboard", 
-              font=("Segoe UI", 20, "bold"), bg="#667eea", fg="white").pack(side=LEFT)
+              font=self._font(20, "bold"), bg="#667eea", fg="white").pack(side=LEFT)
         
         # Refresh button
         refresh_btn = Button(header_content, text="⟳ Refresh", 
                             command=lambda: schedule_refresh(force_fetch=True),
-                            bg="#5a67d8", fg="white", font=("Segoe UI", 10, "bold"),
+                            bg="#5a67d8", fg="white", font=self._font(10, "bold"),
                             relief=FLAT, cursor="hand2", padx=15, pady=8)
         refresh_btn.pack(side=RIGHT, padx=5)
         
@@ -2375,7 +3018,7 @@ class MetadataAnalyzerApp:
         filter_content.pack(fill=BOTH, expand=True, padx=10, pady=10)
         
         # Date range filter
-        Label(filter_content, text="Period:", font=("Segoe UI", 10, "bold"),
+        Label(filter_content, text="Period:", font=self._font(10, "bold"),
               bg="white").pack(side=LEFT, padx=(0, 5))
         date_combo = ttk.Combobox(filter_content, textvariable=filter_vars['date_range'],
                                   values=["All Time", "Last 7 Days", "Last 30 Days", 
@@ -2385,7 +3028,7 @@ class MetadataAnalyzerApp:
         date_combo.bind('<<ComboboxSelected>>', lambda e: schedule_refresh())
         
         # File type filter
-        Label(filter_content, text="Type:", font=("Segoe UI", 10, "bold"),
+        Label(filter_content, text="Type:", font=self._font(10, "bold"),
               bg="white").pack(side=LEFT, padx=(20, 5))
         type_combo = ttk.Combobox(filter_content, textvariable=filter_vars['file_type'],
                                   state="readonly", width=15)
@@ -2393,7 +3036,7 @@ class MetadataAnalyzerApp:
         type_combo.bind('<<ComboboxSelected>>', lambda e: schedule_refresh())
         
         # Search box
-        Label(filter_content, text="Search:", font=("Segoe UI", 10, "bold"),
+        Label(filter_content, text="Search:", font=self._font(10, "bold"),
               bg="white").pack(side=LEFT, padx=(20, 5))
         search_entry = ttk.Entry(filter_content, textvariable=filter_vars['search'], width=25)
         search_entry.pack(side=LEFT, padx=5)
@@ -2402,7 +3045,7 @@ class MetadataAnalyzerApp:
         # Apply filters button
         apply_btn = Button(filter_content, text="Apply Filters",
                           command=lambda: schedule_refresh(),
-                          bg="#667eea", fg="white", font=("Segoe UI", 9, "bold"),
+                          bg="#667eea", fg="white", font=self._font(9, "bold"),
                           relief=FLAT, cursor="hand2", padx=12, pady=5)
         apply_btn.pack(side=RIGHT, padx=5)
 
@@ -2636,7 +3279,7 @@ class MetadataAnalyzerApp:
             loading_frame = Frame(scrollable_frame, bg="white", relief=FLAT)
             loading_frame.pack(fill=BOTH, expand=True, padx=20, pady=50)
             Label(loading_frame, text="Loading statistics...",
-                  font=("Segoe UI", 14, "bold"), bg="white", fg="#667eea").pack(pady=(30, 10))
+                  font=self._font(14, "bold"), bg="white", fg="#667eea").pack(pady=(30, 10))
 
             refresh_btn.config(state=DISABLED, text="Refreshing...")
 
@@ -2666,9 +3309,9 @@ class MetadataAnalyzerApp:
                         error_frame = Frame(scrollable_frame, bg="white", relief=FLAT)
                         error_frame.pack(fill=BOTH, expand=True, padx=20, pady=50)
                         Label(error_frame, text="Error Loading Statistics",
-                              font=("Segoe UI", 16, "bold"), bg="white", fg="#e74c3c").pack(pady=(30, 10))
+                              font=self._font(16, "bold"), bg="white", fg="#e74c3c").pack(pady=(30, 10))
                         Label(error_frame, text=str(error),
-                              font=("Segoe UI", 11), bg="white", fg="#95a5a6").pack(pady=(0, 30))
+                              font=self._font(11), bg="white", fg="#95a5a6").pack(pady=(0, 30))
                         return
 
                     dashboard_state['records_cache'] = all_records
@@ -2678,9 +3321,9 @@ class MetadataAnalyzerApp:
                         empty_frame = Frame(scrollable_frame, bg="white", relief=FLAT)
                         empty_frame.pack(fill=BOTH, expand=True, padx=20, pady=50)
                         Label(empty_frame, text="No matching data",
-                              font=("Segoe UI", 16, "bold"), bg="white", fg="#888").pack(pady=(30, 10))
+                              font=self._font(16, "bold"), bg="white", fg="#888").pack(pady=(30, 10))
                         Label(empty_frame, text="Adjust filters or extract more files!",
-                              font=("Segoe UI", 12), bg="white", fg="#aaa").pack(pady=(0, 30))
+                              font=self._font(12), bg="white", fg="#aaa").pack(pady=(0, 30))
                         return
 
                     render_enhanced_dashboard(stats, filtered)
@@ -2758,7 +3401,7 @@ class MetadataAnalyzerApp:
             charts_section1.pack(fill=BOTH, expand=True, padx=10, pady=(8, 0))
             
             Label(charts_section1, text="Extended Analytics", 
-                  font=("Segoe UI", 14, "bold"), bg="#f0f2f5", fg="#2c3e50").pack(anchor=W, pady=(0, 10))
+                  font=self._font(14, "bold"), bg="#f0f2f5", fg="#2c3e50").pack(anchor=W, pady=(0, 10))
             
             charts_frame1 = Frame(charts_section1, bg="white", relief=FLAT, bd=2)
             charts_frame1.pack(fill=BOTH, expand=True)
@@ -2816,7 +3459,7 @@ class MetadataAnalyzerApp:
             insights_section.pack(fill=X, padx=10, pady=(15, 0))
             
             Label(insights_section, text="Metadata Insights", 
-                  font=("Segoe UI", 14, "bold"), bg="#f0f2f5", fg="#2c3e50").pack(anchor=W, pady=(0, 10))
+                  font=self._font(14, "bold"), bg="#f0f2f5", fg="#2c3e50").pack(anchor=W, pady=(0, 10))
             
             insights_frame = Frame(insights_section, bg="white", relief=FLAT, bd=2)
             insights_frame.pack(fill=X, padx=0, pady=0)
@@ -2830,16 +3473,16 @@ class MetadataAnalyzerApp:
             duplicates = {name: count for name, count in filename_counts.items() if count > 1}
             
             Label(insights_grid, text=f"Potential Duplicates: {len(duplicates)}", 
-                  font=("Segoe UI", 11, "bold"), bg="white", 
+                  font=self._font(11, "bold"), bg="white", 
                   fg="#e74c3c" if duplicates else "#27ae60").grid(row=0, column=0, sticky=W, padx=10, pady=5)
             Label(insights_grid, text=f"Unique Files: {len(filename_counts)}", 
-                  font=("Segoe UI", 11), bg="white", fg="#2c3e50").grid(row=0, column=1, sticky=W, padx=10, pady=5)
+                  font=self._font(11), bg="white", fg="#2c3e50").grid(row=0, column=1, sticky=W, padx=10, pady=5)
             
             # Completeness score
             complete_count = sum(1 for r in filtered_records if len(r) >= 6 and all(r[i] for i in range(2, 6)))
             completeness = (complete_count / stats['total'] * 100) if stats['total'] > 0 else 0
             Label(insights_grid, text=f"Metadata Completeness: {completeness:.1f}%", 
-                  font=("Segoe UI", 11, "bold"), bg="white", 
+                  font=self._font(11, "bold"), bg="white", 
                   fg="#27ae60" if completeness > 80 else "#f39c12").grid(row=0, column=2, sticky=W, padx=10, pady=5)
 
             # Recent extractions with enhanced info - maximize space usage
@@ -2847,7 +3490,7 @@ class MetadataAnalyzerApp:
             recent_section.pack(fill=X, padx=10, pady=(15, 15))
             
             Label(recent_section, text="Recent Extractions", 
-                  font=("Segoe UI", 14, "bold"), bg="#f0f2f5", fg="#2c3e50").pack(anchor=W, pady=(0, 10))
+                  font=self._font(14, "bold"), bg="#f0f2f5", fg="#2c3e50").pack(anchor=W, pady=(0, 10))
             
             recent_frame = Frame(recent_section, bg="white", relief=FLAT, bd=2)
             recent_frame.pack(fill=X)
@@ -2862,16 +3505,16 @@ class MetadataAnalyzerApp:
                 row_frame = Frame(recent_frame, bg="white", cursor="hand2")
                 row_frame.pack(fill=X, padx=15, pady=8)
                 
-                badge = Label(row_frame, text=str(i), font=("Segoe UI", 10, "bold"),
+                badge = Label(row_frame, text=str(i), font=self._font(10, "bold"),
                             bg=gradient_colors[i-1], fg="white", width=3, height=1)
                 badge.pack(side=LEFT, padx=(0, 12))
                 
                 info_frame = Frame(row_frame, bg="white")
                 info_frame.pack(side=LEFT, fill=X, expand=True)
                 
-                Label(info_frame, text=display_name, font=("Segoe UI", 10, "bold"),
+                Label(info_frame, text=display_name, font=self._font(10, "bold"),
                      bg="white", fg="#2c3e50", anchor=W).pack(fill=X)
-                Label(info_frame, text=f"{file_type} • {file_size}", font=("Segoe UI", 9),
+                Label(info_frame, text=f"{file_type} • {file_size}", font=self._font(9),
                      bg="white", fg="#7f8c8d", anchor=W).pack(fill=X)
                 
                 def make_hover(frame, bg_color, badge_widget):
@@ -2915,7 +3558,7 @@ class MetadataAnalyzerApp:
         
         close_btn = Button(button_frame, text="Close Dashboard",
                           command=close_stats_window,
-                          bg="#667eea", fg="white", font=("Segoe UI", 11, "bold"),
+                          bg="#667eea", fg="white", font=self._font(11, "bold"),
                           relief=FLAT, cursor="hand2", padx=30, pady=10,
                           activebackground="#764ba2", activeforeground="white")
         close_btn.pack(pady=10)
@@ -2959,20 +3602,20 @@ class MetadataAnalyzerApp:
         center_y = parent_y + (parent_h - win_h) // 2
         issue_window.geometry(f"{win_w}x{win_h}+{center_x}+{center_y}")
 
-        Label(issue_window, text="Report an Issue", font=("Segoe UI", 14, "bold"), bg="#f5f7fa").pack(fill=X, padx=15, pady=10)
+        Label(issue_window, text="Report an Issue", font=self._font(14, "bold"), bg="#f5f7fa").pack(fill=X, padx=15, pady=10)
 
         main_frame = Frame(issue_window, bg="#ffffff")
         main_frame.pack(fill=BOTH, expand=True, padx=15, pady=10)
 
-        Label(main_frame, text="Issue Title:", font=("Segoe UI", 10, "bold"), bg="#ffffff").pack(anchor=W, pady=(0, 5))
+        Label(main_frame, text="Issue Title:", font=self._font(10, "bold"), bg="#ffffff").pack(anchor=W, pady=(0, 5))
         title_entry = ttk.Entry(main_frame, width=50)
         title_entry.pack(fill=X, pady=(0, 10))
 
-        Label(main_frame, text="Description:", font=("Segoe UI", 10, "bold"), bg="#ffffff").pack(anchor=W, pady=(0, 5))
-        desc_text = scrolledtext.ScrolledText(main_frame, height=12, width=60, wrap=WORD, font=("Segoe UI", 10))
+        Label(main_frame, text="Description:", font=self._font(10, "bold"), bg="#ffffff").pack(anchor=W, pady=(0, 5))
+        desc_text = scrolledtext.ScrolledText(main_frame, height=12, width=60, wrap=WORD, font=self._font(10))
         desc_text.pack(fill=BOTH, expand=True, pady=(0, 10))
 
-        Label(main_frame, text="Category:", font=("Segoe UI", 10, "bold"), bg="#ffffff").pack(anchor=W, pady=(0, 5))
+        Label(main_frame, text="Category:", font=self._font(10, "bold"), bg="#ffffff").pack(anchor=W, pady=(0, 5))
         category_var = StringVar()
         ttk.Combobox(main_frame, textvariable=category_var, values=["Bug", "Feature Request", "Improvement", "Documentation", "Other"], state="readonly", width=47).pack(fill=X, pady=(0, 10))
 
@@ -1,4 +1,5 @@
 import pandas as pd
+import csv
 import json
 import xml.etree.ElementTree as ET
 from tkinter import filedialog, messagebox
@@ -13,9 +14,30 @@ import sys
 import tempfile
 
 
+CSV_HEADERS = [
+    'ID',
+    'File Path',
+    'File Name',
+    'File Size',
+    'File Type',
+    'Extracted At',
+    'Modified On',
+    'Full Metadata',
+]
+
+
 class MetadataReporter:
     """Object-oriented metadata report generator with PDF/JSON/XML/CSV/Excel export."""
 
+    # Export format -> (file extension, file dialog label)
+    EXPORT_FILE_TYPES = {
+        "csv": (".csv", "CSV files"),
+        "json": (".json", "JSON files"),
+        "xml": (".xml", "XML files"),
+        "excel": (".xlsx", "Excel files"),
+        "pdf": (".pdf", "PDF files"),
+    }
+
     def __init__(self):
         pass
 
@@ -387,7 +409,7 @@ class MetadataReporter:
 
         if file_path:
             try:
-                df.to_json(file_path, orient='records', indent=4)
+                self.write_json(df, file_path)
                 messagebox.showinfo("Export Successful", f"Metadata exported to {file_path}")
             except Exception as e:
                 messagebox.showerror("Export Error", f"Failed to export JSON: {str(e)}")
@@ -414,16 +436,7 @@ class MetadataReporter:
 
         if file_path:
             try:
-                root = ET.Element("metadata_records")
-
-                for index, row in df.iterrows():
-                    record = ET.SubElement(root, "record")
-                    for col in df.columns:
-                        element = ET.SubElement(record, col.lower().replace(' ', '_'))
-                        element.text = str(row[col]) if pd.notna(row[col]) else ""
-
-                tree = ET.ElementTree(root)
-                tree.write(file_path, encoding='utf-8', xml_declaration=True)
+                self.write_xml(df, file_path)
                 messagebox.showinfo("Export Successful", f"Metadata exported to {file_path}")
             except Exception as e:
                 messagebox.showerror("Export Error", f"Failed to export XML: {str(e)}")
@@ -450,22 +463,25 @@ class MetadataReporter:
 
         if file_path:
             try:
-                with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
-                    df.to_excel(writer, sheet_name='Metadata', index=False)
+                self.write_excel(df, file_path)
                 messagebox.showinfo("Export Successful", f"Metadata exported to {file_path}")
             except Exception as e:
                 messagebox.showerror("Export Error", f"Failed to export Excel: {str(e)}")
 
     def export_to_csv(self, data):
-        """Convert tuple data to DataFrame and save as CSV with standard headers.
+        """Write tuple data to CSV with standard headers, one row at a time.
         
         Args:
-            data (list): List of metadata record tuples.
+            data (Iterable): Metadata record tuples; may be a list or a lazy
+                iterator such as ``db.iter_all_metadata()``. Rows without the
+                trailing Full Metadata column get a matching shorter header.
             
         Returns:
             None: Shows file dialog for user to save CSV file.
         """
-        if not data:
+        rows = iter(data or ())
+        first = next(rows, None)
+        if first is None:
             messagebox.showwarning("No Data", "There is no metadata to export.")
             return
 
@@ -478,24 +494,80 @@ class MetadataReporter:
 
         if file_path:
             try:
-                df = pd.DataFrame(
-                    data,
-                    columns=[
-                        'ID',
-                        'File Path',
-                        'File Name',
-                        'File Size',
-                        'File Type',
-                        'Extracted At',
-                        'Modified On',
-                        'Full Metadata',
-                    ],
-                )
-                df.to_csv(file_path, index=False)
+                self._write_csv_rows(first, rows, file_path)
                 messagebox.showinfo("Export Successful", f"Metadata exported to {file_path}")
             except Exception as e:
                 messagebox.showerror("Export Error", f"Failed to export CSV: {str(e)}")
 
+    # ------------------------------------------------------------------
+    # Dialog-free writers, safe to call off the Tk main thread
+    # ------------------------------------------------------------------
+    def ask_export_path(self, format_type):
+        """Ask the user where to save an export of the given format.
+        
+        Args:
+            format_type (str): Export format ('csv', 'json', 'xml', 'excel', 'pdf').
+            
+        Returns:
+            str: Chosen file path, or an empty string if the dialog was cancelled.
+        """
+        extension, label = self.EXPORT_FILE_TYPES[format_type]
+        default_name = f"metadata_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}{extension}"
+        return filedialog.asksaveasfilename(
+            defaultextension=extension,
+            initialfile=default_name,
+            filetypes=[(label, f"*{extension}"), ("All files", "*.*")]
+        )
+
+    def write_csv(self, data, file_path):
+        """Write record tuples to ``file_path`` as CSV, one row at a time.
+        
+        Args:
+            data (Iterable): Metadata record tuples, possibly a lazy iterator.
+            file_path (str): Output CSV file path.
+            
+        Returns:
+            int: Number of records written. No file is created for empty data.
+        """
+        rows = iter(data or ())
+        first = next(rows, None)
+        if first is None:
+            return 0
+        return self._write_csv_rows(first, rows, file_path)
+
+    @staticmethod
+    def _write_csv_rows(first, rows, file_path):
+        count = 1
+        with open(file_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(CSV_HEADERS[:len(first)])
+            writer.writerow(first)
+            for count, row in enumerate(rows, start=2):
+                writer.writerow(row)
+        return count
+
+    def write_json(self, df, file_path):
+        """Write DataFrame records to ``file_path`` as indented JSON."""
+        df.to_json(file_path, orient='records', indent=4)
+
+    def write_xml(self, df, file_path):
+        """Write DataFrame records to ``file_path`` as ``<record>`` elements."""
+        root = ET.Element("metadata_records")
+
+        for index, row in df.iterrows():
+            record = ET.SubElement(root, "record")
+            for col in df.columns:
+                element = ET.SubElement(record, col.lower().replace(' ', '_'))
+                element.text = str(row[col]) if pd.notna(row[col]) else ""
+
+        tree = ET.ElementTree(root)
+        tree.write(file_path, encoding='utf-8', xml_declaration=True)
+
+    def write_excel(self, df, file_path):
+        """Write DataFrame to ``file_path`` as an Excel sheet named 'Metadata'."""
+        with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
+            df.to_excel(writer, sheet_name='Metadata', index=False)
+
 
 _reporter = MetadataReporter()
 
@@ -557,5 +629,30 @@ def export_to_excel(df):
 
 
 def export_to_csv(data):
-    """Wrapper: Convert tuple data to DataFrame and save as CSV."""
+    """Wrapper: Write tuple data to CSV row by row."""
     return _reporter.export_to_csv(data)
+
+
+def ask_export_path(format_type):
+    """Wrapper: Ask where to save an export of the given format."""
+    return _reporter.ask_export_path(format_type)
+
+
+def write_csv(data, file_path):
+    """Wrapper: Write record tuples to a CSV file without dialogs."""
+    return _reporter.write_csv(data, file_path)
+
+
+def write_json(df, file_path):
+    """Wrapper: Write DataFrame to a JSON file without dialogs."""
+    return _reporter.write_json(df, file_path)
+
+
+def write_xml(df, file_path):
+    """Wrapper: Write DataFrame to an XML file without dialogs."""
+    return _reporter.write_xml(df, file_path)
+
+
+def write_excel(df, file_path):
+    """Wrapper: Write DataFrame to an Excel file without dialogs."""
+    return _reporter.write_excel(df, file_path)
@@ -3,6 +3,7 @@ from pathlib import Path
 import tempfile
 import os
 import json
+import unittest.mock as mock
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 SRC_PATH = PROJECT_ROOT / 'src'
@@ -13,8 +14,9 @@ import pytest
 from db import (
     MetadataDatabase, format_file_size, insert_metadata, fetch_metadata_by_id,
     fetch_all_metadata, fetch_latest_by_path, get_database_stats, clear_metadata,
-    delete_record, filter_and_search_data, export_data, optimize_database
+    delete_record, filter_and_search_data, export_data, optimize_database, _iso
 )
+from datetime import datetime, timedelta
 
 
 @pytest.fixture
@@ -24,6 +26,7 @@ def temp_db():
         db_path = os.path.join(tmp_dir, "test_metadata.db")
         db = MetadataDatabase(db_path=db_path)
         yield db
+        db.close()
 
 
 @pytest.fixture
@@ -209,3 +212,605 @@ def test_wrapper_functions(sample_file, sample_metadata):
     # Test get_database_stats wrapper
     stats = get_database_stats()
     assert isinstance(stats, dict)
+
+
+def test_database_uses_wal_journal(temp_db):
+    """Test that the database is switched to WAL journal mode."""
+    with temp_db._read_conn() as conn:
+        mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+    assert mode.lower() == "wal"
+
+
+def test_connection_is_reused(temp_db, sample_file, sample_metadata):
+    """Test that writes share one long-lived connection."""
+    temp_db.insert_metadata(sample_file, sample_metadata)
+    writer = temp_db._writer
+    assert writer is not None
+    temp_db.delete_record(9999)
+    assert temp_db._writer is writer
+
+    temp_db.close()
+    assert temp_db._writer is None
+    assert len(temp_db.fetch_all_metadata()) == 1
+
+
+def test_read_pool_connections_are_read_only(temp_db, sample_file, sample_metadata):
+    """Test that pooled readers see committed writes but cannot modify data."""
+    temp_db.insert_metadata(sample_file, sample_metadata)
+    with temp_db._read_conn() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM metadata").fetchone()[0] == 1
+        with pytest.raises(Exception):
+            conn.execute("DELETE FROM metadata")
+
+
+def test_read_pool_is_bounded(tmp_path):
+    """Test that the reader pool never opens more than read_pool_size connections."""
+    db = MetadataDatabase(db_path=str(tmp_path / "pool.db"), read_pool_size=1)
+    try:
+        with db._read_conn() as first:
+            pass
+        with db._read_conn() as second:
+            assert second is first
+        assert db._reader_count == 1
+    finally:
+        db.close()
+
+
+def test_in_memory_database_reads_use_writer():
+    """Test that :memory: databases route reads through the writer connection."""
+    db = MetadataDatabase(db_path=":memory:")
+    try:
+        with db._read_conn() as conn:
+            assert conn is db._writer
+        assert db.get_database_stats()["total_records"] == 0
+    finally:
+        db.close()
+
+
+def test_insert_metadata_many(temp_db, tmp_path, sample_metadata):
+    """Test inserting several records in one batch."""
+    paths = []
+    for idx in range(3):
+        path = tmp_path / f"batch_{idx}.txt"
+        path.write_text("x" * (idx + 1))
+        paths.append(str(path))
+
+    rows = temp_db.insert_metadata_many([(path, sample_metadata) for path in paths])
+
+    assert [row[1] for row in rows] == paths
+    assert len({row[0] for row in rows}) == 3
+    assert json.loads(rows[0][7]) == sample_metadata
+    assert len(temp_db.fetch_all_metadata()) == 3
+
+
+def test_insert_metadata_many_empty(temp_db):
+    """Test that an empty batch inserts nothing."""
+    assert temp_db.insert_metadata_many([]) == []
+    assert temp_db.fetch_all_metadata() == []
+
+
+def test_insert_metadata_returns_stored_row(temp_db, sample_file, sample_metadata):
+    """Test that the returned row matches what is persisted."""
+    inserted = temp_db.insert_metadata(sample_file, sample_metadata)
+    assert inserted == temp_db.fetch_metadata_by_id(inserted[0])
+
+
+def test_lookup_indexes_exist(temp_db):
+    """Test that indexes for the hot lookup paths are created."""
+    with temp_db._read_conn() as conn:
+        names = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")}
+    plan = temp_db.explain_query_plan(
+        f"SELECT {MetadataDatabase.ROW_COLUMNS} FROM metadata WHERE file_path = ? ORDER BY id DESC LIMIT 1",
+        ("x",),
+    )
+    assert {"idx_meta_path_cover", "idx_meta_type_date", "idx_meta_extracted", "idx_meta_name"} <= names
+    assert "idx_meta_path" not in names
+    assert any("idx_meta_path_cover" in step for step in plan)
+
+
+def test_fetch_latest_summary_by_path_uses_covering_index(temp_db, sample_file, sample_metadata):
+    """Test the summary lookup returns display fields straight from the index."""
+    temp_db.insert_metadata(sample_file, sample_metadata)
+    latest = temp_db.insert_metadata(sample_file, sample_metadata)
+
+    summary = temp_db.fetch_latest_summary_by_path(sample_file)
+    plan = temp_db.explain_query_plan(
+        "SELECT id, file_size_formatted, file_type, extracted_at, modified_on FROM metadata "
+        "WHERE file_path = ? ORDER BY id DESC LIMIT 1",
+        (sample_file,),
+    )
+
+    assert summary == (latest[0], latest[3], latest[4], latest[5], latest[6])
+    assert temp_db.fetch_latest_summary_by_path("/missing") is None
+    assert any("COVERING INDEX idx_meta_path_cover" in step for step in plan)
+
+
+def test_filter_sorts_by_size_numerically(temp_db, tmp_path, sample_metadata):
+    """Test that size sorting uses the byte count rather than the formatted string."""
+    small = tmp_path / "small.txt"
+    small.write_bytes(b"x" * 950)
+    large = tmp_path / "large.txt"
+    large.write_bytes(b"x" * 2048)
+    temp_db.insert_metadata_many([(str(small), sample_metadata), (str(large), sample_metadata)])
+
+    largest = temp_db.filter_and_search_data("", "All", "All Time", "Size (Largest)")
+    smallest = temp_db.filter_and_search_data("", "All", "All Time", "Size (Smallest)")
+
+    assert [row[2] for row in largest] == ["large.txt", "small.txt"]
+    assert [row[2] for row in smallest] == ["small.txt", "large.txt"]
+    assert len(largest[0]) == 8
+
+
+def test_legacy_table_is_migrated(tmp_path):
+    """Test that a table without file_size_bytes gains the column on open."""
+    import sqlite3
+
+    db_path = str(tmp_path / "legacy.db")
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            """
+            CREATE TABLE metadata (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                file_path TEXT NOT NULL,
+                file_name TEXT NOT NULL,
+                file_size_formatted TEXT,
+                file_type TEXT,
+                extracted_at TEXT NOT NULL,
+                modified_on TEXT,
+                full_metadata TEXT NOT NULL
+            )
+            """
+        )
+        conn.executemany(
+            "INSERT INTO metadata (file_path, file_name, file_size_formatted, file_type, extracted_at, full_metadata)"
+            " VALUES (?, ?, ?, 'txt', '2024-01-01T00:00:00', '{}')",
+            [("/a", "a", "2.00 KB"), ("/b", "b", "1.50 MB"), ("/c", "c", "512.00 B"), ("/d", "d", None)],
+        )
+    conn.close()
+
+    db = MetadataDatabase(db_path=db_path)
+    try:
+        with db._read_conn() as conn:
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(metadata)")}
+            sizes = dict(conn.execute("SELECT file_name, file_size_bytes FROM metadata"))
+        assert "file_size_bytes" in columns
+        assert sizes == {"a": 2048, "b": 1572864, "c": 512, "d": None}
+    finally:
+        db.close()
+
+
+def test_format_file_size_unit_boundaries():
+    """Test unit selection just below and above each power-of-1024 boundary."""
+    assert format_file_size(1023) == "1023.00 B"
+    assert format_file_size(1536) == "1.50 KB"
+    assert format_file_size(1024 * 1024 - 1) == "1024.00 KB"
+    assert format_file_size(5 * 1024 ** 4) == "5120.00 GB"
+
+
+def test_export_data_passes_rows_to_reporter(tmp_path, sample_file, sample_metadata):
+    """Test that CSV gets raw rows and other formats get a DataFrame."""
+    calls = {}
+
+    class RecordingReporter:
+        def export_to_csv(self, data):
+            calls["csv"] = data
+
+        def export_to_json(self, df):
+            calls["json"] = df
+
+    db = MetadataDatabase(db_path=str(tmp_path / "export.db"), reporter=RecordingReporter())
+    try:
+        rows = [db.insert_metadata(sample_file, sample_metadata)]
+        assert db.export_data("csv", rows) is True
+        assert db.export_data("json", rows) is True
+        assert db.export_data("json", []) is False
+    finally:
+        db.close()
+
+    assert calls["csv"] is rows
+    assert list(calls["json"].columns)[0] == "ID"
+    assert calls["json"].iloc[0]["File Path"] == sample_file
+
+
+def test_iter_all_metadata_streams_in_chunks(temp_db, sample_file, sample_metadata):
+    """Test that iter_all_metadata yields every row across several chunks."""
+    temp_db.insert_metadata_many([(sample_file, sample_metadata)] * 5)
+
+    rows = temp_db.iter_all_metadata(chunk=2)
+    assert not isinstance(rows, list)
+    rows = list(rows)
+    assert len(rows) == 5
+    assert rows == temp_db.fetch_all_metadata()
+
+
+def test_full_metadata_is_stored_compactly(temp_db, sample_file):
+    """Test that full_metadata JSON is written without separator padding."""
+    metadata = {"Title": "Café", "Pages": 2}
+    row = temp_db.insert_metadata(sample_file, metadata)
+    stored = temp_db.fetch_metadata_by_id(row[0])[7]
+
+    assert stored == '{"Title":"Café","Pages":2}'
+    assert json.loads(stored) == metadata
+
+
+def test_insert_metadata_for_missing_file(temp_db, tmp_path, sample_metadata):
+    """Test that size and modification time fall back when the file is gone."""
+    missing = str(tmp_path / "gone.pdf")
+    row = temp_db.insert_metadata(missing, sample_metadata)
+
+    assert row[3] == "Unknown"
+    assert row[4] == "pdf"
+    assert row[6] is None
+
+
+def test_save_edited_metadata_records_file_stats(temp_db, sample_file):
+    """Test that saved edits capture size and modification time from one stat."""
+    success, _ = temp_db.save_edited_metadata(sample_file, {"metadata": {"Title": "Edited"}})
+    latest = temp_db.fetch_latest_by_path(sample_file)
+
+    assert success is True
+    assert latest[3] == format_file_size(os.path.getsize(sample_file))
+    assert latest[6] is not None
+
+
+def test_iso_matches_datetime_isoformat():
+    """Test that _iso produces the same string as datetime.isoformat."""
+    for ts in (0.0, 1700000000.0, 1700000000.999999, 1712345678.5000005):
+        assert _iso(ts) == datetime.fromtimestamp(ts).isoformat(timespec="microseconds")
+    assert datetime.fromisoformat(_iso(1700000000.25)).microsecond == 250000
+
+
+def test_filter_query_template_is_cached():
+    """Test that filter queries with the same shape reuse one SQL string."""
+    first = MetadataDatabase._build_filter_query(True, False, True, "Name (A-Z)")
+    second = MetadataDatabase._build_filter_query(True, False, True, "Name (A-Z)")
+
+    assert first is second
+    assert first.count("?") == 3
+    assert first.endswith("ORDER BY file_name ASC, id ASC")
+    assert MetadataDatabase._build_filter_query(False, False, False, "Unknown").endswith("ORDER BY id DESC")
+
+
+def test_paged_filter_windows_are_stable_for_tied_sort_keys(temp_db, tmp_path, sample_metadata):
+    """Test that paging through rows with equal sort keys never repeats or skips one."""
+    path = tmp_path / "same.txt"
+    path.write_text("x")
+    ids = {temp_db.insert_metadata(str(path), sample_metadata)[0] for _ in range(7)}
+
+    seen = []
+    for offset in range(0, 7, 3):
+        rows = temp_db.filter_and_search_data("", "All", "All Time", "Name (A-Z)", limit=3, offset=offset)
+        seen += [row[0] for row in rows]
+    assert seen == sorted(ids)
+
+
+def test_filter_combines_term_type_and_date(temp_db, tmp_path, sample_metadata):
+    """Test that all filter parameters line up with the cached template."""
+    txt = tmp_path / "notes.txt"
+    txt.write_text("a")
+    pdf = tmp_path / "notes.pdf"
+    pdf.write_text("b")
+    temp_db.insert_metadata_many([(str(txt), sample_metadata), (str(pdf), sample_metadata)])
+
+    results = temp_db.filter_and_search_data("notes", "pdf", "Today", "Name (A-Z)")
+    assert [row[2] for row in results] == ["notes.pdf"]
+
+
+def test_database_stats_track_inserts_and_deletes(temp_db, tmp_path, sample_metadata):
+    """Test that per-type counts follow inserts, deletes and clears."""
+    txt = tmp_path / "a.txt"
+    txt.write_text("a")
+    pdf = tmp_path / "b.pdf"
+    pdf.write_text("b")
+    rows = temp_db.insert_metadata_many([(str(txt), sample_metadata), (str(txt), sample_metadata), (str(pdf), sample_metadata)])
+
+    assert temp_db.get_database_stats() == {"total_records": 3, "file_types": {"txt": 2, "pdf": 1}}
+
+    temp_db.delete_record(rows[2][0])
+    assert temp_db.get_database_stats() == {"total_records": 2, "file_types": {"txt": 2}}
+
+    temp_db.clear_metadata()
+    assert temp_db.get_database_stats() == {"total_records": 0, "file_types": {}}
+
+
+def test_type_counts_backfilled_for_existing_rows(tmp_path, sample_file, sample_metadata):
+    """Test that the counter table is rebuilt from rows written before it existed."""
+    db_path = str(tmp_path / "backfill.db")
+    db = MetadataDatabase(db_path=db_path)
+    db.insert_metadata(sample_file, sample_metadata)
+    with db._lock, db._get_writer() as conn:
+        conn.execute("DROP TABLE metadata_type_counts")
+    db.close()
+
+    reopened = MetadataDatabase(db_path=db_path)
+    try:
+        assert reopened.get_database_stats() == {"total_records": 1, "file_types": {"txt": 1}}
+    finally:
+        reopened.close()
+
+
+def test_clear_metadata_resets_schema_and_ids(temp_db, sample_file, sample_metadata):
+    """Test that clearing keeps indexes/triggers and restarts ids."""
+    temp_db.insert_metadata_many([(sample_file, sample_metadata)] * 3)
+    assert temp_db.clear_metadata() is True
+
+    with temp_db._read_conn() as conn:
+        names = {row[0] for row in conn.execute("SELECT name FROM sqlite_master")}
+    assert {"idx_meta_path_cover", "trg_meta_count_insert", "trg_meta_count_delete"} <= names
+
+    row = temp_db.insert_metadata(sample_file, sample_metadata)
+    assert row[0] == 1
+    assert temp_db.get_database_stats() == {"total_records": 1, "file_types": {"txt": 1}}
+
+
+def test_transaction_groups_writes(temp_db, sample_file, sample_metadata):
+    """Test that writes joined to a transaction commit together."""
+    with temp_db.transaction() as conn:
+        first = temp_db.insert_metadata(sample_file, sample_metadata, conn=conn)
+        success, _ = temp_db.save_edited_metadata(sample_file, {"metadata": {"Title": "Edited"}}, conn=conn)
+        assert success is True
+        assert temp_db.delete_record(first[0], conn=conn) is True
+        assert conn.in_transaction
+
+    records = temp_db.fetch_all_metadata()
+    assert len(records) == 1
+    assert json.loads(records[0][7]) == {"Title": "Edited"}
+
+
+def test_transaction_rolls_back_on_error(temp_db, sample_file, sample_metadata):
+    """Test that a failing transaction block discards its writes."""
+    with pytest.raises(RuntimeError):
+        with temp_db.transaction() as conn:
+            temp_db.insert_metadata(sample_file, sample_metadata, conn=conn)
+            raise RuntimeError("boom")
+
+    assert temp_db.fetch_all_metadata() == []
+    assert temp_db.get_database_stats()["total_records"] == 0
+
+
+def test_transaction_writes_without_conn_join_open_transaction(temp_db, sample_file, sample_metadata):
+    """Test that writes and nested blocks inside transaction() do not commit it early."""
+    with pytest.raises(RuntimeError):
+        with temp_db.transaction() as conn:
+            temp_db.insert_metadata(sample_file, sample_metadata, conn=conn)
+            temp_db.insert_metadata(sample_file, sample_metadata)
+            with temp_db.transaction():
+                temp_db.insert_metadata(sample_file, sample_metadata)
+            assert conn.in_transaction
+            assert temp_db.clear_metadata() is False
+            raise RuntimeError("boom")
+
+    assert temp_db.fetch_all_metadata() == []
+    assert temp_db.insert_metadata(sample_file, sample_metadata) is not None
+    assert len(temp_db.fetch_all_metadata()) == 1
+
+
+def test_fetch_all_metadata_lite_skips_json(temp_db, sample_file, sample_metadata):
+    """Test that the lite fetch omits full_metadata unless asked for it."""
+    full = temp_db.insert_metadata(sample_file, sample_metadata)
+
+    lite = temp_db.fetch_all_metadata_lite()
+    assert lite == [full[:7]]
+    assert temp_db.fetch_all_metadata_lite(include_json=True) == [full]
+    assert list(temp_db.iter_all_metadata(include_json=False)) == [full[:7]]
+
+
+def test_iter_all_metadata_wrapper_passes_include_json(temp_db, sample_file, sample_metadata, monkeypatch):
+    """Test that the module-level wrapper offers the lite streaming path."""
+    import db as db_module
+
+    full = temp_db.insert_metadata(sample_file, sample_metadata)
+    monkeypatch.setattr(db_module, "_db_manager", temp_db)
+    assert list(db_module.iter_all_metadata(include_json=False)) == [full[:7]]
+    assert list(db_module.iter_all_metadata()) == [full]
+
+
+def test_export_data_without_rows_uses_lite_columns(tmp_path, sample_file, sample_metadata):
+    """Test that whole-database CSV/Excel exports leave out the JSON column."""
+    calls = {}
+
+    class RecordingReporter:
+        def export_to_csv(self, data):
+            calls["csv"] = list(data)
+
+        def export_to_excel(self, df):
+            calls["excel"] = df
+
+        def export_to_json(self, df):
+            calls["json"] = df
+
+    db = MetadataDatabase(db_path=str(tmp_path / "lite.db"), reporter=RecordingReporter())
+    try:
+        db.insert_metadata(sample_file, sample_metadata)
+        assert db.export_data("csv") is True
+        assert db.export_data("excel") is True
+        assert db.export_data("json") is True
+    finally:
+        db.close()
+
+    assert len(calls["csv"][0]) == 7
+    assert "Full Metadata" not in calls["excel"].columns
+    assert "Full Metadata" in calls["json"].columns
+
+
+def test_export_data_csv_on_empty_database_returns_false(tmp_path, sample_file, sample_metadata):
+    """Test that a whole-database CSV export of no rows reports False like other formats."""
+    reporter = mock.Mock()
+    db = MetadataDatabase(db_path=str(tmp_path / "empty.db"), reporter=reporter)
+    try:
+        assert db.export_data("csv") is False
+        assert db.export_data("csv", iter(())) is False
+        reporter.export_to_csv.assert_not_called()
+
+        row = db.insert_metadata(sample_file, sample_metadata)
+        assert db.export_data("csv") is True
+        assert list(reporter.export_to_csv.call_args[0][0]) == [row[:7]]
+    finally:
+        db.close()
+
+
+def test_date_filter_buckets(temp_db, sample_file, sample_metadata):
+    """Test each date bucket against a record extracted now and one from last year."""
+    temp_db.insert_metadata(sample_file, sample_metadata)
+    old = temp_db.insert_metadata(sample_file, sample_metadata)
+    with temp_db.transaction() as conn:
+        conn.execute("UPDATE metadata SET extracted_at = ? WHERE id = ?", ("2000-01-01T00:00:00", old[0]))
+
+    for bucket in ("Today", "This Week", "This Month", "Last 30 Days"):
+        assert len(temp_db.filter_and_search_data("", "All", bucket, "Date (Newest)")) == 1
+    for bucket in ("All Time", "Unknown", None):
+        assert len(temp_db.filter_and_search_data("", "All", bucket, "Date (Newest)")) == 2
+
+
+def test_db_manager_is_created_lazily(monkeypatch):
+    """Test that the shared instance is only built on first access."""
+    import db as db_module
+
+    monkeypatch.setattr(db_module, "_db_manager", None)
+    assert format_file_size(2048) == "2.00 KB"
+    assert db_module._db_manager is None
+
+    manager = db_module.db_manager
+    assert isinstance(manager, MetadataDatabase)
+    assert db_module._get_manager() is manager
+
+
+def test_update_full_metadata(temp_db, sample_file, sample_metadata):
+    """Test replacing the JSON payload of single and multiple records."""
+    first = temp_db.insert_metadata(sample_file, sample_metadata)
+    second = temp_db.insert_metadata(sample_file, sample_metadata)
+
+    assert temp_db.update_full_metadata(first[0], {"Title": "One"}) is True
+    assert temp_db.update_full_metadata(9999, {"Title": "None"}) is False
+    assert temp_db.update_full_metadata_many([(second[0], {"Title": "Two"})]) == 1
+    assert temp_db.fetch_latest_ids_by_paths([sample_file, "/missing"]) == {sample_file: second[0]}
+    assert json.loads(temp_db.fetch_metadata_by_id(first[0])[7]) == {"Title": "One"}
+    assert json.loads(temp_db.fetch_metadata_by_id(second[0])[7]) == {"Title": "Two"}
+
+
+def test_write_version_tracks_changes(tmp_path):
+    """Test that write_version moves on every write, including across close()."""
+    db = MetadataDatabase(db_path=str(tmp_path / "version.db"))
+    try:
+        start = db.write_version
+        row = db.insert_metadata("/tmp/a.txt", {"Title": "A"})
+        after_insert = db.write_version
+        assert after_insert > start
+
+        db.close()
+        assert db.write_version == after_insert
+
+        db.delete_record(row[0])
+        assert db.write_version > after_insert
+    finally:
+        db.close()
+
+
+def test_write_version_moves_again_on_commit(temp_db, sample_file, sample_metadata):
+    """Test that a result read before a write commits cannot carry the final version."""
+    with temp_db.transaction() as conn:
+        temp_db.insert_metadata(sample_file, sample_metadata, conn=conn)
+        during = temp_db.write_version
+    assert temp_db.write_version > during
+
+
+def test_filter_and_search_data_windows_and_counts(temp_db, tmp_path, sample_metadata):
+    """Test LIMIT/OFFSET windows over filtered results and the matching count."""
+    items = []
+    for name in ("c.txt", "a.txt", "e.txt", "b.txt", "d.txt", "skip.pdf"):
+        path = tmp_path / name
+        path.write_text("x")
+        items.append((str(path), sample_metadata))
+    temp_db.insert_metadata_many(items)
+
+    full = temp_db.filter_and_search_data("", "txt", "All Time", "Name (A-Z)")
+    window = temp_db.filter_and_search_data("", "txt", "All Time", "Name (A-Z)", limit=2, offset=1, include_json=False)
+
+    assert [row[2] for row in window] == ["b.txt", "c.txt"]
+    assert [row[:7] for row in full[1:3]] == window
+    assert len(window[0]) == 7
+    assert temp_db.count_filtered_data("", "txt", "All Time") == 5
+    assert temp_db.count_filtered_data("skip", "All", "Today") == 1
+
+
+def test_export_stream_writes_filtered_rows(temp_db, tmp_path, sample_metadata):
+    """Test dialog-free exports of the filtered, sorted History rows."""
+    items = []
+    for name in ("b.txt", "a.txt", "skip.pdf"):
+        path = tmp_path / name
+        path.write_text("x")
+        items.append((str(path), sample_metadata))
+    temp_db.insert_metadata_many(items)
+
+    streamed = list(temp_db.iter_filtered_data("", "txt", "All Time", "Name (A-Z)", chunk=1))
+    assert streamed == temp_db.filter_and_search_data("", "txt", "All Time", "Name (A-Z)")
+
+    csv_path = tmp_path / "out.csv"
+    assert temp_db.export_stream("csv", str(csv_path), "", "txt", "All Time", "Name (A-Z)") == 2
+    lines = csv_path.read_text(encoding="utf-8").splitlines()
+    assert lines[0].startswith("ID,File Path,File Name")
+    assert "a.txt" in lines[1] and "b.txt" in lines[2]
+
+    json_path = tmp_path / "out.json"
+    assert temp_db.export_stream("json", str(json_path), "skip") == 1
+    assert [r["File Name"] for r in json.loads(json_path.read_text())] == ["skip.pdf"]
+
+    empty_path = tmp_path / "empty.csv"
+    assert temp_db.export_stream("csv", str(empty_path), "nothing-matches") == 0
+    assert not empty_path.exists()
+    with pytest.raises(ValueError):
+        temp_db.export_stream("docx", str(tmp_path / "out.docx"))
+
+
+def test_display_timestamps_stored_and_backfilled(tmp_path, sample_file, sample_metadata):
+    """Test that History display strings are written on insert and backfilled on migration."""
+    import sqlite3
+
+    db_path = str(tmp_path / "display.db")
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            """
+            CREATE TABLE metadata (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                file_path TEXT NOT NULL,
+                file_name TEXT NOT NULL,
+                file_size_formatted TEXT,
+                file_type TEXT,
+                extracted_at TEXT NOT NULL,
+                modified_on TEXT,
+                full_metadata TEXT NOT NULL,
+                file_size_bytes INTEGER
+            )
+            """
+        )
+        conn.execute(
+            "INSERT INTO metadata (file_path, file_name, file_type, extracted_at, modified_on, full_metadata) "
+            "VALUES ('/old.txt', 'old.txt', 'txt', '2024-01-05T15:07:00', NULL, '{}')"
+        )
+    conn.close()
+
+    db = MetadataDatabase(db_path=db_path)
+    try:
+        row = db.insert_metadata(sample_file, sample_metadata)
+        assert len(row) == 8
+
+        rows = db.filter_and_search_data("", "All", "All Time", "Date (Oldest)", display_times=True)
+        assert rows[0][5:] == ("Jan 05, 2024 03:07 PM", "")
+        assert rows[1][5] == MetadataDatabase.format_timestamp(row[5])
+        assert rows[1][6] == MetadataDatabase.format_timestamp(row[6])
+        assert len(rows[1]) == 7
+    finally:
+        db.close()
+
+
+def test_format_timestamp_fast_path_matches_strftime():
+    """Test that the sliced formatter agrees with datetime parsing."""
+    start = datetime(2023, 12, 25, 0, 0, 0)
+    for hours in range(0, 24 * 40, 7):
+        stamp = start + timedelta(hours=hours, minutes=hours % 60)
+        for text in (stamp.isoformat(), stamp.isoformat(sep=" ", timespec="seconds"), stamp.isoformat(timespec="microseconds")):
+            assert MetadataDatabase.format_timestamp(text) == stamp.strftime("%b %d, %Y %I:%M %p")
+
+    assert MetadataDatabase.format_timestamp("2024-02-30T10:00:00") == "2024-02-30T10:00:00"
+    assert MetadataDatabase.format_timestamp("not a date at all") == "not a date at all"
+    assert MetadataDatabase.format_timestamp(None) == ""
@@ -161,6 +161,20 @@ def test_get_editable_text_with_nonexistent_file():
     assert "File Name" in text
 
 
+def test_get_editable_text_layout_round_trips(sample_metadata):
+    """Test the header/blank line/fields layout and that it parses back."""
+    text = MetadataEditor().get_editable_text("/nonexistent/report.pdf", sample_metadata)
+    lines = text.split("\n")
+
+    assert [line.split(":", 1)[0] for line in lines[:5]] == [
+        "File Name", "File Size", "File Type", "Extracted At", "Modified On"
+    ]
+    assert lines[5] == ""
+    assert lines[6:] == [f"{k}: {v}" for k, v in sample_metadata.items()]
+    assert parse_editor_text(text)["metadata"] == sample_metadata
+    assert MetadataEditor().get_editable_text("/nonexistent/report.pdf", {}).endswith("Modified On: \n")
+
+
 def test_clear_editor():
     """Test clear_editor function."""
     text = clear_editor()
@@ -216,6 +230,41 @@ def test_write_text_metadata(temp_dir, sample_metadata):
     assert not os.path.exists(test_file + ".backup")
 
 
+def test_write_text_metadata_leaves_only_target(temp_dir, sample_metadata):
+    """Test that the temp file is renamed into place and nothing else is left behind."""
+    test_file = os.path.join(temp_dir, "notes.md")
+    with open(test_file, "w") as f:
+        f.write("Body")
+
+    success, _ = MetadataEditor().write_text_metadata(test_file, sample_metadata)
+
+    assert success is True
+    assert os.listdir(temp_dir) == ["notes.md"]
+    with open(test_file, encoding="utf-8") as f:
+        content = f.read()
+    assert content.startswith("# === Metadata ===")
+    assert content.endswith("Body")
+
+
+def test_atomic_write_failure_keeps_original(temp_dir):
+    """Test that a failing writer leaves the original file and no temp file."""
+    test_file = os.path.join(temp_dir, "keep.txt")
+    with open(test_file, "w") as f:
+        f.write("Original")
+
+    def _fail(tmp_path):
+        with open(tmp_path, "w") as f:
+            f.write("partial")
+        raise OSError("disk full")
+
+    with pytest.raises(OSError):
+        MetadataEditor._atomic_write(test_file, _fail)
+
+    assert os.listdir(temp_dir) == ["keep.txt"]
+    with open(test_file) as f:
+        assert f.read() == "Original"
+
+
 def test_write_generic_metadata(temp_dir, sample_metadata):
     """Test writing generic metadata (companion file)."""
     test_file = os.path.join(temp_dir, "test.unknown")
@@ -288,3 +337,378 @@ def test_write_metadata_to_file():
         editor = MetadataEditor()
         success, msg = editor.write_metadata_to_file(test_file, {"Title": "Test"})
         assert isinstance(success, bool)
+
+
+def test_save_edited_metadata_updates_client_database(temp_dir):
+    """Test that saved edits are written through the editor's db client."""
+    import db
+
+    test_file = os.path.join(temp_dir, "doc.txt")
+    with open(test_file, "w") as f:
+        f.write("content")
+
+    client = db.MetadataDatabase(db_path=os.path.join(temp_dir, "editor.db"))
+    try:
+        row = client.insert_metadata(test_file, {"Title": "Old"})
+        editor = MetadataEditor(db_client=client)
+        parsed = {"headers": {"File Name": "doc.txt"}, "metadata": {"Title": "New"}}
+
+        success, msg = editor.save_edited_metadata(test_file, parsed)
+
+        assert success is True
+        assert json.loads(client.fetch_metadata_by_id(row[0])[7]) == {"Title": "New"}
+    finally:
+        client.close()
+
+
+def test_save_edited_metadata_without_record(temp_dir):
+    """Test saving edits for a file that has never been extracted."""
+    import db
+
+    client = db.MetadataDatabase(db_path=os.path.join(temp_dir, "editor.db"))
+    try:
+        editor = MetadataEditor(db_client=client)
+        parsed = {"headers": {"File Name": "x.txt"}, "metadata": {"Title": "New"}}
+        success, msg = editor.save_edited_metadata(os.path.join(temp_dir, "x.txt"), parsed)
+        assert success is False
+        assert "No existing record" in msg
+    finally:
+        client.close()
+
+
+def test_save_edited_metadata_many(temp_dir):
+    """Test saving edits for several files with mixed outcomes."""
+    import db
+
+    paths = []
+    for name in ("a.txt", "b.txt"):
+        path = os.path.join(temp_dir, name)
+        with open(path, "w") as f:
+            f.write(name)
+        paths.append(path)
+
+    client = db.MetadataDatabase(db_path=os.path.join(temp_dir, "editor.db"))
+    try:
+        client.insert_metadata(paths[0], {"Title": "A"})
+        stale = client.insert_metadata(paths[1], {"Title": "B"})
+        latest = client.insert_metadata(paths[1], {"Title": "B2"})
+        editor = MetadataEditor(db_client=client)
+
+        results = editor.save_edited_metadata_many([
+            (paths[0], {"headers": {"File Name": "a.txt"}, "metadata": {"Title": "A-new"}}),
+            (paths[1], {"headers": {"File Name": "b.txt"}, "metadata": {"Title": "B-new"}}),
+            (paths[1], {"headers": {}, "metadata": {"Title": "invalid"}}),
+            (os.path.join(temp_dir, "missing.txt"), {"headers": {"File Name": "missing.txt"}, "metadata": {"Title": "X"}}),
+        ])
+
+        assert [ok for ok, _ in results] == [True, True, False, False]
+        assert "File Name" in results[2][1]
+        assert "No existing record" in results[3][1]
+        assert json.loads(client.fetch_metadata_by_id(latest[0])[7]) == {"Title": "B-new"}
+        assert json.loads(client.fetch_metadata_by_id(stale[0])[7]) == {"Title": "B"}
+        assert json.loads(client.fetch_latest_by_path(paths[0])[7]) == {"Title": "A-new"}
+    finally:
+        client.close()
+
+
+def test_editor_reuses_latest_record_until_database_changes(temp_dir):
+    """Test that open-then-save resolves the record once and re-extraction is seen."""
+    import db
+
+    test_file = os.path.join(temp_dir, "doc.txt")
+    with open(test_file, "w") as f:
+        f.write("content")
+
+    client = db.MetadataDatabase(db_path=os.path.join(temp_dir, "editor.db"))
+    try:
+        client.insert_metadata(test_file, {"Title": "Old"})
+        editor = MetadataEditor(db_client=client)
+        calls = []
+        fetch_summary = client.fetch_latest_summary_by_path
+        client.fetch_latest_summary_by_path = lambda path: calls.append(path) or fetch_summary(path)
+        client.fetch_latest_ids_by_paths = lambda paths: pytest.fail("record id should come from the cache")
+
+        editor.get_editable_text(test_file, {})
+        editor.get_editable_text(test_file, {})
+        assert len(calls) == 1
+
+        newer = client.insert_metadata(test_file, {"Title": "Again"})
+        editor.get_editable_text(test_file, {})
+        assert len(calls) == 2
+
+        parsed = {"headers": {"File Name": "doc.txt"}, "metadata": {"Title": "New"}}
+        assert editor.save_edited_metadata(test_file, parsed)[0] is True
+        assert json.loads(client.fetch_metadata_by_id(newer[0])[7]) == {"Title": "New"}
+    finally:
+        client.close()
+
+
+def test_parse_editor_text_keeps_colons_in_values():
+    """Test that only the first colon separates key and value."""
+    result = parse_editor_text("  File Name : a.txt  \nURL: http://example.com:8080\n: empty key\n")
+
+    assert result["headers"] == {"File Name": "a.txt"}
+    assert result["metadata"] == {"URL": "http://example.com:8080", "": "empty key"}
+
+
+def test_write_pdf_metadata_keeps_pages(temp_dir):
+    """Test that rewriting PDF metadata preserves every page."""
+    from PyPDF2 import PdfReader, PdfWriter
+
+    test_file = os.path.join(temp_dir, "doc.pdf")
+    writer = PdfWriter()
+    for _ in range(3):
+        writer.add_blank_page(width=72, height=72)
+    with open(test_file, "wb") as f:
+        writer.write(f)
+
+    success, _ = MetadataEditor().write_pdf_metadata(test_file, {"Title": "Report"})
+
+    assert success is True
+    reader = PdfReader(test_file)
+    assert len(reader.pages) == 3
+    assert reader.metadata["/Title"] == "Report"
+    assert os.listdir(temp_dir) == ["doc.pdf"]
+
+
+def test_write_image_metadata_jpeg_keeps_scan_data(temp_dir, sample_metadata):
+    """Test that JPEG EXIF is inserted without re-encoding the image data."""
+    import piexif
+    from PIL import Image
+
+    test_file = os.path.join(temp_dir, "photo.jpg")
+    Image.new("RGB", (16, 16), (200, 10, 10)).save(test_file, quality=50)
+    with open(test_file, "rb") as f:
+        original = f.read()
+
+    success, msg = MetadataEditor().write_image_metadata(test_file, sample_metadata)
+
+    assert success is True
+    assert "EXIF" in msg
+    with open(test_file, "rb") as f:
+        updated = f.read()
+    # Everything after the JPEG header segments (the compressed scan) is untouched
+    assert updated.endswith(original[original.index(b"\xff\xda"):])
+    comment = piexif.load(test_file)["Exif"][piexif.ExifIFD.UserComment]
+    assert json.loads(comment) == sample_metadata
+
+
+def test_write_audio_metadata_mp3_tags(temp_dir):
+    """Test writing ID3 tags to an MP3 that has no tag block yet."""
+    from mutagen.id3 import ID3
+
+    test_file = os.path.join(temp_dir, "song.mp3")
+    with open(test_file, "wb") as f:
+        f.write(b"\xff\xfb\x90\x00" + b"\x00" * 1200)
+
+    success, _ = MetadataEditor().write_audio_metadata(test_file, {"Title": "Song", "Artist": "Band", "Mood": "calm"})
+
+    assert success is True
+    tags = ID3(test_file)
+    assert tags["TIT2"].text == ["Song"]
+    assert tags["TPE1"].text == ["Band"]
+    # Title/Artist already have frames, so only the remaining fields go into the comment
+    assert json.loads(tags.getall("COMM")[0].text[0]) == {"Mood": "calm"}
+
+
+def test_write_audio_metadata_mp3_rewrites_tag_in_place(temp_dir):
+    """Test that a second edit fits in the reserved padding and drops an empty comment."""
+    from mutagen.id3 import ID3
+
+    test_file = os.path.join(temp_dir, "song.mp3")
+    audio = b"\xff\xfb\x90\x00" + os.urandom(4000)
+    with open(test_file, "wb") as f:
+        f.write(audio)
+    editor = MetadataEditor()
+
+    editor.write_audio_metadata(test_file, {"Title": "One", "Mood": "calm"})
+    size_after_first = os.path.getsize(test_file)
+    editor.write_audio_metadata(test_file, {"Title": "Two"})
+
+    assert os.path.getsize(test_file) == size_after_first
+    with open(test_file, "rb") as f:
+        assert f.read().endswith(audio)
+    tags = ID3(test_file)
+    assert tags["TIT2"].text == ["Two"]
+    assert tags.getall("COMM") == []
+
+
+def test_write_text_metadata_preserves_original_bytes(temp_dir):
+    """Test that the header is prepended without altering the existing content."""
+    test_file = os.path.join(temp_dir, "data.csv")
+    body = b"a,b\r\n1,2\r\n" * 1000
+    with open(test_file, "wb") as f:
+        f.write(body)
+
+    success, _ = MetadataEditor().write_text_metadata(test_file, {"Owner": "ops"})
+
+    assert success is True
+    with open(test_file, "rb") as f:
+        content = f.read()
+    assert content == b"# === Metadata ===\n# Owner: ops\n# ==================\n\n" + body
+
+
+def test_write_text_metadata_json(temp_dir):
+    """Test that JSON files get a _metadata key instead of a comment header."""
+    test_file = os.path.join(temp_dir, "config.json")
+    with open(test_file, "w") as f:
+        json.dump({"debug": True}, f)
+
+    success, _ = MetadataEditor().write_text_metadata(test_file, {"Owner": "ops"})
+
+    assert success is True
+    with open(test_file) as f:
+        assert json.load(f) == {"debug": True, "_metadata": {"Owner": "ops"}}
+
+
+def test_fmt_matches_strftime():
+    """Test that the ISO fast path renders like strftime and invalid input is returned unchanged."""
+    from datetime import datetime
+    from editor import _fmt
+
+    for dt in (datetime(2024, 1, 5, 0, 7), datetime(2024, 6, 30, 12, 0, 59), datetime(1999, 12, 31, 23, 59, 1, 5)):
+        expected = dt.strftime("%b %d, %Y %I:%M %p")
+        assert _fmt(dt.isoformat()) == expected
+        assert _fmt(dt.isoformat(" ")) == expected
+
+    assert _fmt("") == ""
+    assert _fmt("2024-13-01T00:00:00") == "2024-13-01T00:00:00"
+    for invalid in ("2024-02-31T10:00:00", "2024-01-00T10:00:00", "2024-01-32T10:00:00",
+                    "2024-01-05T10:60:00", "2024-01-05T24:00:00"):
+        assert _fmt(invalid) == invalid
+    assert _fmt("2024-01-05") == "Jan 05, 2024 12:00 AM"
+
+
+def test_write_metadata_to_file_dispatches_by_extension(temp_dir, monkeypatch):
+    """Test that each extension reaches its writer, with the extension passed down."""
+    calls = []
+    for name in ("write_pdf_metadata", "write_image_metadata", "write_audio_metadata",
+                 "write_text_metadata", "write_office_metadata", "write_generic_metadata"):
+        monkeypatch.setattr(MetadataEditor, name, lambda self, path, meta, ext=None, name=name: calls.append((name, ext)) or (True, name))
+
+    editor = MetadataEditor()
+    for file_name in ("a.PDF", "b.jpeg", "c.flac", "d.yml", "e.docx", "f.bin"):
+        path = os.path.join(temp_dir, file_name)
+        with open(path, "w") as f:
+            f.write("x")
+        editor.write_metadata_to_file(path, {"Title": "T"})
+
+    assert calls == [("write_pdf_metadata", ".pdf"), ("write_image_metadata", ".jpeg"),
+                     ("write_audio_metadata", ".flac"), ("write_text_metadata", ".yml"),
+                     ("write_office_metadata", ".docx"), ("write_generic_metadata", ".bin")]
+
+
+def test_writer_libraries_loaded_once_and_missing_reported(temp_dir, monkeypatch):
+    """Test the lazy library cache and the install hint when a library is absent."""
+    import editor
+
+    first = editor._pypdf2()
+    assert editor._pypdf2() is first
+
+    monkeypatch.setattr(editor, "_libs", {})
+    monkeypatch.setitem(sys.modules, "PyPDF2", None)
+    test_file = os.path.join(temp_dir, "doc.pdf")
+    with open(test_file, "wb") as f:
+        f.write(b"%PDF-1.4")
+
+    success, msg = MetadataEditor().write_pdf_metadata(test_file, {"Title": "T"})
+
+    assert success is False
+    assert "PyPDF2 not installed" in msg
+    assert "pypdf2" not in editor._libs
+
+
+def test_embedded_metadata_json_is_compact(temp_dir):
+    """Test that metadata stored in EXIF is compact UTF-8 JSON."""
+    import piexif
+    from PIL import Image
+
+    test_file = os.path.join(temp_dir, "photo.jpg")
+    Image.new("RGB", (8, 8)).save(test_file)
+
+    MetadataEditor().write_image_metadata(test_file, {"Titre": "Été", "Tags": [1, 2]})
+
+    comment = piexif.load(test_file)["Exif"][piexif.ExifIFD.UserComment]
+    assert comment == '{"Titre":"Été","Tags":[1,2]}'.encode("utf-8")
+
+
+def test_write_text_metadata_yaml_header(temp_dir):
+    """Test the YAML comment header layout."""
+    test_file = os.path.join(temp_dir, "conf.yaml")
+    with open(test_file, "w") as f:
+        f.write("key: value\n")
+
+    MetadataEditor().write_text_metadata(test_file, {"Owner": "ops", "Env": "prod"})
+
+    with open(test_file) as f:
+        assert f.read() == "# Metadata:\n#   Owner: ops\n#   Env: prod\n\nkey: value\n"
+
+
+@pytest.mark.parametrize("kernel_copy", [True, False])
+def test_clone_file_copies_content_and_mode(temp_dir, monkeypatch, kernel_copy):
+    """Test _clone_file with and without os.copy_file_range available."""
+    import stat
+    from editor import _clone_file
+
+    if not kernel_copy:
+        monkeypatch.delattr(os, "copy_file_range", raising=False)
+    src = os.path.join(temp_dir, "src.bin")
+    dst = os.path.join(temp_dir, "dst.bin")
+    payload = os.urandom(300_000)
+    with open(src, "wb") as f:
+        f.write(payload)
+    os.chmod(src, 0o640)
+
+    _clone_file(src, dst)
+
+    with open(dst, "rb") as f:
+        assert f.read() == payload
+    assert stat.S_IMODE(os.stat(dst).st_mode) == 0o640
+
+
+@pytest.mark.parametrize("parsed", [
+    {"metadata": {"Title": "T"}},
+    {"headers": None, "metadata": {"Title": "T"}},
+    {"headers": {"File Name": ""}, "metadata": {"Title": "T"}},
+])
+def test_validate_metadata_missing_or_blank_filename(parsed):
+    """Test that absent, None and blank headers all report the missing File Name."""
+    assert validate_metadata(parsed) == (False, "Missing required field: File Name")
+
+
+def test_get_editable_text_unextracted_file_uses_one_stat(temp_dir, monkeypatch):
+    """Test that a file with no record gets size and mtime from a single os.stat."""
+    test_file = os.path.join(temp_dir, "fresh.txt")
+    with open(test_file, "w") as f:
+        f.write("x" * 2048)
+    editor = MetadataEditor()
+    monkeypatch.setattr(editor, "_latest_summary", lambda path: None)
+
+    real_stat = os.stat
+    stats = []
+    monkeypatch.setattr(os, "stat", lambda path, *a, **kw: stats.append(path) or real_stat(path, *a, **kw))
+
+    text = editor.get_editable_text(test_file, {})
+
+    assert stats == [test_file]
+    assert "File Size: 2.00 KB" in text
+    assert "File Type: txt" in text
+
+
+def test_default_editor_and_db_client_are_created_lazily(monkeypatch):
+    """Test that text-only helpers create neither the shared editor's DB client nor the DB."""
+    import db
+    import editor
+
+    monkeypatch.setattr(editor, "_default_editor", None)
+    monkeypatch.setattr(db, "_db_manager", None)
+
+    assert parse_editor_text("File Name: a.txt\nTitle: T")["metadata"] == {"Title": "T"}
+    assert clear_editor().startswith("No metadata loaded")
+    assert editor._default_editor is not None
+    assert db._db_manager is None
+
+    assert editor._editor is editor._get_editor()
+    sentinel = object()
+    monkeypatch.setattr(db, "_db_manager", sentinel)
+    assert editor._editor.db_client is sentinel
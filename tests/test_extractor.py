@@ -2,6 +2,7 @@ import sys
 from pathlib import Path
 import tempfile
 import os
+import functools
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 SRC_PATH = PROJECT_ROOT / 'src'
@@ -282,3 +283,521 @@ def test_wrapper_functions(temp_dir):
     # Test batch_extract wrapper
     batch_result = batch_extract([test_file])
     assert batch_result["total"] == 1
+
+
+def test_batch_extract_parallel_keeps_input_order(temp_dir):
+    """Test the process-pool path: results stay in input order and inserts happen here."""
+    db_client = DummyDB()
+    extractor_obj = MetadataExtractor(db_client=db_client)
+
+    paths = []
+    for i in range(MetadataExtractor.PARALLEL_MIN_FILES + 2):
+        path = os.path.join(temp_dir, f"file{i}.txt")
+        with open(path, "w") as f:
+            f.write("line\n" * (i + 1))
+        paths.append(path)
+    paths.insert(3, os.path.join(temp_dir, "missing.txt"))
+
+    result = extractor_obj.batch_extract(paths, max_workers=2)
+
+    assert result["total"] == len(paths)
+    assert result["successful"] == len(paths) - 1
+    assert result["failed"] == 1
+    assert [r["file_path"] for r in result["results"]] == paths
+    assert result["results"][3]["status"] == "failed"
+    assert sorted(entry["file_path"] for entry in db_client.saved) == sorted(p for p in paths if "missing" not in p)
+    assert db_client.saved and all(entry["metadata"]["Encoding"] == "utf-8" for entry in db_client.saved)
+
+
+def test_batch_extract_reads_ahead_in_process(temp_dir, monkeypatch):
+    """Test that the in-process path hints every file once, ahead of extraction."""
+    import extractor as extractor_module
+
+    hinted = []
+    monkeypatch.setattr(extractor_module, "_readahead", hinted.append)
+    monkeypatch.setattr(MetadataExtractor, "READAHEAD_FILES", 2)
+
+    paths = []
+    for i in range(5):
+        path = os.path.join(temp_dir, f"file{i}.txt")
+        with open(path, "w") as f:
+            f.write("x\n")
+        paths.append(path)
+
+    extractor_obj = MetadataExtractor(db_client=DummyDB())
+    extracted = []
+    original_extract = extractor_obj.extract
+    monkeypatch.setattr(extractor_obj, "extract", lambda p: extracted.append((p, list(hinted))) or original_extract(p))
+
+    result = extractor_obj.batch_extract(paths, max_workers=1)
+
+    assert result["successful"] == 5
+    assert hinted == paths
+    # Two files beyond the one being extracted are already queued
+    assert extracted[0][1] == paths[:3]
+
+
+def test_readahead_ignores_missing_files(temp_dir):
+    """Test that readahead hints never raise."""
+    from extractor import _readahead
+
+    _readahead(os.path.join(temp_dir, "missing.bin"))
+    _readahead("")
+
+
+@pytest.mark.parametrize("content", [
+    b"", b"one", b"one\n", b"a\nb\nc", b"a\r\nb\r\n", b"a\rb\rc", b"mixed\r\n\r\rend\n\n", b"\xff\xfe bad utf8\nline",
+])
+@pytest.mark.parametrize("chunk", [1, 2, 3, 1 << 20])
+def test_line_count_matches_readlines(temp_dir, monkeypatch, content, chunk):
+    """Test that chunked byte counting agrees with text-mode readlines at any chunk size."""
+    import extractor as extractor_module
+
+    monkeypatch.setattr(extractor_module, "_COUNT_CHUNK", chunk)
+    path = os.path.join(temp_dir, "sample.txt")
+    with open(path, "wb") as f:
+        f.write(content)
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        expected = len(f.readlines())
+
+    assert MetadataExtractor().extract_text_metadata(path)["Line Count"] == expected
+
+
+def test_extract_caches_until_file_changes(temp_dir, monkeypatch):
+    """Test that unchanged files are served from the cache and edits invalidate it."""
+    path = os.path.join(temp_dir, "notes.txt")
+    with open(path, "w") as f:
+        f.write("a\nb\n")
+
+    extractor_obj = MetadataExtractor(db_client=DummyDB())
+    calls = []
+    original = extractor_obj._extract_uncached
+    monkeypatch.setattr(extractor_obj, "_extract_uncached", lambda p, st: calls.append(p) or original(p, st))
+
+    first = extractor_obj.extract(path)
+    first["Line Count"] = -1  # callers get a copy, not the cached dict
+    second = extractor_obj.extract(path)
+    assert len(calls) == 1
+    assert second["Line Count"] == 2
+
+    with open(path, "a") as f:
+        f.write("c\n")
+    assert extractor_obj.extract(path)["Line Count"] == 3
+    assert len(calls) == 2
+
+    assert "Error" in extractor_obj.extract(os.path.join(temp_dir, "missing.txt"))
+    assert all("Error" not in value for value in extractor_obj._cache.values())
+
+
+def test_batch_extract_parallel_uses_parent_cache(temp_dir, monkeypatch):
+    """Test that a re-scan of unchanged files skips the process pool entirely."""
+    import extractor as extractor_module
+
+    paths = []
+    for i in range(MetadataExtractor.PARALLEL_MIN_FILES):
+        path = os.path.join(temp_dir, f"file{i}.txt")
+        with open(path, "w") as f:
+            f.write("x\n")
+        paths.append(path)
+
+    extractor_obj = MetadataExtractor(db_client=DummyDB())
+    assert extractor_obj.batch_extract(paths, max_workers=2)["successful"] == len(paths)
+
+    def _no_pool(*args, **kwargs):
+        raise AssertionError("pool should not be started for cached files")
+
+    monkeypatch.setattr(extractor_module, "ProcessPoolExecutor", _no_pool)
+    result = extractor_obj.batch_extract(paths, max_workers=2)
+    assert result["successful"] == len(paths)
+    assert [r["file_path"] for r in result["results"]] == paths
+
+
+def test_fast_pdf_info_matches_pdf_reader(temp_dir):
+    """Test that the trailer fast path agrees with PdfReader, including incremental updates."""
+    from extractor import _fast_pdf_info
+    from PyPDF2 import PdfReader
+
+    pdf_path = os.path.join(temp_dir, "pages.pdf")
+    writer = PdfWriter()
+    for _ in range(5):
+        writer.add_blank_page(width=72, height=72)
+    writer.add_metadata({"/Title": "Paren (x) \\ slash", "/Author": "Ünïcode 日本"})
+    with open(pdf_path, "wb") as f:
+        writer.write(f)
+
+    reader = PdfReader(pdf_path)
+    expected = {k[1:]: v for k, v in reader.metadata.items()}
+    expected["Pages"] = len(reader.pages)
+    assert _fast_pdf_info(pdf_path) == expected
+
+    # Append an update that replaces the Info dictionary
+    with open(pdf_path, "rb") as f:
+        data = f.read()
+    prev = int(data.rsplit(b"startxref", 1)[1].split()[0])
+    size = int(reader.trailer["/Size"])
+    root = reader.trailer.raw_get("/Root")
+    obj = b"%d 0 obj\n<< /Title <FEFF00480069> /Author (line\\\ncontinued\\101) >>\nendobj\n" % size
+    xref = b"xref\n%d 1\n%010d 00000 n \ntrailer\n<< /Size %d /Root %s /Info %d 0 R /Prev %d >>\n" % (
+        size, len(data), size + 1, f"{root.idnum} {root.generation} R".encode(), size, prev)
+    with open(pdf_path, "ab") as f:
+        f.write(obj + xref + b"startxref\n%d\n%%%%EOF\n" % (len(data) + len(obj)))
+
+    assert _fast_pdf_info(pdf_path) == {"Title": "Hi", "Author": "linecontinuedA", "Pages": 5}
+
+
+def test_extract_pdf_metadata_falls_back_to_pdf_reader(temp_dir, monkeypatch):
+    """Test that PDFs the fast path can't read still go through PdfReader."""
+    import extractor as extractor_module
+
+    pdf_path = os.path.join(temp_dir, "sample.pdf")
+    writer = PdfWriter()
+    writer.add_blank_page(width=72, height=72)
+    writer.add_metadata({"/Title": "Fallback"})
+    with open(pdf_path, "wb") as f:
+        writer.write(f)
+
+    monkeypatch.setattr(extractor_module, "_fast_pdf_info", lambda path: None)
+    meta = MetadataExtractor().extract_pdf_metadata(pdf_path)
+    assert meta["Title"] == "Fallback"
+    assert meta["Pages"] == 1
+
+    broken = os.path.join(temp_dir, "broken.pdf")
+    with open(broken, "wb") as f:
+        f.write(b"%PDF-1.4\nstartxref\n9999\n%%EOF\n")
+    assert extractor_module._fast_pdf_info(broken) is None
+    assert extractor_module._fast_pdf_info(os.path.join(temp_dir, "empty.pdf")) is None
+
+
+def test_extract_pdf_metadata_uses_pdfium_when_available(temp_dir, monkeypatch):
+    """Test that the optional PDFium backend is tried before PdfReader."""
+    import extractor as extractor_module
+
+    class FakeDocument:
+        closed = False
+
+        def __init__(self, path):
+            self.path = path
+
+        def get_metadata_dict(self, skip_empty=False):
+            return {"Title": "From PDFium"}
+
+        def __len__(self):
+            return 7
+
+        def close(self):
+            FakeDocument.closed = True
+
+    pdf_path = os.path.join(temp_dir, "sample.pdf")
+    with open(pdf_path, "wb") as f:
+        f.write(b"%PDF-1.7\n")
+
+    monkeypatch.setattr(extractor_module, "_fast_pdf_info", lambda path: None)
+    monkeypatch.setattr(extractor_module, "pdfium", type("pdfium", (), {"PdfDocument": FakeDocument}))
+    meta = MetadataExtractor().extract_pdf_metadata(pdf_path)
+
+    assert meta == {"Title": "From PDFium", "Pages": 7}
+    assert FakeDocument.closed
+
+
+def test_extract_stats_each_file_once(temp_dir, monkeypatch):
+    """Test that extract() validates, keys the cache and sizes a text file from one stat."""
+    import extractor as extractor_module
+
+    path = os.path.join(temp_dir, "notes.txt")
+    with open(path, "w") as f:
+        f.write("one\ntwo\n")
+
+    calls = []
+    real_stat = os.stat
+    monkeypatch.setattr(extractor_module.os, "stat", lambda p, *a, **k: calls.append(p) or real_stat(p, *a, **k))
+    meta = MetadataExtractor(db_client=DummyDB()).extract(path)
+
+    assert meta["File Size (bytes)"] == 8
+    assert meta["Line Count"] == 2
+    assert calls == [path]
+
+
+def test_extract_dispatches_on_extension(temp_dir, monkeypatch):
+    """Test that the extension table routes files without consulting mimetypes per call."""
+    import extractor as extractor_module
+
+    monkeypatch.setattr(extractor_module.mimetypes, "guess_type", lambda *a, **k: pytest.fail("guess_type called"))
+    header = os.path.join(temp_dir, "module.H")
+    with open(header, "w") as f:
+        f.write("int x;\n")
+
+    meta = MetadataExtractor(db_client=DummyDB()).extract(header)
+    assert meta["Line Count"] == 1
+    assert extractor_module._EXT_HANDLERS[".pdf"] == "_pdf_metadata"
+
+
+def test_extract_hachoir_matches_plaintext_export(temp_dir):
+    """Test that hachoir items keep the keys and values the plaintext export produced."""
+    import zipfile
+    from hachoir.metadata import extractMetadata
+    from hachoir.parser import createParser
+
+    archive = os.path.join(temp_dir, "bundle.zip")
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("a.txt", "hello")
+        zf.writestr("b.txt", "world" * 10)
+
+    parser = createParser(archive)
+    with parser:
+        expected = {}
+        for line in extractMetadata(parser).exportPlaintext():
+            if ": " in line:
+                key, value = line.split(": ", 1)
+                expected[key.strip()] = value.strip()
+
+    meta = MetadataExtractor(db_client=DummyDB()).extract(archive)
+    assert meta == expected
+    assert meta["- File name"] == "b.txt"
+
+
+def test_batch_extract_stores_on_writer_thread(temp_dir):
+    """Test that inserts run off the extraction thread and failures are still reported."""
+    import threading
+
+    class ThreadDB(DummyDB):
+        def __init__(self):
+            super().__init__()
+            self.threads = set()
+
+        def insert_metadata(self, file_path, metadata):
+            self.threads.add(threading.get_ident())
+            if file_path.endswith("bad.txt"):
+                raise RuntimeError("disk full")
+            return super().insert_metadata(file_path, metadata)
+
+    paths = []
+    for name in ("a.txt", "bad.txt", "c.txt"):
+        path = os.path.join(temp_dir, name)
+        with open(path, "w") as f:
+            f.write("x\n")
+        paths.append(path)
+
+    db_client = ThreadDB()
+    result = MetadataExtractor(db_client=db_client).batch_extract(paths, max_workers=1)
+
+    assert threading.get_ident() not in db_client.threads
+    assert (result["successful"], result["failed"]) == (2, 1)
+    assert result["results"][1] == {"file_path": paths[1], "status": "failed", "error": "disk full"}
+
+
+def test_batch_extract_commits_rows_in_batches(temp_dir):
+    """Test that queued results are stored with insert_metadata_many, with a per-row retry."""
+    class ManyDB(DummyDB):
+        def __init__(self):
+            super().__init__()
+            self.batches = []
+
+        def insert_metadata_many(self, items):
+            items = list(items)
+            if any(path.endswith("bad.txt") for path, _ in items):
+                raise RuntimeError("constraint failed")
+            self.batches.append(len(items))
+            return [self.insert_metadata(path, meta) for path, meta in items]
+
+        def insert_metadata(self, file_path, metadata):
+            if file_path.endswith("bad.txt"):
+                raise RuntimeError("constraint failed")
+            return super().insert_metadata(file_path, metadata)
+
+    paths = []
+    for i in range(6):
+        path = os.path.join(temp_dir, f"file{i}.txt")
+        with open(path, "w") as f:
+            f.write("x\n")
+        paths.append(path)
+
+    db_client = ManyDB()
+    extractor_obj = MetadataExtractor(db_client=db_client)
+    extractor_obj.WRITE_BATCH_SIZE = 4
+    # Fill the queue before the writer wakes up so it sees full batches
+    extractor_obj._store_pending = functools.partial(_drain_after_fill, extractor_obj._store_pending)
+    result = extractor_obj.batch_extract(paths, max_workers=1)
+    assert result["successful"] == 6
+    assert db_client.batches == [4, 2]
+
+    bad = os.path.join(temp_dir, "bad.txt")
+    with open(bad, "w") as f:
+        f.write("x\n")
+    result = extractor_obj.batch_extract([paths[0], bad], max_workers=1)
+    assert [r["status"] for r in result["results"]] == ["success", "failed"]
+    assert result["results"][1]["error"] == "constraint failed"
+
+
+def test_batch_extract_keeps_draining_when_db_client_fails(temp_dir, monkeypatch):
+    """Test that a failing database client fails its items without stalling the batch."""
+    def broken_client(self):
+        raise RuntimeError("database unavailable")
+
+    monkeypatch.setattr(MetadataExtractor, "db_client", property(broken_client))
+    paths = []
+    for i in range(6):
+        path = os.path.join(temp_dir, f"file{i}.txt")
+        with open(path, "w") as f:
+            f.write("x\n")
+        paths.append(path)
+
+    extractor_obj = MetadataExtractor()
+    extractor_obj.WRITE_QUEUE_SIZE = 1
+    extractor_obj.WRITE_BATCH_SIZE = 2
+    result = extractor_obj.batch_extract(paths, max_workers=1)
+    assert result["failed"] == 6
+    assert {r["error"] for r in result["results"]} == {"database unavailable"}
+
+
+def _drain_after_fill(store, pending, results):
+    """Run the writer stage only once the extraction loop has queued everything."""
+    import time
+    while not pending.queue or pending.queue[-1] is not None:
+        time.sleep(0.001)
+    store(pending, results)
+
+
+def test_batch_extract_streams_generator_input(temp_dir, monkeypatch):
+    """Test that generator input is extracted before it is exhausted and progress counts files."""
+    paths = []
+    for i in range(MetadataExtractor.READAHEAD_FILES + 4):
+        path = os.path.join(temp_dir, f"file{i}.txt")
+        with open(path, "w") as f:
+            f.write("x\n")
+        paths.append(path)
+
+    events = []
+
+    def walk():
+        for path in paths:
+            events.append("yield")
+            yield path
+
+    extractor_obj = MetadataExtractor(db_client=DummyDB())
+    original = extractor_obj.extract
+    monkeypatch.setattr(extractor_obj, "extract", lambda p: events.append("extract") or original(p))
+    progress = []
+    result = extractor_obj.batch_extract(walk(), progress_callback=lambda msg, value: progress.append(value),
+                                         max_workers=1)
+
+    assert result["total"] == len(paths)
+    assert result["successful"] == len(paths)
+    assert [r["file_path"] for r in result["results"]] == paths
+    assert events.index("extract") < len(events) - 1 - events[::-1].index("yield")
+    assert progress[:3] == [0, 1, 2]
+
+
+def test_batch_extract_pool_with_generator_input(temp_dir):
+    """Test that the process pool path accepts unsized input and keeps input order."""
+    paths = []
+    for i in range(MetadataExtractor.PARALLEL_MIN_FILES + 5):
+        path = os.path.join(temp_dir, f"file{i}.txt")
+        with open(path, "w") as f:
+            f.write("x\n" * (i + 1))
+        paths.append(path)
+
+    result = MetadataExtractor(db_client=DummyDB()).batch_extract(iter(paths), max_workers=2, total=len(paths))
+
+    assert result["successful"] == len(paths)
+    assert [r["file_path"] for r in result["results"]] == paths
+
+
+def test_pdf_reader_fallback_reads_through_mmap(temp_dir, monkeypatch):
+    """Test that the PdfReader fallback is handed a memory map, and empty files still error."""
+    import mmap
+    import extractor as extractor_module
+
+    pdf_path = os.path.join(temp_dir, "sample.pdf")
+    writer = PdfWriter()
+    writer.add_blank_page(width=72, height=72)
+    writer.add_blank_page(width=72, height=72)
+    writer.add_metadata({"/Author": "Mapped"})
+    with open(pdf_path, "wb") as f:
+        writer.write(f)
+
+    streams = []
+    real_reader = extractor_module.PdfReader
+    monkeypatch.setattr(extractor_module, "PdfReader", lambda stream: streams.append(type(stream)) or real_reader(stream))
+    monkeypatch.setattr(extractor_module, "_fast_pdf_info", lambda path: None)
+    monkeypatch.setattr(extractor_module, "pdfium", None)
+
+    meta = MetadataExtractor().extract_pdf_metadata(pdf_path)
+    assert meta["Author"] == "Mapped"
+    assert meta["Pages"] == 2
+    assert streams == [mmap.mmap]
+
+    empty = os.path.join(temp_dir, "empty.pdf")
+    open(empty, "wb").close()
+    assert "Error" in MetadataExtractor().extract_pdf_metadata(empty)
+
+
+def test_extract_skips_hachoir_for_unknown_extensions(temp_dir, monkeypatch):
+    """Test that extensions no hachoir parser handles fail fast without creating a parser."""
+    import extractor as extractor_module
+
+    path = os.path.join(temp_dir, "data.unknownext")
+    with open(path, "wb") as f:
+        f.write(b"\x00" * 64)
+    monkeypatch.setattr(extractor_module, "createParser", lambda p: pytest.fail("createParser called"))
+
+    meta = MetadataExtractor(db_client=DummyDB()).extract(path)
+    assert meta == {"Error": "Unsupported file type: .unknownext"}
+    assert {".mp3", ".jpg", ".zip"} <= extractor_module._hachoir_exts()
+
+
+def test_extract_sniffs_unlisted_extension_with_known_signature(temp_dir):
+    """Test that a zip saved as .docx is still parsed by hachoir from its content."""
+    import zipfile
+    import extractor as extractor_module
+
+    assert ".docx" not in extractor_module._hachoir_exts()
+    path = os.path.join(temp_dir, "report.docx")
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("word/document.xml", "<w:document/>")
+
+    meta = MetadataExtractor(db_client=DummyDB()).extract(path)
+    assert "Error" not in meta
+    assert meta["- MIME type"] == "application/zip"
+
+
+def test_worker_init_replaces_module_extractor(monkeypatch):
+    """Test that pool workers start from a fresh extractor without the parent's DB client."""
+    import extractor as extractor_module
+
+    parent = MetadataExtractor(db_client=DummyDB())
+    monkeypatch.setattr(extractor_module, "_extractor", parent)
+    extractor_module._worker_init()
+
+    assert extractor_module._extractor is not parent
+    assert extractor_module._extractor._db_client is None
+
+
+def test_extract_hachoir_closes_parser_stream(temp_dir, monkeypatch):
+    """Test that the hachoir input stream is closed as soon as extraction finishes."""
+    import zipfile
+    import extractor as extractor_module
+
+    archive = os.path.join(temp_dir, "bundle.zip")
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("a.txt", "hello")
+
+    parsers = []
+    real_create = extractor_module.createParser
+    monkeypatch.setattr(extractor_module, "createParser", lambda p: parsers.append(real_create(p)) or parsers[-1])
+
+    meta = MetadataExtractor(db_client=DummyDB()).extract(archive)
+    assert meta["- File name"] == "a.txt"
+    assert parsers[0].stream._input.closed
+
+
+def test_extract_file_type_hint_skips_detection(temp_dir, monkeypatch):
+    """Test that a file_type hint picks the extractor regardless of extension."""
+    path = os.path.join(temp_dir, "build.log.1")
+    with open(path, "w") as f:
+        f.write("a\nb\nc\n")
+
+    extractor_obj = MetadataExtractor(db_client=DummyDB())
+    monkeypatch.setattr(extractor_obj, "_extract_uncached", lambda p, st: pytest.fail("type detection ran"))
+
+    assert extractor_obj.extract(path, file_type="text")["Line Count"] == 3
+    assert extractor_obj.extract(path, file_type="spreadsheet") == {"Error": "Unknown file type: spreadsheet"}
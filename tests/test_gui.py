@@ -8,7 +8,7 @@ if str(SRC_PATH) not in sys.path:
     sys.path.insert(0, str(SRC_PATH))
 
 import pytest
-from gui import MetadataAnalyzerApp
+from gui import MetadataAnalyzerApp, _build_preview_pyramid, _integer_zoom_step, _pick_mipmap
 
 
 @pytest.fixture
@@ -142,3 +142,283 @@ def test_app_zoom_attributes(app):
 def test_metadata_Analyzer_app_init():
     """Backward compatibility wrapper. See test_metadata_analyzer_app_init for details."""
     test_metadata_analyzer_app_init()
+
+
+def test_humanize_formats_and_memoizes():
+    """Test that History timestamps are formatted once per distinct value."""
+    from gui import _humanize
+
+    _humanize.cache_clear()
+    assert _humanize("2024-01-05T15:07:00") == "Jan 05, 2024 03:07 PM"
+    assert _humanize("2024-01-05T15:07:00") == "Jan 05, 2024 03:07 PM"
+    assert _humanize("not a date") == "not a date"
+    assert _humanize("") == ""
+    assert _humanize.cache_info().hits == 1
+
+
+def test_submit_db_delivers_result_on_main_loop(app):
+    """Test that background DB calls hand their future back through root.after."""
+    app.root = mock.Mock()
+    app.root.after.side_effect = lambda delay, callback: callback()
+    results = []
+
+    future = app._submit_db(lambda a, b=0: a + b, 2, b=3, on_done=results.append)
+    future.result(timeout=5)
+    app._db_executor.shutdown(wait=True)
+
+    assert len(results) == 1
+    assert results[0] is future
+    assert results[0].result() == 5
+    app.root.after.assert_called_once()
+
+
+def test_preview_pyramid_and_mipmap_choice():
+    """Test that zoom renders from the smallest mipmap covering the target."""
+    from PIL import Image
+
+    img = Image.new("RGB", (1600, 800))
+    pyramid = _build_preview_pyramid(img)
+
+    assert [level.size for level in pyramid] == [(1600, 800), (800, 400), (400, 200), (200, 100)]
+    assert _pick_mipmap(pyramid, (120, 60)).size == (200, 100)
+    assert _pick_mipmap(pyramid, (500, 250)).size == (800, 400)
+    assert _pick_mipmap(pyramid, (3200, 1600)) is img
+
+
+def test_populate_editor_fields_reuses_pooled_rows(app):
+    """Test that editor rows are reused instead of rebuilt between records."""
+    new_widget = lambda *args, **kwargs: mock.Mock()
+    app.editor_entry_frame = mock.Mock()
+    with mock.patch('gui.Frame', side_effect=new_widget) as frame_cls, \
+            mock.patch('gui.Label', side_effect=new_widget), \
+            mock.patch('gui.ttk.Entry', side_effect=new_widget), \
+            mock.patch.object(app, '_font'):
+        app._populate_editor_fields({"Author": "a", "Title": "b", "File Name": "c"})
+        assert frame_cls.call_count == 3
+        third_frame = app._editor_row_pool[2][0]
+
+        app._populate_editor_fields({"Author": "x", "Subject": "y"})
+        assert frame_cls.call_count == 3
+        third_frame.pack_forget.assert_called_once()
+        assert list(app.editor_entry_fields) == ["Author", "Subject"]
+        app._editor_row_pool[1][1].config.assert_called_with(text="Subject:")
+        app._editor_row_pool[1][2].insert.assert_called_with(0, "y")
+
+        app._populate_editor_fields({"A": 1, "B": 2, "C": 3})
+        assert frame_cls.call_count == 3
+        assert third_frame.pack.call_count == 2
+
+        app._clear_editor_fields()
+        assert app.editor_entry_fields == {}
+        assert app._editor_rows_shown == 0
+
+
+def test_set_status_coalesces_until_idle(app):
+    """Test that status updates made before the next idle point collapse into one."""
+    app.root = mock.Mock()
+    with mock.patch.object(app, 'status_var') as mock_var:
+        app.set_status("first")
+        app.set_status("second")
+        app.set_status("third")
+
+        app.root.after_idle.assert_called_once()
+        mock_var.set.assert_not_called()
+
+        flush = app.root.after_idle.call_args[0][0]
+        flush()
+        mock_var.set.assert_called_once_with("third")
+
+
+def test_cached_history_query_reuses_until_write_or_ttl(app):
+    """Test that History query results are reused until a write or the TTL expires."""
+    calls = []
+
+    def query(term, limit=None):
+        calls.append((term, limit))
+        return [term]
+
+    with mock.patch('gui.db') as mock_db, mock.patch('gui.time.monotonic') as clock:
+        mock_db.db_manager.write_version = 1
+        clock.return_value = 100.0
+        assert app._cached_history_query(query, "a", limit=5) == ["a"]
+        assert app._cached_history_query(query, "a", limit=5) == ["a"]
+        assert app._cached_history_query(query, "a", limit=6) == ["a"]
+        assert len(calls) == 2
+
+        mock_db.db_manager.write_version = 2
+        app._cached_history_query(query, "a", limit=5)
+        assert len(calls) == 3
+
+        clock.return_value = 100.0 + app.HISTORY_CACHE_SECONDS
+        app._cached_history_query(query, "a", limit=5)
+        assert len(calls) == 4
+
+
+def test_cached_history_query_skips_results_raced_by_a_write(app):
+    """Test that a result is not cached when a write lands while its query runs."""
+    with mock.patch('gui.db') as mock_db:
+        mock_db.db_manager.write_version = 1
+
+        def query():
+            mock_db.db_manager.write_version += 1  # Concurrent commit
+            return ["stale"]
+
+        assert app._cached_history_query(query) == ["stale"]
+        assert not app._history_cache
+
+
+def test_integer_zoom_step():
+    """Test detection of zoom factors Tk can scale natively."""
+    assert _integer_zoom_step(2.0000000001) == ("zoom", 2)
+    assert _integer_zoom_step(3.0) == ("zoom", 3)
+    assert _integer_zoom_step(0.5) == ("subsample", 2)
+    assert _integer_zoom_step(1 / 3) == ("subsample", 3)
+    assert _integer_zoom_step(1.0) is None
+    assert _integer_zoom_step(1.2) is None
+    assert _integer_zoom_step(0.4) is None
+
+
+def test_display_extracted_metadata_uses_single_insert(app):
+    """Test that the metadata report is written with one tagged Text.insert call."""
+    app.c1_text = mock.Mock()
+    app._display_extracted_metadata({"Author": "Ann", "Pages": 3}, "/tmp/doc.pdf", None)
+
+    app.c1_text.insert.assert_called_once()
+    args = app.c1_text.insert.call_args[0]
+    assert args[1:] == (
+        "Extracted Metadata\n", "header",
+        "File: doc.pdf\n\n", "bold",
+        "Author: ", "bold", "Ann\n", "",
+        "Pages: ", "bold", "3\n", "",
+    )
+
+
+def test_display_extracted_metadata_skips_identical_redraw(app):
+    """Test that showing the same metadata twice only writes the widget once."""
+    app.c1_text = mock.Mock()
+    app.c1_text.get.return_value = "Extracted Metadata"
+    app._display_extracted_metadata({"Author": "Ann"}, "/tmp/doc.pdf", None)
+    app._display_extracted_metadata({"Author": "Ann"}, "/tmp/doc.pdf", None)
+    assert app.c1_text.insert.call_count == 1
+
+    app._display_extracted_metadata({"Author": "Bob"}, "/tmp/doc.pdf", None)
+    assert app.c1_text.insert.call_count == 2
+
+
+def test_canvas_configure_debounces_centering(app):
+    """Test that a burst of canvas resize events re-centers the image once."""
+    app.root = mock.Mock()
+    app.root.after.side_effect = ["after#1", "after#2", "after#3"]
+    with mock.patch.object(app, '_do_center_canvas') as center:
+        for _ in range(3):
+            app._on_canvas_configure()
+        center.assert_not_called()
+
+    assert app.root.after.call_count == 3
+    assert app.root.after_cancel.call_args_list == [mock.call("after#1"), mock.call("after#2")]
+    assert app._canvas_cfg_after_id == "after#3"
+
+
+def test_update_report_preview_drops_stale_renders(app):
+    """Test that only the latest background preview render reaches the UI."""
+    app.report_preview = mock.Mock()
+    submitted = []
+
+    def fake_submit(func, text, dpi, on_done=None):
+        future = mock.Mock()
+        future.result.return_value = None  # No image -> text fallback
+        submitted.append((future, on_done))
+        return future
+
+    with mock.patch.object(app, '_submit_preview', side_effect=fake_submit), \
+            mock.patch('gui.convert_from_path', mock.Mock()):
+        app.update_report_preview("first report")
+        app.update_report_preview("second report")
+
+    (old_future, old_done), (new_future, new_done) = submitted
+    old_done(old_future)
+    app.report_preview.insert.assert_not_called()
+
+    new_done(new_future)
+    app.report_preview.insert.assert_called_once_with(mock.ANY, "second report")
+
+
+def test_render_report_image_caches_pages_by_text(app, tmp_path):
+    """Test that previewing the same report text again skips the PDF render."""
+    page = object()
+    convert = mock.Mock(return_value=[page])
+    with mock.patch('gui.convert_from_path', convert), \
+            mock.patch('gui.tempfile.gettempdir', return_value=str(tmp_path)), \
+            mock.patch('gui.report.create_pdf_report_from_text') as create_pdf:
+        assert app._render_report_image("report A") is page
+        assert app._render_report_image("report A") is page
+        assert create_pdf.call_count == 1
+        assert convert.call_count == 1
+
+        app._render_report_image("report B")
+        assert create_pdf.call_count == 2
+
+
+def test_preview_render_dpi_fits_largest_zoom(app):
+    """Test that preview pages are rasterized only as finely as the view needs."""
+    app.window_width, app.window_height = 1180, 750
+    # A4 page fitted into 900x600 is limited by height: 600 / 11.69in ~ 51 DPI
+    assert app._preview_render_dpi() == 103
+    app.window_width, app.window_height = 4000, 3000
+    assert app._preview_render_dpi() == app.PREVIEW_MAX_DPI
+
+
+def test_apply_image_zoom_reuses_revisited_level(app):
+    """Test that returning to a zoom level reuses its smooth render."""
+    from PIL import Image
+    app.preview_base_image = Image.new("RGB", (400, 300))
+    with mock.patch('PIL.ImageTk.PhotoImage', side_effect=lambda img: mock.Mock()) as photo:
+        app.preview_image_zoom = 1.4
+        app._apply_image_zoom(final=True)
+        app.preview_image_zoom = 0.6
+        app._apply_image_zoom(final=True)
+        app.preview_image_zoom = 1.4
+        app._apply_image_zoom(final=True)
+    assert photo.call_count == 2
+    assert app._base_scale_ratio == 1.0
+
+
+def test_menu_export_results_json_same_layout_with_or_without_orjson(app, tmp_path):
+    """Test that JSON exports are byte-identical whether or not orjson is installed."""
+    app.extracted_metadata = {"Author": "Zoë", "Pages": 3, "Tags": ["a", "b"]}
+    expected = '{\n  "Author": "Zoë",\n  "Pages": 3,\n  "Tags": [\n    "a",\n    "b"\n  ]\n}'.encode("utf-8")
+    target = tmp_path / "meta.json"
+    try:
+        import orjson as real_orjson
+    except ImportError:
+        real_orjson = None
+    if real_orjson is None:
+        # Stand-in producing orjson's documented OPT_INDENT_2 output
+        import json
+        real_orjson = mock.Mock(OPT_INDENT_2=1, OPT_NON_STR_KEYS=2)
+        real_orjson.dumps.side_effect = lambda obj, option=0: json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+    with mock.patch('gui.filedialog.asksaveasfilename', return_value=str(target)), \
+            mock.patch('gui.messagebox'), mock.patch.object(app, 'set_status'):
+        with mock.patch('gui.orjson', real_orjson):
+            app.menu_export_results()
+        assert target.read_bytes() == expected
+
+        with mock.patch('gui.orjson', None):
+            app.menu_export_results()
+        assert target.read_bytes() == expected
+
+
+def test_refresh_history_only_when_history_tab_is_shown(app):
+    """Test that database writes only reload History while it is on screen."""
+    app.history_refresh = mock.Mock()
+    app.nb_widget = mock.Mock()
+    app.tab3_ref = ".nb.history"
+
+    app.nb_widget.select.return_value = ".nb.extractor"
+    app._refresh_history_if_visible()
+    app.history_refresh.assert_not_called()
+
+    app.nb_widget.select.return_value = ".nb.history"
+    app._refresh_history_if_visible()
+    app.history_refresh.assert_called_once_with()
@@ -291,3 +291,32 @@ def test_export_to_pdf(sample_dataframe):
         with mock.patch('tkinter.messagebox.showinfo'):
             # Test that export methods work without raising
             assert callable(reporter.export_to_pdf)
+
+
+def test_export_to_csv_accepts_iterator(temp_dir):
+    """Test exporting to CSV from a lazy row iterator."""
+    reporter = MetadataReporter()
+    csv_file = os.path.join(temp_dir, "stream.csv")
+    data = iter([
+        (1, '/path/file1.txt', 'file1.txt', '1 KB', 'txt', '2024-01-01', None, '{"a": 1}'),
+    ])
+
+    import unittest.mock as mock
+    with mock.patch('tkinter.filedialog.asksaveasfilename', return_value=csv_file):
+        with mock.patch('tkinter.messagebox.showinfo'):
+            reporter.export_to_csv(data)
+
+    df = pd.read_csv(csv_file)
+    assert list(df.columns)[0] == 'ID'
+    assert df.iloc[0]['File Name'] == 'file1.txt'
+    assert df.iloc[0]['Full Metadata'] == '{"a": 1}'
+
+
+def test_export_to_csv_empty_iterator():
+    """Test that an empty iterator shows the no-data warning."""
+    reporter = MetadataReporter()
+
+    import unittest.mock as mock
+    with mock.patch('tkinter.messagebox.showwarning') as mock_warning:
+        reporter.export_to_csv(iter([]))
+        mock_warning.assert_called_once()